@@ -1,32 +1,153 @@
 # =========================
 # well_scraper/api_main.py
 # =========================
-from fastapi import FastAPI, Depends, HTTPException
-from typing import Optional
-from shapely.geometry import Point, Polygon
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import FastAPI, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+import base64
+import binascii
+import math
+import os
+import time
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+from well_scraper import exporters, geo, metrics, tiles
+from well_scraper.api_numbers import InvalidApiNumber, normalize_api
 from well_scraper.database import WellDatabase
 from well_scraper.models import WellRecord
+from well_scraper.read_pool import ReadConnectionPool, PoolTimeout
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 logger = logging.getLogger("API")
 
+# Database settings, overridable through the environment
+DB_PATH = os.environ.get("WELL_DB_PATH", "data/sqlite.db")
+DB_POOL_SIZE = int(os.environ.get("WELL_DB_POOL_SIZE", "8"))
+# Separate connections for building /tiles clusters, so slow cold tiles
+# never take connections from the other endpoints
+TILE_DB_POOL_SIZE = int(os.environ.get("WELL_TILE_DB_POOL_SIZE", "2"))
+# Sent with every cacheable response, e.g. "public, max-age=60" to let a
+# reverse proxy serve repeat polls without revalidating
+CACHE_CONTROL = os.environ.get("WELL_CACHE_CONTROL", "no-cache")
+# Most API numbers accepted by one batch lookup
+MAX_BATCH_APIS = 5000
+# Default and largest page of POST /polygon results
+POLYGON_PAGE_SIZE = 1000
+MAX_POLYGON_PAGE_SIZE = 10000
+# Default and largest page of /wells/search results
+SEARCH_PAGE_SIZE = 100
+MAX_SEARCH_PAGE_SIZE = 1000
+# Most results from the full-text /search
+MAX_TEXT_RESULTS = 100
+# Widest /near radius and most wells /near and /nearest return
+MAX_NEAR_RADIUS_M = 200_000
+MAX_NEAR_RESULTS = 10000
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ensure the schema once at startup, then serve every request from a pool
+    of read-only connections that lives as long as the app.
+    """
+    WellDatabase(DB_PATH).close()
+    app.state.db_pool = ReadConnectionPool(DB_PATH, size=DB_POOL_SIZE)
+    app.state.tile_pool = ReadConnectionPool(DB_PATH, size=TILE_DB_POOL_SIZE)
+    app.state.tile_cache = tiles.TileCache()
+    try:
+        yield
+    finally:
+        app.state.db_pool.close()
+        app.state.tile_pool.close()
+
+
 # FastAPI app
 app = FastAPI(
     title="NM Oil & Gas Well API",
     description="Retrieve New Mexico well data by API number",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# Dependency: get a database instance
-def get_db() -> WellDatabase:
-    db_path = "data/sqlite.db"
-    db = WellDatabase(db_path)
-    return db
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """
+    Observe every request in the per-route latency histogram. Routes are
+    labelled by their path template, so /well/{api_number} is one series.
+    """
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    metrics.HTTP_REQUEST_SECONDS.observe(
+        time.perf_counter() - start,
+        route=route.path if route else "unmatched",
+        method=request.method,
+        status=response.status_code,
+    )
+    return response
+
+
+# Dependency: borrow a read-only database connection for one request.
+# Async so that waiting for a free connection happens on the event loop
+# rather than in the threadpool the sync endpoints need.
+async def get_db(request: Request):
+    pool = request.app.state.db_pool
+    try:
+        db = await pool.acquire_async()
+    except PoolTimeout as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    try:
+        yield db
+    finally:
+        pool.release_async(db)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison, as If-None-Match requires
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+
+
+def not_modified(request: Request, response: Response, db: WellDatabase) -> Optional[Response]:
+    """
+    Set ETag, Last-Modified and Cache-Control from the database's content
+    version and answer conditional requests.
+
+    Returns:
+        Response: A 304 to return as-is when the client's copy is current,
+        otherwise None and the validators are set on ``response``.
+    """
+    version, updated_at = db.content_version()
+    last_modified = datetime.fromisoformat(updated_at)
+    headers = {
+        "ETag": f'"{version}"',
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        try:
+            fresh = last_modified.replace(microsecond=0) <= parsedate_to_datetime(request.headers["if-modified-since"])
+        except (KeyError, TypeError, ValueError):
+            fresh = False
+
+    return Response(status_code=304, headers=headers) if fresh else None
+
 
 @app.get("/well/{api_number}", response_model=WellRecord)
-def get_well(api_number: str, db: WellDatabase = Depends(get_db)):
+def get_well(api_number: str, request: Request, response: Response, db: WellDatabase = Depends(get_db)):
     """
     Retrieve well data by API number.
 
@@ -37,6 +158,15 @@ def get_well(api_number: str, db: WellDatabase = Depends(get_db)):
     Returns:
         WellRecord: The well data
     """
+    try:
+        api_number = normalize_api(api_number)
+    except InvalidApiNumber as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    cached = not_modified(request, response, db)
+    if cached:
+        return cached
+
     logger.info(f"Fetching well data for API: {api_number}")
     cursor = db.conn.cursor()
     cursor.execute("SELECT * FROM api_well_data WHERE API = ?", (api_number,))
@@ -49,11 +179,192 @@ def get_well(api_number: str, db: WellDatabase = Depends(get_db)):
     # Map the row to WellRecord
     columns = [description[0] for description in cursor.description]
     record_dict = dict(zip(columns, row))
-    logger.info(f"Well data retrieved for API: {api_number}\n Well data: {record_dict}\n")
+    logger.debug(f"Well data retrieved for API: {api_number}\n Well data: {record_dict}\n")
     return WellRecord(**record_dict)
 
+class WellBatchRequest(BaseModel):
+    apis: List[str] = Field(..., max_length=MAX_BATCH_APIS)
+
+
+class WellBatchResponse(BaseModel):
+    wells: List[WellRecord]
+    missing: List[str]
+    invalid: List[str] = []
+
+
+def _lookup_wells(apis: List[str], db: WellDatabase) -> WellBatchResponse:
+    requested, invalid = [], []
+    for api in apis:
+        try:
+            requested.append(normalize_api(api))
+        except InvalidApiNumber:
+            invalid.append(api)
+    requested = list(dict.fromkeys(requested))
+
+    found = db.get_many(requested)
+    missing = [api for api in requested if api not in found]
+    logger.info(f"Batch lookup: {len(found)} of {len(requested)} wells found, {len(invalid)} invalid")
+    return WellBatchResponse(
+        wells=[found[api] for api in requested if api in found],
+        missing=missing,
+        invalid=invalid,
+    )
+
+
+@app.post("/wells", response_model=WellBatchResponse)
+def post_wells(batch: WellBatchRequest, db: WellDatabase = Depends(get_db)):
+    """
+    Retrieve many wells at once.
+
+    Args:
+        batch (WellBatchRequest): {"apis": [...]}, at most MAX_BATCH_APIS entries
+
+    Returns:
+        WellBatchResponse: Found wells in request order and the APIs that were not found
+    """
+    return _lookup_wells(batch.apis, db)
+
+
+@app.get("/wells", response_model=WellBatchResponse)
+def get_wells(
+    request: Request,
+    response: Response,
+    api: List[str] = Query(..., max_length=MAX_BATCH_APIS),
+    db: WellDatabase = Depends(get_db),
+):
+    """
+    GET form of the batch lookup: /wells?api=30-015-25325&api=30-015-25327
+    """
+    cached = not_modified(request, response, db)
+    if cached:
+        return cached
+    return _lookup_wells(api, db)
+
+
+class WellSearchPage(BaseModel):
+    wells: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+@app.get("/wells/search", response_model=WellSearchPage, response_model_exclude_none=True)
+def search_wells(
+    request: Request,
+    response: Response,
+    operator: Optional[str] = None,
+    status: Optional[str] = None,
+    well_type: Optional[str] = None,
+    work_type: Optional[str] = None,
+    spud_from: Optional[date] = None,
+    spud_to: Optional[date] = None,
+    tvd_min: Optional[float] = None,
+    tvd_max: Optional[float] = None,
+    bbox: Optional[str] = None,
+    columns: Optional[str] = None,
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=MAX_SEARCH_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: WellDatabase = Depends(get_db),
+):
+    """
+    Search wells by attributes, one page at a time, ordered by API.
+
+    Args:
+        operator, status, well_type, work_type (str): Exact values to match.
+        spud_from, spud_to (date): Inclusive Spud_Date range, YYYY-MM-DD.
+        tvd_min, tvd_max (float): Inclusive TVD range.
+        bbox (str): "min_lat,min_lon,max_lat,max_lon".
+        columns (str): Comma-separated columns to include; API is always included.
+        limit (int): Page size.
+        cursor (str): ``next_cursor`` from the previous page.
+
+    Returns:
+        WellSearchPage: Matching wells and, unless this is the last page, ``next_cursor``
+    """
+    selected = [c.strip() for c in columns.split(",") if c.strip()] if columns else list(WellDatabase.COLUMNS)
+    if "API" not in selected:
+        selected.insert(0, "API")
+    unknown = [c for c in selected if c not in WellDatabase.COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown columns: {', '.join(unknown)}")
+
+    filters = {
+        column: value
+        for column, value in zip(WellDatabase.SEARCH_COLUMNS, (operator, status, well_type, work_type))
+        if value is not None
+    }
+    bounds = _parse_bbox(bbox) if bbox else None
+    after = decode_cursor(cursor) if cursor else ""
+
+    cached = not_modified(request, response, db)
+    if cached:
+        return cached
+
+    rows = db.search_wells(
+        selected,
+        filters,
+        spud_date=(spud_from and spud_from.isoformat(), spud_to and spud_to.isoformat()),
+        tvd=(tvd_min, tvd_max),
+        bbox=bounds,
+        after=after,
+        limit=limit + 1,
+    )
+    page = [dict(zip(selected, row)) for row in rows[:limit]]
+    next_cursor = encode_cursor(page[-1]["API"]) if len(rows) > limit else None
+    logger.info(f"Well search {filters} returned {len(page)} wells, more: {next_cursor is not None}")
+    return WellSearchPage(wells=page, next_cursor=next_cursor)
+
+
+class TextSearchResult(BaseModel):
+    API: str
+    Operator: Optional[str] = None
+    Surface_Location: Optional[str] = None
+    Mineral_Owner: Optional[str] = None
+    Surface_Owner: Optional[str] = None
+    score: float
+
+
+class TextSearchResults(BaseModel):
+    wells: List[TextSearchResult]
+
+
+@app.get("/search", response_model=TextSearchResults)
+def search_text(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=MAX_TEXT_RESULTS),
+    db: WellDatabase = Depends(get_db),
+):
+    """
+    Full-text search over Operator, Surface_Location, Mineral_Owner and
+    Surface_Owner, best matches first. Every word must match the start of
+    a word in some indexed column, so "EOG res" finds EOG RESOURCES INC.
+
+    Args:
+        q (str): Search text.
+        limit (int): Most wells to return.
+
+    Returns:
+        TextSearchResults: Matching wells with their relevance score
+    """
+    try:
+        query = WellDatabase.text_query(q)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    cached = not_modified(request, response, db)
+    if cached:
+        return cached
+
+    columns = ["API", *WellDatabase.TEXT_COLUMNS]
+    rows = db.search_text(q, columns, limit)
+    logger.info(f"Text search {query!r} returned {len(rows)} wells")
+    return TextSearchResults(wells=[
+        TextSearchResult(**dict(zip(columns, row[:-1])), score=row[-1]) for row in rows
+    ])
+
+
 @app.get("/polygon")
-def get_apis_in_polygon(coords: str, db: WellDatabase = Depends(get_db)):
+def get_apis_in_polygon(coords: str, request: Request, response: Response, db: WellDatabase = Depends(get_db)):
     """
     GET endpoint for retrieving APIs inside a polygon.
     
@@ -84,19 +395,467 @@ def get_apis_in_polygon(coords: str, db: WellDatabase = Depends(get_db)):
     except Exception:
         raise HTTPException(status_code=400, detail="Unable to construct polygon from provided coordinates")
 
+    cached = not_modified(request, response, db)
+    if cached:
+        return cached
 
+    # Narrow to the polygon's bounding box with the R*Tree, then test the
+    # candidates exactly in one vectorized call (x = latitude, y = longitude)
+    min_lat, min_lon, max_lat, max_lon = polygon.bounds
     cursor = db.conn.cursor()
-    cursor.execute("SELECT API, Latitude, Longitude FROM api_well_data")
+    cursor.execute(
+        f"""
+        SELECT w.API, w.Latitude, w.Longitude
+        FROM {WellDatabase.SPATIAL_INDEX_TABLE_NAME} r
+        JOIN {WellDatabase.TABLE_NAME} w ON w.rowid = r.id
+        WHERE r.max_lat >= ? AND r.min_lat <= ? AND r.max_lon >= ? AND r.min_lon <= ?
+        """,
+        (min_lat, max_lat, min_lon, max_lon),
+    )
+    rows = cursor.fetchall()
+
     result = []
-    for api, lat, lon in cursor.fetchall():
-        if lat is None or lon is None:
-            continue
-        if polygon.contains(Point(lat, lon)):
-            result.append(api)
+    if rows:
+        apis, lats, lons = zip(*rows)
+        shapely.prepare(polygon)
+        mask = shapely.contains_xy(polygon, np.asarray(lats, dtype=float), np.asarray(lons, dtype=float))
+        result = [api for api, inside in zip(apis, mask) if inside]
 
-    logger.info(f"Found {len(result)} APIs within polygon\n apis: {result}")
+    logger.info(f"Found {len(result)} APIs within polygon ({len(rows)} bounding box candidates)")
+    logger.debug(f"apis: {result}")
     return {"apis": result}
 
+class PolygonQuery(BaseModel):
+    geometry: Dict[str, Any]
+    limit: int = Field(POLYGON_PAGE_SIZE, ge=1, le=MAX_POLYGON_PAGE_SIZE)
+    cursor: Optional[str] = None
+    fields: Optional[List[str]] = None
+
+
+class PolygonPage(BaseModel):
+    apis: List[str]
+    wells: Optional[List[Dict[str, Any]]] = None
+    next_cursor: Optional[str] = None
+
+
+def _geojson_ring(ring):
+    # GeoJSON positions are [lon, lat(, elevation)]; shapely here uses x = latitude
+    return [(position[1], position[0]) for position in ring]
+
+
+def _geojson_polygon(rings):
+    if not rings:
+        raise ValueError("a polygon needs an exterior ring")
+    return Polygon(_geojson_ring(rings[0]), [_geojson_ring(ring) for ring in rings[1:]])
+
+
+def geojson_geometry(geometry: dict):
+    """
+    Build a shapely Polygon or MultiPolygon, in (lat, lon) order, from a
+    GeoJSON Polygon, MultiPolygon or a Feature holding one. Interior rings
+    are kept as holes.
+
+    Raises:
+        HTTPException: 400 if the geometry is not a valid (Multi)Polygon.
+    """
+    if geometry.get("type") == "Feature":
+        geometry = geometry.get("geometry") or {}
+
+    kind = geometry.get("type")
+    if kind not in ("Polygon", "MultiPolygon"):
+        raise HTTPException(status_code=400, detail="geometry must be a GeoJSON Polygon or MultiPolygon")
+
+    try:
+        coordinates = geometry["coordinates"]
+        if kind == "Polygon":
+            shape = _geojson_polygon(coordinates)
+        else:
+            shape = MultiPolygon([_geojson_polygon(rings) for rings in coordinates])
+    except Exception:
+        raise HTTPException(status_code=400, detail=f"Unable to construct {kind} from the provided coordinates")
+
+    if shape.is_empty or not shape.is_valid:
+        raise HTTPException(status_code=400, detail="Invalid polygon geometry")
+    return shape
+
+
+def encode_cursor(api: str) -> str:
+    return base64.urlsafe_b64encode(api.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Return the last API of the previous page from an opaque cursor.
+
+    The API is not normalized: rows stored under legacy, non-canonical keys
+    end pages too, and paging only needs the key to compare against.
+
+    Raises:
+        HTTPException: 400 if the cursor does not decode to a key.
+    """
+    try:
+        api = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        if api:
+            return api
+    except (binascii.Error, UnicodeDecodeError):
+        pass
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# A MultiPolygon's parts are looked up in the R*Tree one box each, up to
+# this many; beyond that a single box around the whole shape is cheaper
+MAX_BBOX_PARTS = 32
+
+
+def _candidate_boxes(shape):
+    parts = list(shape.geoms) if isinstance(shape, MultiPolygon) else [shape]
+    if len(parts) > MAX_BBOX_PARTS:
+        parts = [shape]
+    return [part.bounds for part in parts]
+
+
+def _polygon_candidates(db: WellDatabase, boxes, select, after: str, limit: int):
+    """
+    Return a cursor over wells inside ``boxes`` with an API after ``after``, ordered by API.
+
+    Few candidates are fetched from the R*Tree and sorted. When the boxes
+    hold so many wells that sorting them all would cost more than walking
+    the API index until a page is found, the walk is used instead: with C of
+    N rows in the boxes, a page of ``limit`` costs about C row reads
+    sorted, or limit * N / C walked.
+    """
+    params = [value for min_lat, min_lon, max_lat, max_lon in boxes for value in (min_lat, max_lat, min_lon, max_lon)]
+    candidates = " UNION ".join(
+        f"SELECT id FROM {WellDatabase.SPATIAL_INDEX_TABLE_NAME} "
+        "WHERE max_lat >= ? AND min_lat <= ? AND max_lon >= ? AND min_lon <= ?"
+        for _ in boxes
+    )
+
+    rows = db.conn.execute(f"SELECT max(rowid) FROM {WellDatabase.TABLE_NAME}").fetchone()[0] or 0
+    threshold = math.isqrt((limit + 1) * rows)
+    # Counting stops at the threshold, so the estimate itself stays cheap
+    count = db.conn.execute(f"SELECT count(*) FROM ({candidates} LIMIT ?)", params + [threshold + 1]).fetchone()[0]
+
+    if count <= threshold:
+        where = f"rowid IN ({candidates})"
+    else:
+        where = "(" + " OR ".join("(Latitude BETWEEN ? AND ? AND Longitude BETWEEN ? AND ?)" for _ in boxes) + ")"
+    return db.conn.execute(
+        f"""
+        SELECT {", ".join(select)}
+        FROM {WellDatabase.TABLE_NAME}
+        WHERE {where} AND API > ?
+        ORDER BY API
+        """,
+        params + [after],
+    )
+
+
+@app.post("/polygon", response_model=PolygonPage, response_model_exclude_none=True)
+def post_polygon(query: PolygonQuery, db: WellDatabase = Depends(get_db)):
+    """
+    Page through the wells inside a GeoJSON Polygon or MultiPolygon.
+
+    Wells come back ordered by API. Pass the returned ``next_cursor`` to get
+    the next page; it is absent on the last one. Keyset paging on API means
+    pages stay consistent while the scraper writes new wells.
+
+    Args:
+        query (PolygonQuery): GeoJSON geometry ([lon, lat] positions, holes
+            allowed), page ``limit``, ``cursor`` from the previous page and
+            optional well ``fields`` to return alongside each API.
+
+    Returns:
+        PolygonPage: ``apis``, ``wells`` when fields were requested, and ``next_cursor``
+    """
+    shape = geojson_geometry(query.geometry)
+    after = decode_cursor(query.cursor) if query.cursor else ""
+
+    fields = list(dict.fromkeys(query.fields or []))
+    unknown = [field for field in fields if field not in WellDatabase.COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    select = ["API", "Latitude", "Longitude"] + [field for field in fields if field not in ("API", "Latitude", "Longitude")]
+    cursor = _polygon_candidates(db, _candidate_boxes(shape), select, after, query.limit)
+
+    # Test candidates a batch at a time and stop once one match past the page is found
+    shapely.prepare(shape)
+    matches = []
+    for rows in exporters.iter_batches(cursor, max(query.limit, 1000)):
+        columns = list(zip(*rows))
+        mask = shapely.contains_xy(shape, np.asarray(columns[1], dtype=float), np.asarray(columns[2], dtype=float))
+        matches.extend(row for row, inside in zip(rows, mask) if inside)
+        if len(matches) > query.limit:
+            break
+    cursor.close()
+
+    page = matches[:query.limit]
+    next_cursor = encode_cursor(page[-1][0]) if len(matches) > query.limit else None
+    logger.info(f"POST /polygon: {len(page)} APIs on this page, more: {next_cursor is not None}")
+
+    wells = None
+    if fields:
+        positions = [select.index(field) for field in fields]
+        wells = [{field: row[i] for field, i in zip(fields, positions)} for row in page]
+    return PolygonPage(apis=[row[0] for row in page], wells=wells, next_cursor=next_cursor)
+
+
+class NearbyWell(BaseModel):
+    API: str
+    Latitude: float
+    Longitude: float
+    distance_m: float
+
+
+class NearbyWells(BaseModel):
+    wells: List[NearbyWell]
+
+
+def _wells_within(db: WellDatabase, lat: float, lon: float, radius_m: float):
+    # R*Tree box around the circle, then exact great-circle distances
+    cursor = db.select_wells(["API", "Latitude", "Longitude"], bbox=geo.bbox_around(lat, lon, radius_m))
+    rows = cursor.fetchall()
+    if not rows:
+        return rows, np.empty(0)
+    _, lats, lons = zip(*rows)
+    return rows, geo.haversine_m(lat, lon, lats, lons)
+
+
+def _closest(rows, distances, radius_m: float, limit: int) -> NearbyWells:
+    # Nearest first, ties broken by API so results are stable
+    order = np.lexsort((np.asarray([row[0] for row in rows], dtype=str), distances))
+    order = order[distances[order] <= radius_m][:limit]
+    return NearbyWells(wells=[
+        NearbyWell(API=rows[i][0], Latitude=rows[i][1], Longitude=rows[i][2], distance_m=round(float(distances[i]), 1))
+        for i in order
+    ])
+
+
+@app.get("/near", response_model=NearbyWells)
+def get_wells_near(
+    request: Request,
+    response: Response,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_m: float = Query(..., gt=0, le=MAX_NEAR_RADIUS_M),
+    limit: int = Query(1000, ge=1, le=MAX_NEAR_RESULTS),
+    db: WellDatabase = Depends(get_db),
+):
+    """
+    Wells within ``radius_m`` meters (great-circle) of a point, nearest first.
+
+    Args:
+        lat (float): Latitude of the center.
+        lon (float): Longitude of the center.
+        radius_m (float): Search radius in meters, at most MAX_NEAR_RADIUS_M.
+        limit (int): Most wells to return; the closest are kept.
+
+    Returns:
+        NearbyWells: API, location and distance of each well
+    """
+    cached = not_modified(request, response, db)
+    if cached:
+        return cached
+
+    rows, distances = _wells_within(db, lat, lon, radius_m)
+    result = _closest(rows, distances, radius_m, limit)
+    logger.info(f"Found {len(result.wells)} wells within {radius_m} m of {lat},{lon} ({len(rows)} bounding box candidates)")
+    return result
+
+
+# /nearest starts from this radius and widens until it holds k wells
+NEAREST_START_RADIUS_M = 2000
+# Half the Earth's circumference; a box this wide covers the whole table
+_FARTHEST_M = geo.EARTH_RADIUS_M * np.pi
+
+
+@app.get("/nearest", response_model=NearbyWells)
+def get_nearest_wells(
+    request: Request,
+    response: Response,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    k: int = Query(10, ge=1, le=MAX_NEAR_RESULTS),
+    db: WellDatabase = Depends(get_db),
+):
+    """
+    The ``k`` wells nearest a point by great-circle distance, nearest first.
+
+    Searches a growing circle: once a box holds k candidates, the k-th
+    closest of them bounds the answer, so at most one more query is needed.
+
+    Args:
+        lat (float): Latitude of the point.
+        lon (float): Longitude of the point.
+        k (int): Number of wells to return.
+
+    Returns:
+        NearbyWells: API, location and distance of each well
+    """
+    cached = not_modified(request, response, db)
+    if cached:
+        return cached
+
+    radius_m = NEAREST_START_RADIUS_M
+    while True:
+        rows, distances = _wells_within(db, lat, lon, radius_m)
+        if np.count_nonzero(distances <= radius_m) >= k or radius_m >= _FARTHEST_M:
+            break
+        if len(rows) >= k:
+            radius_m = float(np.partition(distances, k - 1)[k - 1])
+        else:
+            radius_m *= 4
+        radius_m = min(radius_m, _FARTHEST_M)
+
+    result = _closest(rows, distances, radius_m, k)
+    logger.info(f"Found {len(result.wells)} nearest wells to {lat},{lon} within {radius_m:.0f} m")
+    return result
+
+
+@app.get("/tiles/{z}/{x}/{y}")
+def get_tile(
+    request: Request,
+    response: Response,
+    z: int = Path(..., ge=0, le=tiles.MAX_ZOOM),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+):
+    """
+    Wells in a Web Mercator map tile, for web maps.
+
+    Up to zoom tiles.CLUSTER_MAX_ZOOM the tile holds clusters: an 8x8 grid
+    of cells keyed by quadkey with a count, mean position and counts by
+    Status and Well_Type. Beyond it, the tile lists individual wells.
+
+    A cold low-zoom tile can take seconds to build, so instead of holding
+    a connection for the whole request this endpoint borrows one from its
+    own pool (WELL_TILE_DB_POOL_SIZE) around each read. Requests waiting
+    for a tile someone else is building hold no connection at all.
+
+    Args:
+        z (int): Zoom level.
+        x (int): Tile column.
+        y (int): Tile row.
+    """
+    if x >= 2 ** z or y >= 2 ** z:
+        raise HTTPException(status_code=400, detail=f"Tile {z}/{x}/{y} does not exist")
+
+    pool = request.app.state.tile_pool
+    try:
+        with pool.connection() as db:
+            cached = not_modified(request, response, db)
+        if cached:
+            return cached
+
+        if z <= tiles.CLUSTER_MAX_ZOOM:
+            return request.app.state.tile_cache.clusters(pool.connection, z, x, y)
+
+        columns = ["API", "Latitude", "Longitude", "Status", "Well_Type"]
+        with pool.connection() as db:
+            rows = db.select_wells(columns, bbox=tiles.tile_bounds(z, x, y)).fetchall()
+    except PoolTimeout as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    if rows:
+        xs, ys = tiles.tile_xy([row[1] for row in rows], [row[2] for row in rows], z)
+        # Wells on a shared edge belong to one tile only
+        rows = [row for row, tile_x, tile_y in zip(rows, xs.tolist(), ys.tolist()) if (tile_x, tile_y) == (x, y)]
+    wells = [dict(zip(columns, row)) for row in sorted(rows)]
+    return {"z": z, "x": x, "y": y, "count": len(wells), "wells": wells}
+
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+
+def _parse_bbox(bbox: str):
+    try:
+        values = [float(v) for v in bbox.split(",")]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be numeric values")
+    if len(values) != 4:
+        raise HTTPException(status_code=400, detail="bbox must be min_lat,min_lon,max_lat,max_lon")
+    return values
+
+
+@app.get("/export")
+def export_wells(
+    request: Request,
+    format: str = "csv",
+    columns: Optional[str] = None,
+    operator: Optional[str] = None,
+    status: Optional[str] = None,
+    well_type: Optional[str] = None,
+    bbox: Optional[str] = None,
+    batch_size: int = 10000,
+):
+    """
+    Stream well data straight from a database cursor.
+
+    Args:
+        format (str): csv, json, ndjson, parquet or arrow.
+        columns (str): Comma-separated columns to include, defaults to all.
+        operator, status, well_type (str): Exact-match filters.
+        bbox (str): min_lat,min_lon,max_lat,max_lon.
+        batch_size (int): Rows fetched per batch.
+    """
+    format = format.lower()
+    if format not in exporters.EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(exporters.EXPORT_FORMATS)}")
+    if format in exporters.COLUMNAR_FORMATS and exporters.pyarrow is None:
+        raise HTTPException(status_code=501, detail=f"{format} export requires pyarrow on the server")
+    if not 1 <= batch_size <= 100000:
+        raise HTTPException(status_code=400, detail="batch_size must be between 1 and 100000")
+
+    selected = [c.strip() for c in columns.split(",") if c.strip()] if columns else list(WellDatabase.COLUMNS)
+    unknown = [c for c in selected if c not in WellDatabase.COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown columns: {', '.join(unknown)}")
+
+    filters = {
+        column: value
+        for column, value in (("Operator", operator), ("Status", status), ("Well_Type", well_type))
+        if value is not None
+    }
+    bounds = _parse_bbox(bbox) if bbox else None
+
+    def stream():
+        # A dedicated connection, so long exports never hold a pooled one
+        db = WellDatabase(DB_PATH, read_only=True)
+        try:
+            batches = exporters.iter_batches(db.select_wells(selected, filters, bounds), batch_size)
+            if format in exporters.COLUMNAR_FORMATS:
+                schema = exporters.arrow_schema(db.column_types(selected))
+                yield from exporters.columnar_chunks(format, schema, batches)
+            else:
+                yield from exporters.TEXT_CHUNKS[format](selected, batches)
+        finally:
+            db.close()
+
+    body = stream()
+    headers = {"Content-Disposition": f'attachment; filename="wells.{format}"'}
+    # Parquet is already compressed
+    if format != "parquet" and "gzip" in request.headers.get("accept-encoding", ""):
+        body = exporters.gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+
+    logger.info(f"Exporting wells as {format} (columns={selected}, filters={filters}, bbox={bounds})")
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """
+    Prometheus metrics in the text exposition format.
+    """
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.Registry.CONTENT_TYPE)
+
 @app.get("/health")
 def health_check():
     """
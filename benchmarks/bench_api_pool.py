@@ -0,0 +1,78 @@
+# ===============================
+# benchmarks/bench_api_pool.py
+# ===============================
+"""
+Load test: per-request WellDatabase (the old get_db) vs the lifespan-managed
+read-only connection pool.
+
+Usage:
+    python -m benchmarks.bench_api_pool --wells 10000 --requests 2000 --concurrency 16
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import api_main
+from well_scraper.database import WellDatabase
+from well_scraper.models import WellRecord
+from .load import run_load
+
+
+def build_database(path, wells, seed=0):
+    rng = random.Random(seed)
+    db = WellDatabase(path)
+    db.insert_many([
+        WellRecord(
+            API=f"30-015-{i:05d}",
+            Operator=f"Operator {i % 500}",
+            Latitude=rng.uniform(31.8, 33.0),
+            Longitude=rng.uniform(-104.9, -103.6),
+        )
+        for i in range(wells)
+    ])
+    db.close()
+    return [f"/well/30-015-{i:05d}" for i in rng.sample(range(wells), min(wells, 500))]
+
+
+def legacy_get_db():
+    # What get_db did before the pool: a fresh connection and schema check per request
+    return WellDatabase(api_main.DB_PATH)
+
+
+async def measure(urls, total, concurrency, pooled):
+    if pooled:
+        async with api_main.lifespan(api_main.app):
+            return await run_load(api_main.app, urls, total, concurrency)
+
+    api_main.app.dependency_overrides[api_main.get_db] = legacy_get_db
+    try:
+        return await run_load(api_main.app, urls, total, concurrency)
+    finally:
+        api_main.app.dependency_overrides.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /well latency with and without the read pool.")
+    parser.add_argument("--wells", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api_main.DB_PATH = os.path.join(tmp, "bench.db")
+        urls = build_database(api_main.DB_PATH, args.wells)
+
+        for label, pooled in (("per-request connection", False), ("read-only pool", True)):
+            result = asyncio.run(measure(urls, args.requests, args.concurrency, pooled))
+            print(
+                f"{label:>24}: p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, "
+                f"{result['requests_per_sec']:.0f} req/s, errors {result['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
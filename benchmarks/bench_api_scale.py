@@ -0,0 +1,169 @@
+# ===============================
+# benchmarks/bench_api_scale.py
+# ===============================
+"""
+API latency as api_well_data grows: /health, /well/{api_number} and
+/polygon against synthetic statewide databases of increasing size, with
+polygons of several sizes and vertex counts.
+
+Databases are built with benchmarks.wells.fill_database; pass --db_dir to
+keep them between runs, since a million wells takes a few minutes to build.
+
+Usage:
+    python -m benchmarks.bench_api_scale --sizes 10000 100000 1000000 --concurrency 1 16
+    python -m benchmarks.bench_api_scale --sizes 100000 --radii 0.05 0.5 --vertices 4 64 --output api_scale.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import tempfile
+from datetime import datetime, timezone
+import httpx
+import api_main
+from well_scraper.database import WellDatabase
+from .load import git_revision, run_load
+from .wells import fill_database
+
+# Southeast New Mexico, where the wells are densest
+POLYGON_CENTER = (32.5, -103.8)
+
+
+def open_database(db_dir, rows, seed=0):
+    """
+    Return the path of a database holding ``rows`` synthetic wells, building it if needed.
+    """
+    path = os.path.join(db_dir, f"wells_{rows}.db")
+    db = WellDatabase(path)
+    try:
+        existing = db.conn.execute(f"SELECT COUNT(*) FROM {db.TABLE_NAME}").fetchone()[0]
+        if existing != rows:
+            db.conn.execute(f"DELETE FROM {db.TABLE_NAME}")
+            db.conn.commit()
+            print(f"Building {rows} wells in {path} ...", flush=True)
+            fill_database(db, rows, seed)
+    finally:
+        db.close()
+    return path
+
+
+def sample_apis(path, count, seed=0):
+    db = WellDatabase(path, read_only=True)
+    try:
+        max_rowid = db.conn.execute(f"SELECT MAX(rowid) FROM {db.TABLE_NAME}").fetchone()[0]
+        rowids = random.Random(seed).sample(range(1, max_rowid + 1), min(count, max_rowid))
+        placeholders = ",".join("?" * len(rowids))
+        return [
+            api for (api,) in db.conn.execute(
+                f"SELECT API FROM {db.TABLE_NAME} WHERE rowid IN ({placeholders})", rowids
+            )
+        ]
+    finally:
+        db.close()
+
+
+def polygon_coords(radius, vertices, center=POLYGON_CENTER):
+    """
+    The ``coords`` query value for a regular polygon of ``vertices`` points around ``center``.
+    """
+    lat, lon = center
+    points = []
+    for i in range(vertices):
+        angle = 2 * math.pi * i / vertices
+        points.append(f"{lat + radius * math.sin(angle):.6f},{lon + radius * math.cos(angle):.6f}")
+    return ",".join(points)
+
+
+def report_line(result):
+    label = result["endpoint"]
+    if label == "/polygon":
+        label += f" r={result['radius']} v={result['vertices']} ({result['matches']} wells)"
+    print(
+        f"{result['rows']:>8} rows  {label:<42} c={result['concurrency']:<3} "
+        f"p50 {result['p50_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  "
+        f"{result['requests_per_sec']:7.0f} req/s  errors {result['errors']}",
+        flush=True,
+    )
+
+
+async def measure(rows, scenarios, total, concurrencies):
+    results = []
+    async with api_main.lifespan(api_main.app):
+        transport = httpx.ASGITransport(app=api_main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for scenario in scenarios:
+                # One warm-up request, which also records how many wells a polygon returns
+                resp = await client.get(scenario["urls"][0])
+                if scenario["endpoint"] == "/polygon":
+                    scenario["matches"] = len(resp.json()["apis"])
+
+        for scenario in scenarios:
+            info = {key: value for key, value in scenario.items() if key != "urls"}
+            for concurrency in concurrencies:
+                result = await run_load(api_main.app, scenario["urls"], total, concurrency)
+                result = {"rows": rows, **info, "concurrency": concurrency, **result}
+                report_line(result)
+                results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API latency against synthetic statewide databases.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000], help="Row counts")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1], help="Requests in flight, e.g. 1 16")
+    parser.add_argument("--radii", type=float, nargs="+", default=[0.02, 0.2, 1.0], help="Polygon radii in degrees")
+    parser.add_argument("--vertices", type=int, nargs="+", default=[4, 32, 256], help="Polygon vertex counts")
+    parser.add_argument("--db_dir", help="Directory to keep generated databases in (default: temporary)")
+    parser.add_argument("--output", default="bench_api_scale.json")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_dir = args.db_dir or tmp
+        os.makedirs(db_dir, exist_ok=True)
+
+        for rows in args.sizes:
+            api_main.DB_PATH = open_database(db_dir, rows)
+            scenarios = [
+                {"endpoint": "/health", "urls": ["/health"]},
+                {"endpoint": "/well", "urls": [f"/well/{api}" for api in sample_apis(api_main.DB_PATH, 500)]},
+            ]
+            scenarios += [
+                {
+                    "endpoint": "/polygon",
+                    "radius": radius,
+                    "vertices": vertices,
+                    "urls": [f"/polygon?coords={polygon_coords(radius, vertices)}"],
+                }
+                for radius in args.radii
+                for vertices in args.vertices
+            ]
+
+            results += asyncio.run(measure(rows, scenarios, args.requests, args.concurrency))
+
+    report = {
+        "benchmark": "api_scale",
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "config": {
+            "sizes": args.sizes,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "radii": args.radii,
+            "vertices": args.vertices,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
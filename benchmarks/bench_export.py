@@ -0,0 +1,86 @@
+# ============================
+# benchmarks/bench_export.py
+# ============================
+"""
+Export benchmark: the original fetchall-based CSV/JSON export vs the
+streaming exporters, reporting time, peak Python memory and output size.
+
+Usage:
+    python -m benchmarks.bench_export --wells 200000
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from well_scraper import exporters
+from well_scraper.database import WellDatabase
+from .wells import synthetic_records
+
+
+def legacy_export(db, output_path, format="csv"):
+    """
+    The original export_data: fetchall, and for JSON a second query into a pretty-printed list.
+    """
+    cursor = db.conn.cursor()
+    cursor.execute(f"SELECT * FROM {db.TABLE_NAME}")
+    rows = cursor.fetchall()
+
+    if format == "csv":
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(db.COLUMNS)
+            writer.writerows(rows)
+    else:
+        cursor = db.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(f"SELECT * FROM {db.TABLE_NAME}")
+        data = [dict(row) for row in cursor.fetchall()]
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+
+def measure(func, output_path):
+    start = time.perf_counter()
+    func(output_path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(output_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return elapsed, peak, os.path.getsize(output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark well data exports.")
+    parser.add_argument("--wells", type=int, default=200000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = WellDatabase(os.path.join(tmp, "bench.db"))
+        db.insert_many(synthetic_records(args.wells))
+
+        cases = [
+            ("legacy csv", lambda path: legacy_export(db, path, "csv")),
+            ("legacy json", lambda path: legacy_export(db, path, "json")),
+        ]
+        formats = exporters.EXPORT_FORMATS if exporters.pyarrow else exporters.TEXT_FORMATS
+        cases += [(f"stream {fmt}", lambda path, fmt=fmt: db.export_data(path, fmt)) for fmt in formats]
+
+        print(f"{args.wells} wells")
+        for label, func in cases:
+            elapsed, peak, size = measure(func, os.path.join(tmp, label.replace(" ", ".")))
+            print(f"{label:>14}: {elapsed:6.2f} s, peak {peak / 1024 ** 2:7.1f} MiB, output {size / 1024 ** 2:7.1f} MiB")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# ================================
+# benchmarks/bench_extraction.py
+# ================================
+"""
+Micro-benchmark: single-pass FieldExtractor vs the original BeautifulSoup
+span-by-span lookup.
+
+Usage:
+    python -m benchmarks.bench_extraction                       # synthetic page
+    python -m benchmarks.bench_extraction saved/*.html -n 200    # saved WellDetails pages
+"""
+import argparse
+import statistics
+import time
+from bs4 import BeautifulSoup
+from well_scraper.constants import WellFields
+from well_scraper.extraction import extract_fields
+from .pages import render_well_page
+
+
+def extract_fields_bs4(html, field_ids=None):
+    """
+    The original extraction: one soup.find per field, stripping nested tags.
+    """
+    field_ids = field_ids or WellFields.FIELD_IDS
+    soup = BeautifulSoup(html, "html.parser")
+    result = {}
+    for field, span_id in field_ids.items():
+        span = soup.find("span", id=span_id)
+        if not span:
+            result[field] = None
+            continue
+        for tag in span.find_all():
+            tag.extract()
+        result[field] = span.get_text(strip=True) or None
+    return result
+
+
+def time_per_call(func, html, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func(html)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WellDetails field extraction.")
+    parser.add_argument("pages", nargs="*", help="Saved WellDetails HTML pages (default: synthetic page)")
+    parser.add_argument("-n", "--iterations", type=int, default=50, help="Iterations per page")
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = []
+        for path in args.pages:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                pages.append((path, f.read()))
+    else:
+        pages = [("synthetic", render_well_page())]
+
+    for name, html in pages:
+        if extract_fields(html) != extract_fields_bs4(html):
+            print(f"{name}: WARNING results differ between implementations")
+
+        legacy = time_per_call(extract_fields_bs4, html, args.iterations)
+        single_pass = time_per_call(extract_fields, html, args.iterations)
+        print(
+            f"{name} ({len(html) / 1024:.0f} KiB): "
+            f"bs4 {legacy * 1000:.2f} ms, single-pass {single_pass * 1000:.2f} ms, "
+            f"speedup {legacy / single_pass:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# =============================
+# benchmarks/bench_scraper.py
+# =============================
+"""
+End-to-end scraper throughput against a local FakeWellServer.
+
+Every scenario runs ScraperApp in a fresh subprocess (so peak RSS is per
+scenario) against the same fake server, and results are written to JSON
+so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.bench_scraper --wells 500 --threads 1 4 8 16 --output bench_scraper.json
+    python -m benchmarks.bench_scraper --rate_limit_ratio 0.05 --latency 0.1 --jitter 0.05 --async
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from .fake_server import FakeWellServer
+from .load import git_revision, percentile
+
+
+def run_scenario(args):
+    """
+    Child process: scrape the CSV once and print a JSON result line.
+    """
+    from well_scraper.app import ScraperApp
+    from well_scraper.async_scraper import AsyncWellScraper
+    from well_scraper.well_scraper import WellScraper
+
+    WellScraper.BASE_URL = AsyncWellScraper.BASE_URL = args.base_url
+    latencies = []
+
+    class TimedApp(ScraperApp):
+        def _process_api(self, api):
+            start = time.perf_counter()
+            super()._process_api(api)
+            latencies.append(time.perf_counter() - start)
+
+        async def _process_api_async(self, scraper, api):
+            start = time.perf_counter()
+            await super()._process_api_async(scraper, api)
+            latencies.append(time.perf_counter() - start)
+
+    logging.disable(logging.CRITICAL)
+    app = TimedApp(
+        args.csv,
+        os.path.join(args.workdir, f"{args.scenario}.db"),
+        multithread=args.scenario_threads > 1,
+        threads=args.scenario_threads,
+        use_async=args.scenario == "async",
+        max_concurrency=args.max_concurrency,
+        initial_rate=args.max_rate,
+        max_rate=args.max_rate,
+        parse_workers=args.parse_workers,
+    )
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        app.run()
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "scenario": args.scenario,
+        "threads": args.scenario_threads,
+        "wells": app.inserted,
+        "errors": app.errors,
+        "elapsed_s": elapsed,
+        "wells_per_sec": app.inserted / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "rate_limit_hits": app.governor.stats()["rate_limit_hits"],
+    }
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ScraperApp throughput against a local fake site.")
+    parser.add_argument("--wells", type=int, default=500)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 8, 16], help="1 means sequential mode")
+    parser.add_argument("--async", dest="include_async", action="store_true", help="Also run the async scraper")
+    parser.add_argument("--max_concurrency", type=int, default=64, help="Async in-flight cap")
+    parser.add_argument("--parse_workers", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate_limit_ratio", type=float, default=0.0)
+    parser.add_argument("--max_rate", type=float, default=10000, help="Request rate the governor starts at and may reach")
+    parser.add_argument("--output", default="bench_scraper.json")
+    # Internal: run one scenario in this process
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    parser.add_argument("--scenario_threads", type=int, default=1, help=argparse.SUPPRESS)
+    parser.add_argument("--base_url", help=argparse.SUPPRESS)
+    parser.add_argument("--csv", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        run_scenario(args)
+        return
+
+    scenarios = [("sequential" if n == 1 else "multithread", n) for n in args.threads]
+    if args.include_async:
+        scenarios.append(("async", 1))
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir, FakeWellServer(
+        latency=args.latency, jitter=args.jitter, rate_limit_ratio=args.rate_limit_ratio
+    ) as server:
+        csv_path = os.path.join(workdir, "apis.csv")
+        with open(csv_path, "w") as f:
+            f.write("api\n" + "".join(f"30-015-{i:05d}\n" for i in range(args.wells)))
+
+        for scenario, threads in scenarios:
+            command = [
+                sys.executable, "-m", "benchmarks.bench_scraper",
+                "--scenario", scenario, "--scenario_threads", str(threads),
+                "--base_url", server.base_url, "--csv", csv_path, "--workdir", workdir,
+                "--max_concurrency", str(args.max_concurrency), "--parse_workers", str(args.parse_workers),
+                "--max_rate", str(args.max_rate),
+            ]
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            results.append(result)
+            print(
+                f"{scenario:>11} x{threads:<3}: {result['wells_per_sec']:8.1f} wells/s, "
+                f"p50 {result['p50_ms']:7.1f} ms, p99 {result['p99_ms']:7.1f} ms, "
+                f"peak RSS {result['peak_rss_mb']:6.1f} MB, errors {result['errors']}, "
+                f"rate limited {result['rate_limit_hits']}"
+            )
+
+    report = {
+        "benchmark": "scraper_throughput",
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "config": {
+            "wells": args.wells,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "rate_limit_ratio": args.rate_limit_ratio,
+            "max_rate": args.max_rate,
+            "parse_workers": args.parse_workers,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# ===========================
+# benchmarks/fake_server.py
+# ===========================
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from well_scraper.well_scraper import WellScraper
+from .pages import SAMPLE_VALUES, render_well_page
+
+RATE_LIMIT_PAGE = (
+    "<!DOCTYPE html><html><head><title>Site Busy</title></head>"
+    f"<body><h1>{WellScraper.RATE_LIMIT_TEXT}</h1><p>Please try again later.</p></body></html>"
+).encode("utf-8")
+
+
+class FakeWellServer:
+    """
+    Local stand-in for WellDetails.aspx.
+
+    Serves realistic pages carrying the real WellFields.FIELD_IDS spans,
+    with a configurable per-request latency and jitter, and answers a
+    fraction of requests with the site's rate limit page. Use it as a
+    context manager and point scrapers at ``base_url``.
+    """
+
+    def __init__(self, latency=0.05, jitter=0.02, rate_limit_ratio=0.0, variants=32, filler_rows=400, seed=0):
+        """
+        Initialize the FakeWellServer.
+
+        Args:
+            latency (float): Mean seconds before each response.
+            jitter (float): Uniform +/- seconds added to the latency.
+            rate_limit_ratio (float): Fraction of requests answered with the rate limit page.
+            variants (int): Distinct pages pre-rendered and served round robin by API.
+            filler_rows (int): Unrelated table rows per page, see render_well_page.
+            seed (int): Seed for page content, latency and rate limiting.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+        # Rendering is slow, so pages are built once up front
+        self.pages = [
+            render_well_page(self._values(i), filler_rows=filler_rows, seed=seed + i).encode("utf-8")
+            for i in range(variants)
+        ]
+
+        self.requests = 0
+        self.rate_limited = 0
+        self.server = None
+
+    def _values(self, i):
+        rng = random.Random(i)
+        values = dict(SAMPLE_VALUES)
+        values["Coordinates"] = f"{rng.uniform(31.8, 36.9):.6f},{rng.uniform(-108.9, -103.1):.6f} NAD83"
+        values["TVD"] = str(rng.randint(2000, 13000))
+        return values
+
+    def _respond(self, handler):
+        api = parse_qs(urlparse(handler.path).query).get("api", [""])[0]
+
+        with self.rng_lock:
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            limited = self.rng.random() < self.rate_limit_ratio
+            self.requests += 1
+            self.rate_limited += limited
+        time.sleep(delay)
+
+        body = RATE_LIMIT_PAGE if limited else self.pages[zlib.crc32(api.encode()) % len(self.pages)]
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_port}/WellDetails.aspx?api={{}}"
+
+    def __enter__(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real site
+
+            def do_GET(self):
+                fake._respond(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="FakeWellServer", daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,87 @@
+# =====================
+# benchmarks/load.py
+# =====================
+import asyncio
+import statistics
+import subprocess
+import time
+import httpx
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile of a list of samples.
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def git_revision():
+    """
+    Short hash of the checked-out commit, recorded with benchmark results.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(latencies, elapsed, errors=0):
+    """
+    Latency percentiles (milliseconds) and throughput for one scenario.
+    """
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p90_ms": percentile(latencies, 90) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "requests_per_sec": len(latencies) / elapsed if elapsed else None,
+    }
+
+
+async def run_load(app, urls, total=1000, concurrency=1, method="GET", json_bodies=None):
+    """
+    Drive an ASGI app in-process and measure per-request latency.
+
+    Args:
+        app: ASGI application.
+        urls (list): URLs to request, cycled through in order.
+        total (int): Number of requests to send.
+        concurrency (int): Number of requests kept in flight.
+        method (str): HTTP method.
+        json_bodies (list): Optional JSON bodies, cycled alongside urls.
+
+    Returns:
+        dict: Output of summarize().
+    """
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            nonlocal errors
+            for i in counter:
+                kwargs = {}
+                if json_bodies:
+                    kwargs["json"] = json_bodies[i % len(json_bodies)]
+                start = time.perf_counter()
+                resp = await client.request(method, urls[i % len(urls)], **kwargs)
+                latencies.append(time.perf_counter() - start)
+                if resp.status_code >= 400:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return summarize(latencies, elapsed, errors)
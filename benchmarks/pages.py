@@ -0,0 +1,74 @@
+# =====================
+# benchmarks/pages.py
+# =====================
+import html
+import random
+from well_scraper.constants import WellFields
+
+SAMPLE_VALUES = {
+    "Operator": "[6137] DEVON ENERGY PRODUCTION COMPANY, LP",
+    "Status": "Active",
+    "Well_Type": "Oil",
+    "Work_Type": "New",
+    "Directional_Status": "Horizontal",
+    "Multi_Lateral": "No",
+    "Mineral_Owner": "Federal",
+    "Surface_Owner": "Federal",
+    "Surface_Location": "C-28-19S-31E 330 FNL 1980 FWL",
+    "GL_Elevation": "3412",
+    "KB_Elevation": "3437",
+    "DF_Elevation": "",
+    "Single_Multiple_Completion": "Single",
+    "Potash_Waiver": "False",
+    "TVD": "10450",
+    "Spud_Date": "07/26/1985",
+    "Last_Inspection": "09/22/2020",
+    "Coordinates": "32.637764,-103.8775024 NAD83",
+}
+
+
+def render_well_page(values=None, filler_rows=400, seed=0):
+    """
+    Render a stand-in for a WellDetails.aspx page.
+
+    The page carries every span ID in WellFields.FIELD_IDS wrapped in the
+    kind of markup the real site emits (nested label tags, a large viewstate
+    and long tables of unrelated spans), so parsers do realistic work.
+
+    Args:
+        values (dict): Field name -> text, defaults to SAMPLE_VALUES.
+        filler_rows (int): Number of unrelated table rows appended after the fields.
+        seed (int): Seed for the filler content.
+    """
+    values = SAMPLE_VALUES if values is None else values
+    rng = random.Random(seed)
+
+    viewstate = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/") for _ in range(20000))
+
+    fields = []
+    for field, span_id in WellFields.FIELD_IDS.items():
+        text = html.escape(values.get(field) or "")
+        fields.append(
+            f'<tr><td class="label"><b>{field.replace("_", " ")}:</b></td>'
+            f'<td><span id="{span_id}">{text}<br/><span class="note"></span></span></td></tr>'
+        )
+
+    filler = []
+    for i in range(filler_rows):
+        filler.append(
+            f'<tr class="{"odd" if i % 2 else "even"}">'
+            f'<td><span id="ctl00_ctl00__main_main_ucHistory_gvHistory_ctl{i:03d}_lblDate">{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{rng.randint(1950, 2024)}</span></td>'
+            f'<td><a href="/OCD/Imaging/File.aspx?id={rng.randint(1, 10**7)}">C-{rng.randint(100, 199)}</a></td>'
+            f'<td><span>{"Approved" if rng.random() < 0.8 else "Pending"}</span></td></tr>'
+        )
+
+    return (
+        "<!DOCTYPE html><html><head><title>Well Details</title>"
+        '<link rel="stylesheet" href="/OCD/site.css"><script src="/OCD/site.js"></script></head>'
+        '<body><form method="post" id="aspnetForm">'
+        f'<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}" />'
+        '<div id="header"><ul>' + "".join(f'<li><a href="/nav/{i}">Menu {i}</a></li>' for i in range(40)) + "</ul></div>"
+        '<table id="generalWellInformation">' + "".join(fields) + "</table>"
+        '<table id="history">' + "".join(filler) + "</table>"
+        "</form></body></html>"
+    )
@@ -0,0 +1,145 @@
+# =====================
+# benchmarks/wells.py
+# =====================
+import random
+from well_scraper.models import WellRecord
+
+OPERATORS = [
+    "[6137] DEVON ENERGY PRODUCTION COMPANY, LP",
+    "[14744] MEWBOURNE OIL CO",
+    "[217955] COG OPERATING LLC",
+    "[7377] EOG RESOURCES INC",
+    "[4323] CHEVRON U S A INC",
+]
+STATUSES = ["Active", "Plugged", "Temporarily Abandoned", "New"]
+WELL_TYPES = ["Oil", "Gas", "Injection", "Salt Water Disposal"]
+
+
+def synthetic_records(count, seed=0):
+    """
+    Yield ``count`` plausible WellRecords spread over the Permian Basin in New Mexico.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        gl = round(rng.uniform(3000, 4200))
+        yield WellRecord(
+            API=f"30-{rng.choice(('015', '025'))}-{i:05d}",
+            Operator=rng.choice(OPERATORS),
+            Status=rng.choice(STATUSES),
+            Well_Type=rng.choice(WELL_TYPES),
+            Work_Type="New",
+            Directional_Status=rng.choice(["Vertical", "Horizontal", "Directional"]),
+            Multi_Lateral="No",
+            Mineral_Owner=rng.choice(["Federal", "State", "Private"]),
+            Surface_Owner=rng.choice(["Federal", "State", "Private"]),
+            Surface_Location=f"C-{rng.randint(1, 36)}-{rng.randint(17, 26)}S-{rng.randint(24, 38)}E",
+            GL_Elevation=float(gl),
+            KB_Elevation=float(gl + 25),
+            TVD=float(round(rng.uniform(2000, 13000))),
+            Spud_Date=f"{rng.randint(1950, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            Latitude=round(rng.uniform(31.8, 33.0), 6),
+            Longitude=round(rng.uniform(-104.9, -103.0), 6),
+            CRS="NAD83",
+        )
+
+
+# API county code -> (name, (min_lat, min_lon, max_lat, max_lon), share of wells).
+# Boxes are rough county extents; shares lean on the oil and gas counties the way
+# the real OCD inventory does.
+COUNTIES = {
+    "001": ("Bernalillo", (34.87, -107.20, 35.22, -106.15), 0.002),
+    "003": ("Catron", (33.20, -109.05, 34.60, -107.70), 0.002),
+    "005": ("Chaves", (32.96, -105.30, 34.00, -103.90), 0.05),
+    "006": ("Cibola", (34.60, -108.90, 35.30, -107.20), 0.002),
+    "007": ("Colfax", (36.00, -105.30, 37.00, -104.00), 0.01),
+    "009": ("Curry", (34.20, -103.75, 34.95, -103.04), 0.002),
+    "011": ("De Baca", (34.10, -104.90, 34.85, -103.95), 0.003),
+    "013": ("Dona Ana", (32.00, -107.30, 33.00, -106.35), 0.002),
+    "015": ("Eddy", (32.00, -104.85, 32.96, -103.72), 0.25),
+    "017": ("Grant", (32.00, -108.55, 33.20, -107.60), 0.002),
+    "019": ("Guadalupe", (34.60, -105.30, 35.30, -104.10), 0.002),
+    "021": ("Harding", (35.60, -104.40, 36.20, -103.36), 0.01),
+    "023": ("Hidalgo", (31.33, -109.05, 32.50, -108.20), 0.002),
+    "025": ("Lea", (32.00, -103.72, 33.60, -103.06), 0.28),
+    "027": ("Lincoln", (33.30, -106.35, 34.60, -104.90), 0.002),
+    "028": ("Los Alamos", (35.80, -106.40, 35.95, -106.20), 0.001),
+    "029": ("Luna", (31.78, -108.23, 32.60, -107.30), 0.002),
+    "031": ("McKinley", (35.05, -109.05, 36.20, -107.30), 0.01),
+    "033": ("Mora", (35.80, -105.50, 36.20, -104.40), 0.002),
+    "035": ("Otero", (32.00, -106.30, 33.40, -104.85), 0.003),
+    "037": ("Quay", (34.60, -104.15, 35.60, -103.04), 0.003),
+    "039": ("Rio Arriba", (35.95, -107.60, 37.00, -105.75), 0.08),
+    "041": ("Roosevelt", (33.40, -103.85, 34.60, -103.04), 0.015),
+    "043": ("Sandoval", (35.20, -107.30, 36.20, -106.20), 0.02),
+    "045": ("San Juan", (36.20, -109.05, 37.00, -107.60), 0.22),
+    "047": ("San Miguel", (35.00, -105.70, 36.00, -104.10), 0.003),
+    "049": ("Santa Fe", (35.20, -106.25, 36.00, -105.70), 0.002),
+    "051": ("Sierra", (32.80, -107.70, 33.50, -106.90), 0.002),
+    "053": ("Socorro", (33.40, -107.70, 34.60, -106.20), 0.002),
+    "055": ("Taos", (36.00, -105.95, 37.00, -105.20), 0.002),
+    "057": ("Torrance", (34.25, -106.40, 35.20, -105.30), 0.002),
+    "059": ("Union", (35.95, -104.00, 37.00, -103.00), 0.005),
+    "061": ("Valencia", (34.45, -107.20, 34.90, -106.40), 0.002),
+}
+
+# Five-digit well sequence numbers, so at most this many APIs per county
+WELLS_PER_COUNTY = 100000
+
+
+def statewide_records(count, seed=0):
+    """
+    Yield ``count`` WellRecords with unique, valid API numbers spread over New Mexico's counties.
+
+    Each county gets wells in proportion to its share in COUNTIES and the
+    well's coordinates fall inside that county's box; once a county runs out
+    of sequence numbers the emptiest county takes the overflow.
+    """
+    if count > WELLS_PER_COUNTY * len(COUNTIES):
+        raise ValueError(f"At most {WELLS_PER_COUNTY * len(COUNTIES)} unique API numbers")
+
+    rng = random.Random(seed)
+    codes = list(COUNTIES)
+    weights = [share for _, _, share in COUNTIES.values()]
+    used = dict.fromkeys(codes, 0)
+
+    for code in rng.choices(codes, weights, k=count):
+        if used[code] >= WELLS_PER_COUNTY:
+            code = min(used, key=used.get)
+        sequence = used[code]
+        used[code] += 1
+
+        min_lat, min_lon, max_lat, max_lon = COUNTIES[code][1]
+        gl = round(rng.uniform(3000, 7500))
+        yield WellRecord(
+            API=f"30-{code}-{sequence:05d}",
+            Operator=rng.choice(OPERATORS),
+            Status=rng.choice(STATUSES),
+            Well_Type=rng.choice(WELL_TYPES),
+            Work_Type="New",
+            Directional_Status=rng.choice(["Vertical", "Horizontal", "Directional"]),
+            Multi_Lateral="No",
+            Mineral_Owner=rng.choice(["Federal", "State", "Private"]),
+            Surface_Owner=rng.choice(["Federal", "State", "Private"]),
+            Surface_Location=f"C-{rng.randint(1, 36)}-{rng.randint(1, 32)}N-{rng.randint(1, 38)}E",
+            GL_Elevation=float(gl),
+            KB_Elevation=float(gl + 25),
+            TVD=float(round(rng.uniform(2000, 13000))),
+            Spud_Date=f"{rng.randint(1950, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            Latitude=round(rng.uniform(min_lat, max_lat), 6),
+            Longitude=round(rng.uniform(min_lon, max_lon), 6),
+            CRS="NAD83",
+        )
+
+
+def fill_database(db, count, seed=0, batch_size=50000):
+    """
+    Insert ``count`` statewide_records into a WellDatabase in batched transactions.
+    """
+    batch = []
+    for record in statewide_records(count, seed):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            db.insert_many(batch)
+            batch = []
+    if batch:
+        db.insert_many(batch)
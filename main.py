@@ -4,6 +4,7 @@
 import argparse
 import logging
 from well_scraper.app import ScraperApp
+from well_scraper.exporters import EXPORT_FORMATS
 
 # Set up logging to console and file
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
@@ -11,12 +12,31 @@ logger = logging.getLogger("Main")
 
 def main():
     parser = argparse.ArgumentParser(description="Scrape well data from NM OCD website.")
-    parser.add_argument("--csv", required=True, help="Path to CSV of API numbers")
+    parser.add_argument("--csv", required=True, help="Path to CSV of API numbers (may be gzipped), or - for stdin")
     parser.add_argument("--db", default="data/sqlite.db", help="SQLite database path")
     parser.add_argument("--multithread", action="store_true", help="Enable multithreaded scraping")
     parser.add_argument("--threads", type=int, default=5, help="Number of threads if multithreading")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Scrape from a single asyncio event loop with adaptive concurrency")
+    parser.add_argument("--max_concurrency", type=int, default=1000, help="Upper bound on in-flight requests in async mode")
+    parser.add_argument("--initial_rate", type=float, default=1.0, help="Starting request rate in requests/second")
+    parser.add_argument("--max_rate", type=float, default=20.0, help="Maximum request rate the governor may reach")
+    parser.add_argument("--batch_size", type=int, default=500, help="Maximum records written per database transaction")
+    parser.add_argument("--flush_interval", type=float, default=1.0, help="Maximum seconds a record waits before being written")
+    parser.add_argument("--mode", choices=ScraperApp.RUN_MODES, default="full",
+                        help="full: scrape all; incremental: skip APIs fetched within --ttl_hours; "
+                             "retry_failed: only past failures; resume: continue the last unfinished job")
+    parser.add_argument("--ttl_hours", type=float, default=168, help="Freshness window for incremental mode, in hours")
+    parser.add_argument("--cache_dir", help="Directory for a compressed raw HTML cache (disabled if omitted)")
+    parser.add_argument("--cache_max_age_hours", type=float, help="Serve cached pages younger than this without a request")
+    parser.add_argument("--cache_max_mb", type=int, default=1024, help="Size budget for the HTML cache in MB")
+    parser.add_argument("--parse_workers", type=int, default=0,
+                        help="Processes that parse fetched pages (0: parse in the fetching threads)")
+    parser.add_argument("--progress_interval", type=float, default=0,
+                        help="Log a progress/ETA line every N seconds (0: off)")
+    parser.add_argument("--metrics_port", type=int, help="Serve Prometheus metrics on this port while scraping")
     parser.add_argument("--export_path", help="Optional path to export scraped data")
-    parser.add_argument("--export_format", choices=["csv", "json"], help="Export format: csv or json")
+    parser.add_argument("--export_format", choices=EXPORT_FORMATS,
+                        help="Export format: csv, json, ndjson, or (with pyarrow) parquet / arrow")
     
     args = parser.parse_args()
 
@@ -26,6 +46,20 @@ def main():
         db_path=args.db,
         multithread=args.multithread,
         threads=args.threads,
+        use_async=args.use_async,
+        max_concurrency=args.max_concurrency,
+        initial_rate=args.initial_rate,
+        max_rate=args.max_rate,
+        batch_size=args.batch_size,
+        flush_interval=args.flush_interval,
+        mode=args.mode,
+        ttl=args.ttl_hours * 3600,
+        cache_dir=args.cache_dir,
+        cache_max_age=args.cache_max_age_hours * 3600 if args.cache_max_age_hours is not None else None,
+        cache_max_bytes=args.cache_max_mb * 1024 ** 2,
+        parse_workers=args.parse_workers,
+        progress_interval=args.progress_interval,
+        metrics_port=args.metrics_port,
     )
 
     # Run scraping
@@ -22,7 +22,9 @@ def client(mock_db):
 
 @pytest.fixture
 def mock_db():
-    return MagicMock()
+    db = MagicMock()
+    db.content_version.return_value = (1, "2025-01-01T00:00:00+00:00")
+    return db
 
 def test_get_well_success(client, mock_db):
     # Setup: return a single row from the "database"
@@ -58,10 +60,21 @@ def test_get_well_not_found(client, mock_db):
     mock_cursor.fetchone.return_value = None
     mock_db.conn.cursor.return_value = mock_cursor
 
-    response = client.get("/well/invalid-api")
+    response = client.get("/well/30-015-99999")
     assert response.status_code == 404
     assert "not found" in response.json()["detail"]
 
+
+def test_get_well_normalizes_and_validates_api(client, mock_db):
+    mock_db.conn.cursor.return_value.fetchone.return_value = None
+
+    assert client.get("/well/30015999990000").status_code == 404
+    assert mock_db.conn.cursor.return_value.execute.call_args[0][1] == ("30-015-99999",)
+
+    response = client.get("/well/invalid-api")
+    assert response.status_code == 400
+    assert "Not an API number" in response.json()["detail"]
+
 def test_polygon_success(client, mock_db):
     # Setup: database returns API + lat/lon tuples
     mock_db.conn.cursor.return_value.fetchall.return_value = [
@@ -99,4 +112,405 @@ def test_polygon_no_results(client, mock_db):
     coords_str = "35.1,-106.5,35.2,-106.5,35.2,-106.4,35.1,-106.4"
     response = client.get(f"/polygon?coords={coords_str}")
     assert response.status_code == 200
-    assert response.json() == {"apis": []}
\ No newline at end of file
+    assert response.json() == {"apis": []}
+
+def test_polygon_uses_spatial_index(tmp_path):
+    from well_scraper.database import WellDatabase
+
+    db = WellDatabase(str(tmp_path / "wells.db"))
+    db.insert_many([
+        WellRecord(API="inside", Latitude=35.15, Longitude=-106.45),
+        WellRecord(API="in_bbox_only", Latitude=35.19, Longitude=-106.41),
+        WellRecord(API="outside", Latitude=36.0, Longitude=-106.45),
+        WellRecord(API="no_location"),
+    ])
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        # Triangle whose bounding box also covers in_bbox_only
+        response = TestClient(app).get("/polygon?coords=35.1,-106.5,35.2,-106.5,35.1,-106.4")
+    finally:
+        app.dependency_overrides.clear()
+        db.conn.close()
+
+    assert response.status_code == 200
+    assert response.json() == {"apis": ["inside"]}
+
+
+def test_conditional_get_returns_304_until_data_changes(tmp_path):
+    from well_scraper.database import WellDatabase
+
+    db = WellDatabase(str(tmp_path / "wells.db"))
+    db.insert(WellRecord(API="30-015-25325", Operator="Before"))
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        first = client.get("/well/30-015-25325")
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"]
+
+        cached = client.get("/well/30-015-25325", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+        since = client.get("/well/30-015-25325", headers={"If-Modified-Since": first.headers["Last-Modified"]})
+        assert since.status_code == 304
+
+        db.insert(WellRecord(API="30-015-25325", Operator="After"))
+        changed = client.get("/well/30-015-25325", headers={"If-None-Match": etag})
+    finally:
+        app.dependency_overrides.clear()
+        db.conn.close()
+
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["Operator"] == "After"
+
+
+def test_conditional_get_skips_query(client, mock_db):
+    response = client.get(
+        "/polygon?coords=35.1,-106.5,35.2,-106.5,35.2,-106.4",
+        headers={"If-None-Match": 'W/"0", "1"'},
+    )
+
+    assert response.status_code == 304
+    mock_db.conn.cursor.assert_not_called()
+
+
+@pytest.fixture
+def export_db(tmp_path, monkeypatch):
+    import api_main
+    from well_scraper.database import WellDatabase
+
+    path = str(tmp_path / "wells.db")
+    db = WellDatabase(path)
+    db.insert_many([
+        WellRecord(API="30-015-00001", Operator="A", Status="Active", Latitude=32.5, Longitude=-104.1),
+        WellRecord(API="30-015-00002", Operator="B", Status="Active", Latitude=33.5, Longitude=-104.1),
+        WellRecord(API="30-015-00003", Operator="A", Status="Plugged", Latitude=32.6, Longitude=-104.2),
+    ])
+    db.close()
+    monkeypatch.setattr(api_main, "DB_PATH", path)
+    return path
+
+
+def test_export_csv_with_projection_and_filters(export_db):
+    response = TestClient(app).get("/export?columns=API,Status&operator=A&batch_size=1")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.splitlines() == ["API,Status", "30-015-00001,Active", "30-015-00003,Plugged"]
+
+
+def test_export_ndjson_bbox(export_db):
+    import json
+
+    response = TestClient(app).get(
+        "/export?format=ndjson&bbox=32.0,-105.0,33.0,-104.0&status=Active",
+        headers={"Accept-Encoding": "identity"},
+    )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["API"] for row in rows] == ["30-015-00001"]
+    assert rows[0]["Latitude"] == 32.5
+
+
+def test_export_parquet(export_db):
+    pytest.importorskip("pyarrow")
+    import io
+    import pyarrow.parquet
+
+    response = TestClient(app).get("/export?format=parquet&columns=API,Latitude")
+
+    assert response.status_code == 200
+    table = pyarrow.parquet.read_table(io.BytesIO(response.content))
+    assert table.column_names == ["API", "Latitude"]
+    assert table.num_rows == 3
+
+
+def test_export_rejects_unknown_column(export_db):
+    response = TestClient(app).get("/export?columns=API,Secret")
+    assert response.status_code == 400
+    assert "Secret" in response.json()["detail"]
+
+
+def test_batch_lookup_post_and_get(tmp_path):
+    from well_scraper.database import WellDatabase
+
+    db = WellDatabase(str(tmp_path / "wells.db"))
+    db.insert_many([WellRecord(API=f"30-015-{i:05d}", Operator=f"Op {i}") for i in range(1200)])
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        apis = ["30-015-01100", "30-015-99999", "3001500002", "30015011000100"] + [f"30-015-{i:05d}" for i in range(600)]
+        posted = client.post("/wells", json={"apis": apis})
+        got = client.get("/wells", params=[("api", "30-015-00007"), ("api", "nope")])
+        too_many = client.post("/wells", json={"apis": ["x"] * 5001})
+    finally:
+        app.dependency_overrides.clear()
+        db.conn.close()
+
+    assert posted.status_code == 200
+    body = posted.json()
+    # Request order, duplicates collapsed, across more than one IN chunk
+    assert [w["API"] for w in body["wells"][:2]] == ["30-015-01100", "30-015-00002"]
+    assert len(body["wells"]) == 601
+    assert body["wells"][0]["Operator"] == "Op 1100"
+    assert body["missing"] == ["30-015-99999"]
+
+    assert got.status_code == 200
+    assert [w["API"] for w in got.json()["wells"]] == ["30-015-00007"]
+    assert got.json()["missing"] == []
+    assert got.json()["invalid"] == ["nope"]
+    assert got.headers["ETag"]
+
+    assert too_many.status_code == 422
+
+
+def test_metrics_endpoint_reports_route_latency(client, mock_db):
+    mock_db.conn.cursor.return_value.fetchone.return_value = None
+    client.get("/well/30-015-99999")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'well_api_request_seconds_count{route="/well/{api_number}",method="GET",status="404"}' in response.text
+    assert "# TYPE well_scraper_fetch_seconds histogram" in response.text
+
+
+@pytest.fixture
+def polygon_db(tmp_path):
+    from well_scraper.database import WellDatabase
+
+    db = WellDatabase(str(tmp_path / "wells.db"))
+    # A 5 x 5 grid of wells, 0.01 degrees apart, plus one far to the north
+    db.insert_many([
+        WellRecord(API=f"30-015-{row}{col:04d}", Operator=f"Op {row}", Latitude=32.0 + row / 100, Longitude=-104.0 + col / 100)
+        for row in range(5)
+        for col in range(5)
+    ] + [WellRecord(API="30-025-00001", Latitude=33.5, Longitude=-103.5)])
+
+    app.dependency_overrides[get_db] = lambda: db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    db.conn.close()
+
+
+def geojson_square(min_lat, min_lon, max_lat, max_lon):
+    # GeoJSON ring in [lon, lat] order
+    return [[min_lon, min_lat], [max_lon, min_lat], [max_lon, max_lat], [min_lon, max_lat], [min_lon, min_lat]]
+
+
+def test_post_polygon_pages_with_cursor(polygon_db):
+    geometry = {"type": "Polygon", "coordinates": [geojson_square(31.995, -104.005, 32.045, -103.955)]}
+
+    apis, cursor = [], None
+    while True:
+        body = {"geometry": geometry, "limit": 10}
+        if cursor:
+            body["cursor"] = cursor
+        page = polygon_db.post("/polygon", json=body).json()
+        assert len(page["apis"]) <= 10
+        apis += page["apis"]
+        cursor = page.get("next_cursor")
+        if not cursor:
+            break
+
+    assert len(apis) == 25
+    assert apis == sorted(apis)
+    assert "30-025-00001" not in apis
+
+
+@pytest.mark.parametrize("limit", [3, 1000])
+def test_post_polygon_index_walk_and_sorted_candidates_agree(polygon_db, limit):
+    # Small pages of a large area walk the API index, big pages sort R*Tree candidates
+    geometry = {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [geojson_square(31.995, -104.005, 32.045, -103.955), geojson_square(32.015, -103.985, 32.025, -103.975)],
+            [geojson_square(33.4, -103.6, 33.6, -103.4)],
+        ],
+    }
+
+    apis, cursor = [], None
+    while True:
+        body = {"geometry": geometry, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = polygon_db.post("/polygon", json=body).json()
+        apis += page["apis"]
+        cursor = page.get("next_cursor")
+        if not cursor:
+            break
+
+    assert apis == sorted(apis)
+    assert len(apis) == 25
+    assert "30-015-20002" not in apis
+    assert "30-025-00001" in apis
+
+
+def test_post_polygon_holes_multipolygon_and_fields(polygon_db):
+    # Grid square with a hole around the centre well, plus a square around the far well
+    geometry = {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [geojson_square(31.995, -104.005, 32.045, -103.955), geojson_square(32.015, -103.985, 32.025, -103.975)],
+            [geojson_square(33.4, -103.6, 33.6, -103.4)],
+        ],
+    }
+    response = polygon_db.post("/polygon", json={"geometry": geometry, "fields": ["Operator", "Latitude"]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["apis"]) == 25
+    assert "30-015-20002" not in data["apis"]
+    assert "30-025-00001" in data["apis"]
+    assert data["wells"][0] == {"Operator": "Op 0", "Latitude": 32.0}
+    assert "next_cursor" not in data
+
+
+@pytest.mark.parametrize("body, detail", [
+    ({"geometry": {"type": "Point", "coordinates": [-104.0, 32.0]}}, "Polygon or MultiPolygon"),
+    ({"geometry": {"type": "Polygon", "coordinates": [[[-104.0, 32.0], [-103.9, 32.1]]]}}, "Unable to construct"),
+    ({"geometry": {"type": "Polygon", "coordinates": [geojson_square(32, -104, 33, -103)]}, "cursor": "bogus"}, "Invalid cursor"),
+    ({"geometry": {"type": "Polygon", "coordinates": [geojson_square(32, -104, 33, -103)]}, "fields": ["Nope"]}, "Unknown fields"),
+])
+def test_post_polygon_rejects_bad_input(polygon_db, body, detail):
+    response = polygon_db.post("/polygon", json=body)
+
+    assert response.status_code == 400
+    assert detail in response.json()["detail"]
+
+
+@pytest.fixture
+def nearby_db(tmp_path):
+    from well_scraper.database import WellDatabase
+
+    db = WellDatabase(str(tmp_path / "wells.db"))
+    # Wells due north of the origin at 1, 2, 5 and 50 km (0.008993 degrees per km)
+    db.insert_many([
+        WellRecord(API="30-015-00005", Latitude=32.0 + 5 * 0.008993, Longitude=-104.0),
+        WellRecord(API="30-015-00001", Latitude=32.0 + 0.008993, Longitude=-104.0),
+        WellRecord(API="30-015-00050", Latitude=32.0 + 50 * 0.008993, Longitude=-104.0),
+        WellRecord(API="30-015-00002", Latitude=32.0 + 2 * 0.008993, Longitude=-104.0),
+        WellRecord(API="30-015-99999"),
+    ])
+
+    app.dependency_overrides[get_db] = lambda: db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    db.conn.close()
+
+
+def test_near_returns_wells_in_radius_sorted_by_distance(nearby_db):
+    response = nearby_db.get("/near?lat=32.0&lon=-104.0&radius_m=3000")
+
+    assert response.status_code == 200
+    wells = response.json()["wells"]
+    assert [well["API"] for well in wells] == ["30-015-00001", "30-015-00002"]
+    assert wells[0]["distance_m"] == pytest.approx(1000, abs=1)
+    assert wells[1]["distance_m"] == pytest.approx(2000, abs=1)
+
+
+def test_nearest_widens_search_until_k_found(nearby_db):
+    response = nearby_db.get("/nearest?lat=32.0&lon=-104.0&k=4")
+
+    assert response.status_code == 200
+    wells = response.json()["wells"]
+    assert [well["API"] for well in wells] == ["30-015-00001", "30-015-00002", "30-015-00005", "30-015-00050"]
+    assert wells[-1]["distance_m"] == pytest.approx(50000, rel=1e-3)
+
+    # Fewer wells with a location than k: return them all
+    assert len(nearby_db.get("/nearest?lat=32.0&lon=-104.0&k=10").json()["wells"]) == 4
+
+
+def test_near_validates_query(nearby_db):
+    assert nearby_db.get("/near?lat=95&lon=-104.0&radius_m=1000").status_code == 422
+    assert nearby_db.get("/near?lat=32&lon=-104.0&radius_m=0").status_code == 422
+    assert nearby_db.get("/nearest?lat=32&lon=-104.0&k=0").status_code == 422
+
+
+def test_tiles_cluster_at_low_zoom_and_list_wells_at_high_zoom(export_db):
+    from well_scraper import tiles
+
+    with TestClient(app) as client:
+        world = client.get("/tiles/0/0/0")
+        x, y = (int(v[0]) for v in tiles.tile_xy([32.5], [-104.1], 16))
+        close = client.get(f"/tiles/16/{x}/{y}")
+        missing = client.get("/tiles/2/4/0")
+
+    assert world.status_code == 200
+    assert world.json()["count"] == 3
+    assert sum(cluster["status"].get("Plugged", 0) for cluster in world.json()["clusters"]) == 1
+    assert world.headers["ETag"]
+
+    assert close.json()["wells"] == [
+        {"API": "30-015-00001", "Latitude": 32.5, "Longitude": -104.1, "Status": "Active", "Well_Type": None}
+    ]
+    assert missing.status_code == 400
+
+
+def test_wells_search_filters_and_pages(export_db):
+    with TestClient(app) as client:
+        first = client.get("/wells/search?status=Active&columns=Operator&limit=1")
+        second = client.get(f"/wells/search?status=Active&columns=Operator&limit=1&cursor={first.json()['next_cursor']}")
+        boxed = client.get("/wells/search?operator=A&bbox=32.0,-105.0,33.0,-104.0")
+        bad_date = client.get("/wells/search?spud_from=07/26/1985")
+        bad_column = client.get("/wells/search?columns=Nope")
+
+    assert first.json()["wells"] == [{"API": "30-015-00001", "Operator": "A"}]
+    assert second.json() == {"wells": [{"API": "30-015-00002", "Operator": "B"}]}
+    assert [well["API"] for well in boxed.json()["wells"]] == ["30-015-00001", "30-015-00003"]
+    assert bad_date.status_code == 422
+    assert bad_column.status_code == 400
+
+
+def test_cursor_can_end_on_a_legacy_api_key(tmp_path):
+    from well_scraper.database import WellDatabase
+
+    db = WellDatabase(str(tmp_path / "wells.db"))
+    # Rows written before API numbers were normalized keep their old keys
+    apis = ["30-015-00001", "30-015-00002-00-00", "30-015-00003"]
+    db.insert_many([WellRecord(API=api, Status="Active") for api in apis])
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        seen, cursor = [], None
+        while True:
+            page = client.get("/wells/search", params={"status": "Active", "limit": 1, **({"cursor": cursor} if cursor else {})})
+            assert page.status_code == 200
+            seen += [well["API"] for well in page.json()["wells"]]
+            cursor = page.json().get("next_cursor")
+            if not cursor:
+                break
+    finally:
+        app.dependency_overrides.clear()
+        db.close()
+
+    assert seen == sorted(apis)
+
+
+def test_text_search_endpoint(export_db):
+    import api_main
+    from well_scraper.database import WellDatabase
+
+    db = WellDatabase(api_main.DB_PATH)
+    db.insert(WellRecord(API="30-015-00004", Operator="[7377] EOG RESOURCES INC", Surface_Owner="State"))
+    db.close()
+
+    with TestClient(app) as client:
+        found = client.get("/search?q=eog res")
+        empty = client.get("/search?q=--")
+
+    assert found.status_code == 200
+    wells = found.json()["wells"]
+    assert [well["API"] for well in wells] == ["30-015-00004"]
+    assert wells[0]["Surface_Owner"] == "State"
+    assert wells[0]["score"] > 0
+    assert empty.status_code == 400
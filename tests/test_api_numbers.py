@@ -0,0 +1,28 @@
+import pytest
+from well_scraper.api_numbers import InvalidApiNumber, api_key, normalize_api
+
+
+@pytest.mark.parametrize("raw", [
+    "30-015-25325",
+    "3001525325",
+    " 30 015 25325 ",
+    "30-015-25325-00",
+    "30-015-25325-01-02",
+    "30015253250000",
+])
+def test_normalize_api_forms(raw):
+    assert normalize_api(raw) == "30-015-25325"
+
+
+@pytest.mark.parametrize("raw", [
+    "", "test_api", "30-015-2532", "3001525325000", "42-015-25325", "30-015-2532X",
+    # Unicode digits that str.isdigit() accepts
+    "30-015-2532\u00b2", "\uff13\uff10\uff10\uff11\uff15\uff12\uff15\uff13\uff12\uff15",
+])
+def test_normalize_api_rejects(raw):
+    with pytest.raises(InvalidApiNumber):
+        normalize_api(raw)
+
+
+def test_api_key_is_stable():
+    assert api_key("30-015-25325") == 3001525325
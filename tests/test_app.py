@@ -1,11 +1,21 @@
+import gzip
+import io
+import logging
+import time
 import tempfile
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 from well_scraper.app import ScraperApp
+from well_scraper.database import WellDatabase
 from well_scraper.models import WellRecord
 
 
+def inserted_records(mock_db):
+    """Flatten every batch the writer passed to insert_many."""
+    return [record for call in mock_db.insert_many.call_args_list for record in call[0][0]]
+
+
 @pytest.fixture
 def temp_files():
     csv_fd, csv_path = tempfile.mkstemp(suffix=".csv")
@@ -37,9 +47,9 @@ def test_run_single_thread(mock_scraper_class, mock_db_class, temp_files):
     app.run()
 
     assert mock_scraper.scrape_api.call_count == 2
-    assert mock_db.insert.call_count == 2
+    assert len(inserted_records(mock_db)) == 2
 
-    inserted_record = mock_db.insert.call_args[0][0]
+    inserted_record = inserted_records(mock_db)[-1]
     assert isinstance(inserted_record, WellRecord)
     assert inserted_record.API == "30-015-25325"
 
@@ -48,6 +58,30 @@ def test_run_single_thread(mock_scraper_class, mock_db_class, temp_files):
     assert app.skipped == 0
 
 
+@patch("well_scraper.app.WellDatabase")
+@patch("well_scraper.app.WellScraper")
+def test_scraped_numbers_and_dates_are_typed(mock_scraper_class, mock_db_class, temp_files, caplog):
+    mock_scraper = MagicMock()
+    mock_scraper.scrape_api.side_effect = lambda api: {
+        "API": api,
+        "Operator": "Test Operator",
+        "GL_Elevation": "3,412",
+        "TVD": "10450 ft",
+        "KB_Elevation": "N/A",
+        "Spud_Date": "07/26/1985",
+    }
+    mock_scraper_class.return_value = mock_scraper
+    mock_db_class.return_value = MagicMock()
+
+    csv_path, db_path = temp_files
+    with caplog.at_level(logging.WARNING):
+        ScraperApp(csv_path, db_path).run()
+
+    record = inserted_records(mock_db_class.return_value)[0]
+    assert (record.GL_Elevation, record.TVD, record.KB_Elevation, record.Spud_Date) == (3412.0, 10450.0, None, "1985-07-26")
+    assert "Could not parse KB_Elevation 'N/A'" in caplog.text
+
+
 @patch("well_scraper.app.WellDatabase")
 @patch("well_scraper.app.WellScraper")
 def test_run_with_errors(mock_scraper_class, mock_db_class, temp_files):
@@ -68,7 +102,7 @@ def test_run_with_errors(mock_scraper_class, mock_db_class, temp_files):
 
     assert app.inserted == 1
     assert app.errors == 1
-    mock_db.insert.assert_called_once()
+    assert len(inserted_records(mock_db)) == 1
 
 
 def test_csv_with_missing_api(temp_files):
@@ -87,3 +121,231 @@ def test_csv_with_missing_api(temp_files):
 
         assert app.skipped == 1
         assert app.inserted == 0
+
+
+@patch("well_scraper.app.WellDatabase")
+@patch("well_scraper.app.AsyncWellScraper")
+def test_run_async(mock_async_scraper_class, mock_db_class, temp_files):
+    mock_scraper = MagicMock()
+    mock_scraper.scrape_api = AsyncMock(side_effect=[
+        {"API": "30-015-25325", "Operator": "Test"},
+        None,
+    ])
+    mock_async_scraper_class.return_value.__aenter__.return_value = mock_scraper
+
+    mock_db = MagicMock()
+    mock_db_class.return_value = mock_db
+
+    csv_path, db_path = temp_files
+    app = ScraperApp(csv_path, db_path, use_async=True)
+
+    app.run()
+
+    assert mock_scraper.scrape_api.call_count == 2
+    assert app.inserted == 1
+    assert app.errors == 1
+    assert len(inserted_records(mock_db)) == 1
+
+
+@patch("well_scraper.app.WellDatabase")
+@patch("well_scraper.app.WellScraper")
+def test_write_failure_counts_as_errors(mock_scraper_class, mock_db_class, temp_files):
+    mock_scraper = MagicMock()
+    mock_scraper.scrape_api.side_effect = lambda api: {"API": api, "Operator": "Test"}
+    mock_scraper_class.return_value = mock_scraper
+
+    mock_db = MagicMock()
+    mock_db.insert_many.side_effect = RuntimeError("disk full")
+    mock_db_class.return_value = mock_db
+
+    csv_path, db_path = temp_files
+    app = ScraperApp(csv_path, db_path)
+
+    app.run()
+
+    assert app.inserted == 0
+    assert app.errors == 2
+
+
+@patch("well_scraper.app.WellDatabase")
+@patch("well_scraper.app.WellScraper")
+def test_multithread_reads_input_lazily(mock_scraper_class, mock_db_class, tmp_path):
+    csv_path = tmp_path / "apis.csv.gz"
+    with gzip.open(csv_path, "wt", newline="") as f:
+        f.write("api\n" + "".join(f"30-015-{i:05d}\n" if i % 50 else " \n" for i in range(1, 501)))
+
+    app = ScraperApp(str(csv_path), str(tmp_path / "wells.db"), multithread=True, threads=4)
+    lag = []
+
+    def scrape(api):
+        # How far the CSV reader has run ahead of the scrapers
+        lag.append(app.queued - mock_scraper.scrape_api.call_count)
+        return {"API": api, "Operator": "Test"}
+
+    mock_scraper = mock_scraper_class.return_value
+    mock_scraper.scrape_api.side_effect = scrape
+
+    app.run()
+
+    assert mock_scraper.scrape_api.call_count == 490
+    assert app.inserted == 490
+    assert app.skipped == 10
+    assert max(lag) <= 4 * 2 + 4 + 1
+
+
+@patch("well_scraper.app.WellDatabase")
+@patch("well_scraper.app.WellScraper")
+def test_reads_apis_from_stdin(mock_scraper_class, mock_db_class, tmp_path, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"API\n30-015-25325\n")))
+    mock_scraper_class.return_value.scrape_api.side_effect = lambda api: {"API": api, "Operator": "Test"}
+
+    app = ScraperApp("-", str(tmp_path / "wells.db"))
+    app.run()
+
+    assert app.inserted == 1
+    assert inserted_records(mock_db_class.return_value)[0].API == "30-015-25325"
+
+
+@patch("well_scraper.app.WellDatabase")
+@patch("well_scraper.app.WellScraper")
+def test_api_numbers_are_normalized_and_deduplicated(mock_scraper_class, mock_db_class, tmp_path, capsys):
+    csv_path = tmp_path / "apis.csv"
+    csv_path.write_text("api\n30-015-25325\n3001525325\n30015253250100\nnot-an-api\n30-015-2532\u00b2\n30-015-25327\n", encoding="utf-8")
+    mock_scraper = mock_scraper_class.return_value
+    mock_scraper.scrape_api.side_effect = lambda api: {"API": api, "Operator": "Test"}
+
+    app = ScraperApp(str(csv_path), str(tmp_path / "wells.db"))
+    app.run()
+
+    assert [call[0][0] for call in mock_scraper.scrape_api.call_args_list] == ["30-015-25325", "30-015-25327"]
+    assert app.duplicates == 2
+    assert app.invalid == 2
+    assert "Duplicates collapsed (fetches saved): 2" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("mode", [{"multithread": True, "threads": 3}, {"use_async": True}])
+def test_parse_pool_stage(mode, tmp_path):
+    from benchmarks.pages import render_well_page
+
+    csv_path = tmp_path / "apis.csv"
+    csv_path.write_text("api\n" + "".join(f"30-015-{i:05d}\n" for i in range(20)))
+    page = render_well_page(filler_rows=10)
+
+    async def fetch_async(api):
+        return None if api.endswith("13") else page
+
+    with patch("well_scraper.well_scraper.WellScraper.fetch_page", side_effect=lambda api: None if api.endswith("13") else page), \
+            patch("well_scraper.async_scraper.AsyncWellScraper.fetch_page", side_effect=fetch_async):
+        app = ScraperApp(str(csv_path), str(tmp_path / "wells.db"), parse_workers=2, **mode)
+        app.run()
+
+    assert app.inserted == 19
+    assert app.errors == 1
+    record = app.db.get_by_api("30-015-00004")
+    assert record.Operator == "[6137] DEVON ENERGY PRODUCTION COMPANY, LP"
+    assert record.Latitude == 32.637764
+    app.db.conn.close()
+
+
+@patch("well_scraper.app.WellDatabase")
+@patch("well_scraper.app.WellScraper")
+def test_progress_line_and_metrics(mock_scraper_class, mock_db_class, tmp_path, caplog):
+    from well_scraper import metrics
+
+    csv_path = tmp_path / "apis.csv"
+    csv_path.write_text("api\n" + "".join(f"30-015-{i:05d}\n" for i in range(30)))
+
+    def scrape(api):
+        time.sleep(0.005)
+        return {"API": api, "Operator": "Test"}
+
+    mock_scraper_class.return_value.scrape_api.side_effect = scrape
+    inserted_before = metrics.APIS.value(outcome="inserted")
+
+    app = ScraperApp(str(csv_path), str(tmp_path / "wells.db"), progress_interval=0.02, flush_interval=0.01)
+    with caplog.at_level(logging.INFO, logger="ScraperApp"):
+        app.run()
+
+    assert metrics.APIS.value(outcome="inserted") - inserted_before == 30
+    progress = [r.message for r in caplog.records if r.message.startswith("Progress:")]
+    assert progress
+    assert "ETA" in progress[0]
+
+
+def run_real_db_app(csv_path, db_path, scrape, **kwargs):
+    with patch("well_scraper.app.WellScraper") as mock_scraper_class:
+        mock_scraper = MagicMock()
+        mock_scraper.scrape_api.side_effect = scrape
+        mock_scraper_class.return_value = mock_scraper
+        app = ScraperApp(csv_path, db_path, **kwargs)
+        app.run()
+        app.db.conn.close()
+    return app, mock_scraper
+
+
+def test_incremental_run_skips_fresh_and_not_found(temp_files):
+    csv_path, db_path = temp_files
+    pages = {"30-015-25325": {"API": "30-015-25325", "Operator": "Test"}, "30-015-25327": {"API": "30-015-25327"}}
+
+    first, _ = run_real_db_app(csv_path, db_path, pages.get)
+    assert first.inserted == 1
+    assert first.not_found == 1
+
+    second, scraper = run_real_db_app(csv_path, db_path, pages.get, mode="incremental")
+    assert scraper.scrape_api.call_count == 0
+    assert second.already_done == 2
+
+    expired, scraper = run_real_db_app(csv_path, db_path, pages.get, mode="incremental", ttl=-60)
+    assert scraper.scrape_api.call_count == 2
+    os.unlink(db_path)
+
+
+def test_retry_failed_only_scrapes_failures(temp_files):
+    csv_path, db_path = temp_files
+
+    run_real_db_app(csv_path, db_path, lambda api: {"API": api, "Operator": "Test"} if api.endswith("25") else None)
+    app, scraper = run_real_db_app(csv_path, db_path, lambda api: {"API": api, "Operator": "Test"}, mode="retry_failed")
+
+    scraper.scrape_api.assert_called_once_with("30-015-25327")
+    assert app.inserted == 1
+    assert app.already_done == 1
+
+    db = WellDatabase(db_path)
+    metadata = db.get_scrape_metadata("30-015-25327")
+    assert metadata["outcome"] == "ok"
+    assert metadata["attempts"] == 2
+    db.conn.close()
+    os.unlink(db_path)
+
+
+def test_resume_continues_unfinished_job(temp_files):
+    csv_path, db_path = temp_files
+
+    db = WellDatabase(db_path)
+    db.start_job(csv_path, "full")
+    db.record_outcomes([("30-015-25325", "ok", db.utc_now(), None)])
+    db.conn.close()
+
+    app, scraper = run_real_db_app(csv_path, db_path, lambda api: {"API": api, "Operator": "Test"}, mode="resume")
+    scraper.scrape_api.assert_called_once_with("30-015-25327")
+    assert app.already_done == 1
+
+    db = WellDatabase(db_path)
+    assert db.latest_unfinished_job(csv_path) is None
+    db.conn.close()
+    os.unlink(db_path)
+
+
+def test_resume_keeps_the_interrupted_jobs_mode(temp_files):
+    csv_path, db_path = temp_files
+
+    db = WellDatabase(db_path)
+    db.record_outcomes([("30-015-25327", "error", "2020-01-01T00:00:00+00:00", "timeout")])
+    db.start_job(csv_path, "retry_failed")
+    db.conn.close()
+
+    # 30-015-25325 was never fetched, but it was not part of the retry job
+    app, scraper = run_real_db_app(csv_path, db_path, lambda api: {"API": api, "Operator": "Test"}, mode="resume")
+    scraper.scrape_api.assert_called_once_with("30-015-25327")
+    assert app.already_done == 1
+    os.unlink(db_path)
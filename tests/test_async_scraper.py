@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import httpx
+from well_scraper.async_scraper import AsyncWellScraper, AdaptiveConcurrencyLimiter
+from well_scraper.constants import WellFields
+from well_scraper.rate_limiter import RateGovernor
+
+
+PAGE = f"""
+<html>
+  <body>
+    <span id="{WellFields.FIELD_IDS['Coordinates']}">35.123,-106.456 NAD83</span>
+    <span id="{WellFields.FIELD_IDS['Operator']}">Test Operator</span>
+  </body>
+</html>
+"""
+
+
+def fast_governor():
+    return RateGovernor(initial_rate=1000, max_rate=1000, burst=1000, cooldown=0)
+
+
+def make_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_async_scrape_api_success():
+    async def run():
+        client = make_client(lambda request: httpx.Response(200, text=PAGE))
+        async with AsyncWellScraper(max_retries=1, backoff_factor=0, client=client, governor=fast_governor()) as scraper:
+            return await scraper.scrape_api("30-015-25325")
+
+    data = asyncio.run(run())
+
+    assert data["API"] == "30-015-25325"
+    assert data["Operator"] == "Test Operator"
+    assert data["Latitude"] == 35.123
+    assert data["CRS"] == "NAD83"
+
+
+def test_async_scrape_api_retries_rate_limit():
+    responses = [AsyncWellScraper.RATE_LIMIT_TEXT, PAGE]
+
+    async def run():
+        client = make_client(lambda request: httpx.Response(200, text=responses.pop(0)))
+        async with AsyncWellScraper(max_retries=2, backoff_factor=0, client=client, governor=fast_governor()) as scraper:
+            return await scraper.scrape_api("30-015-25325")
+
+    data = asyncio.run(run())
+
+    assert data["Operator"] == "Test Operator"
+    assert responses == []
+
+
+def test_async_scrape_api_gives_up_when_rate_limited():
+    async def run():
+        client = make_client(lambda request: httpx.Response(200, text=AsyncWellScraper.RATE_LIMIT_TEXT))
+        async with AsyncWellScraper(max_retries=2, backoff_factor=0, client=client, governor=fast_governor()) as scraper:
+            return await scraper.scrape_api("30-015-25325")
+
+    assert asyncio.run(run()) is None
+
+
+def test_async_scrape_api_http_error():
+    async def run():
+        client = make_client(lambda request: httpx.Response(500, text="boom"))
+        async with AsyncWellScraper(max_retries=2, backoff_factor=0, client=client, governor=fast_governor()) as scraper:
+            return await scraper.scrape_api("30-015-25325")
+
+    assert asyncio.run(run()) is None
+
+
+def test_cache_work_runs_off_the_event_loop(tmp_path):
+    from well_scraper.html_cache import HtmlCache
+
+    class RecordingCache(HtmlCache):
+        threads = []
+
+        def lookup(self, api):
+            self.threads.append(threading.get_ident())
+            return super().lookup(api)
+
+        def put(self, *args, **kwargs):
+            self.threads.append(threading.get_ident())
+            return super().put(*args, **kwargs)
+
+    cache = RecordingCache(str(tmp_path), codec="gzip")
+
+    async def run():
+        client = make_client(lambda request: httpx.Response(200, text=PAGE))
+        async with AsyncWellScraper(max_retries=1, client=client, governor=fast_governor(), cache=cache) as scraper:
+            return await scraper.scrape_api("30-015-25325")
+
+    assert asyncio.run(run())["Operator"] == "Test Operator"
+    cache.close()
+    assert len(RecordingCache.threads) == 2
+    assert threading.get_ident() not in RecordingCache.threads
+
+
+def test_rate_token_is_taken_after_the_concurrency_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    in_flight_at_token = []
+
+    class RecordingGovernor(RateGovernor):
+        async def acquire_async(self, sleep=asyncio.sleep):
+            in_flight_at_token.append(limiter.in_flight)
+            await super().acquire_async(sleep)
+
+    governor = RecordingGovernor(initial_rate=1000, max_rate=1000, burst=1000, cooldown=0)
+
+    async def run():
+        client = make_client(lambda request: httpx.Response(200, text=PAGE))
+        async with AsyncWellScraper(max_retries=1, client=client, limiter=limiter, governor=governor) as scraper:
+            await asyncio.gather(*(scraper.scrape_api(f"30-015-{i:05d}") for i in range(5)))
+
+    asyncio.run(run())
+    # Nobody takes a token while waiting for the single slot
+    assert in_flight_at_token == [1] * 5
+
+
+def test_limiter_slot_released_on_unexpected_errors():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+
+    def handler(request):
+        raise RuntimeError("transport bug")
+
+    async def run():
+        client = make_client(handler)
+        async with AsyncWellScraper(max_retries=1, client=client, limiter=limiter, governor=fast_governor()) as scraper:
+            for _ in range(2):
+                try:
+                    await scraper.scrape_api("30-015-25325")
+                except RuntimeError:
+                    pass
+
+            # A cancelled request gives its slot back as well
+            task = asyncio.create_task(scraper.scrape_api("30-015-25325"))
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert limiter.in_flight == 0
+    assert limiter.limit == 1
+
+
+def test_limiter_grows_on_fast_responses_and_halves_on_rate_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=100)
+
+    async def run():
+        for _ in range(6):
+            await limiter.acquire()
+            await limiter.release(latency=0.1)
+        assert limiter.limit == 10
+
+        await limiter.acquire()
+        await limiter.release(rate_limited=True)
+        assert limiter.limit == 5
+
+        await limiter.acquire()
+        await limiter.release(latency=1.0)
+        assert limiter.limit == 4.5
+
+    asyncio.run(run())
+    assert limiter.in_flight == 0
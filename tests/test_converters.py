@@ -0,0 +1,51 @@
+import pytest
+from well_scraper.converters import convert_fields, parse_date, parse_number
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("3412", 3412.0),
+    ("3,412", 3412.0),
+    ("12,345.5", 12345.5),
+    ("10450 ft", 10450.0),
+    ("10,450 FT.", 10450.0),
+    ("10450'", 10450.0),
+    (" -12.5 ", -12.5),
+    (3412.0, 3412.0),
+    ("", None),
+    (None, None),
+])
+def test_parse_number(text, expected):
+    assert parse_number(text) == expected
+
+
+@pytest.mark.parametrize("text", ["N/A", "34,12", "3412 m", "1.2.3"])
+def test_parse_number_rejects_text(text):
+    with pytest.raises(ValueError):
+        parse_number(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("07/26/1985", "1985-07-26"),
+    ("7/6/1985", "1985-07-06"),
+    ("07/26/1985 12:00:00 AM", "1985-07-26"),
+    ("1985-07-26", "1985-07-26"),
+    ("  ", None),
+    (None, None),
+])
+def test_parse_date(text, expected):
+    assert parse_date(text) == expected
+
+
+@pytest.mark.parametrize("text", ["13/01/1985", "07/26/85", "Unknown"])
+def test_parse_date_rejects_text(text):
+    with pytest.raises(ValueError):
+        parse_date(text)
+
+
+def test_convert_fields_reports_unparsed_values():
+    data = {"API": "30-015-25325", "Operator": "Devon", "TVD": "10,450", "GL_Elevation": "N/A", "Spud_Date": "07/26/1985"}
+
+    converted, unparsed = convert_fields(data)
+
+    assert converted == {"API": "30-015-25325", "Operator": "Devon", "TVD": 10450.0, "GL_Elevation": None, "Spud_Date": "1985-07-26"}
+    assert unparsed == {"GL_Elevation": "N/A"}
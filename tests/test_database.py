@@ -133,7 +133,316 @@ def test_export_json(temp_db):
     os.unlink(export_path)
 
 
+def test_export_ndjson_streams_in_batches(temp_db, tmp_path):
+    temp_db.insert_many([WellRecord(API=f"30-015-{i:05d}", TVD=float(i)) for i in range(5)])
+    export_path = tmp_path / "wells.ndjson"
+
+    temp_db.export_data(str(export_path), format="ndjson", batch_size=2)
+
+    rows = [json.loads(line) for line in export_path.read_text(encoding="utf-8").splitlines()]
+    assert [row["API"] for row in rows] == [f"30-015-{i:05d}" for i in range(5)]
+    assert rows[3]["TVD"] == 3.0
+    # Exporting must not leave the shared connection returning Row objects
+    assert temp_db.conn.row_factory is None
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_export_columnar_is_typed(temp_db, tmp_path, format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    temp_db.insert_many([
+        WellRecord(API="30-015-00001", Operator="A", Latitude=32.5, Longitude=-104.1),
+        WellRecord(API="30-015-00002"),
+    ])
+    export_path = str(tmp_path / f"wells.{format}")
+
+    temp_db.export_data(export_path, format=format, batch_size=1)
+
+    if format == "parquet":
+        table = pyarrow.parquet.read_table(export_path)
+    else:
+        with pa.memory_map(export_path) as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+    assert table.column_names == temp_db.COLUMNS
+    assert table.schema.field("Latitude").type == pa.float64()
+    assert table.schema.field("Operator").type == pa.string()
+    assert table.column("Latitude").to_pylist() == [32.5, None]
+
+
 def test_export_invalid_format_raises(temp_db):
 
     with pytest.raises(ValueError):
         temp_db.export_data("dummy.out", format="xml")
+
+
+def test_record_outcomes_counts_attempts(temp_db):
+
+    temp_db.record_outcomes([("api-1", "error", "2026-01-01T00:00:00+00:00", "timeout")])
+    temp_db.record_outcomes([("api-1", "ok", "2026-01-02T00:00:00+00:00", None)])
+
+    metadata = temp_db.get_scrape_metadata("api-1")
+    assert metadata["outcome"] == "ok"
+    assert metadata["attempts"] == 2
+    assert metadata["last_error"] is None
+
+    assert temp_db.fresh_apis("2026-01-01T12:00:00+00:00") == {"api-1"}
+    assert temp_db.fresh_apis("2026-01-03T00:00:00+00:00") == set()
+    assert temp_db.failed_apis() == set()
+
+
+def spatial_index_ids(db):
+    return db.conn.execute(
+        f"SELECT id, min_lat, min_lon FROM {db.SPATIAL_INDEX_TABLE_NAME}"
+    ).fetchall()
+
+
+def test_spatial_index_tracks_inserts_updates_and_deletes(temp_db):
+
+    temp_db.insert(WellRecord(API="geo", Latitude=32.5, Longitude=-104.25))
+    temp_db.insert(WellRecord(API="no_geo"))
+    rowid = temp_db.conn.execute("SELECT rowid FROM api_well_data WHERE API = 'geo'").fetchone()[0]
+
+    assert [(row[0], round(row[1], 4), round(row[2], 4)) for row in spatial_index_ids(temp_db)] == [(rowid, 32.5, -104.25)]
+
+    # Re-inserting keeps the rowid and moves the indexed point
+    temp_db.insert(WellRecord(API="geo", Latitude=33.0, Longitude=-105.0))
+    assert [(row[0], round(row[1], 4)) for row in spatial_index_ids(temp_db)] == [(rowid, 33.0)]
+
+    temp_db.conn.execute("DELETE FROM api_well_data WHERE API = 'geo'")
+    assert spatial_index_ids(temp_db) == []
+
+
+def test_spatial_index_backfills_existing_rows():
+
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    db = WellDatabase(db_path)
+    db.insert(WellRecord(API="geo", Latitude=32.5, Longitude=-104.25))
+    db.conn.execute(f"DROP TABLE {db.SPATIAL_INDEX_TABLE_NAME}")
+    db.conn.commit()
+    db.conn.close()
+
+    db = WellDatabase(db_path)
+    assert len(spatial_index_ids(db)) == 1
+    db.conn.close()
+    os.unlink(db_path)
+
+
+def test_typed_values_migration_converts_existing_rows():
+
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    db = WellDatabase(db_path)
+    # Rows as older versions stored them, straight from the page text
+    db.insert_many([
+        WellRecord(API="30-015-00001", GL_Elevation="3,412", TVD="10450 ft", Spud_Date="07/26/1985", Last_Inspection="09/22/2020"),
+        WellRecord(API="30-015-00002", KB_Elevation="N/A", Spud_Date="Unknown", Last_Inspection="2021-01-05"),
+    ])
+    db.conn.execute("PRAGMA user_version = 0")
+    db.conn.commit()
+    db.conn.close()
+
+    db = WellDatabase(db_path)
+    first = db.get_by_api("30-015-00001")
+    assert (first.GL_Elevation, first.TVD, first.Spud_Date, first.Last_Inspection) == (3412.0, 10450.0, "1985-07-26", "2020-09-22")
+    second = db.get_by_api("30-015-00002")
+    assert (second.KB_Elevation, second.Spud_Date, second.Last_Inspection) == (None, None, "2021-01-05")
+    assert db.unparsed_values() == [("30-015-00002", "KB_Elevation", "N/A"), ("30-015-00002", "Spud_Date", "Unknown")]
+    assert db.search_wells(["API"], spud_date=("1985-01-01", "1985-12-31"), tvd=(10000, None)) == [("30-015-00001",)]
+
+    # Runs once per database
+    assert db._migrate_typed_values() == {}
+    db.conn.close()
+    os.unlink(db_path)
+
+
+def test_content_version_changes_with_well_data(temp_db):
+    version, _ = temp_db.content_version()
+    assert temp_db.content_version()[0] == version
+
+    temp_db.insert(WellRecord(API="30-015-00001"))
+    assert temp_db.content_version()[0] > version
+
+    # Another connection's commit is picked up through PRAGMA data_version
+    other = WellDatabase(temp_db.conn.execute("PRAGMA database_list").fetchone()[2])
+    before = temp_db.content_version()[0]
+    other.insert(WellRecord(API="30-015-00002"))
+    other.close()
+    assert temp_db.content_version()[0] > before
+
+
+def test_geo_change_log_records_map_visible_changes(temp_db, monkeypatch):
+    start = temp_db.geo_change_seq()
+
+    temp_db.insert(WellRecord(API="30-015-00001", Status="Active", Latitude=32.5, Longitude=-104.25))
+    temp_db.insert(WellRecord(API="30-015-00002"))
+    # Same location and classification: nothing a map shows changed
+    temp_db.insert(WellRecord(API="30-015-00001", Operator="New", Status="Active", Latitude=32.5, Longitude=-104.25))
+    # Moving a well logs both the old and the new position
+    temp_db.insert(WellRecord(API="30-015-00001", Status="Active", Latitude=33.0, Longitude=-104.25))
+
+    changes = temp_db.geo_changes_since(start)
+    assert [(lat, lon) for _, lat, lon in changes] == [(32.5, -104.25), (32.5, -104.25), (33.0, -104.25)]
+    assert temp_db.geo_change_seq() == changes[-1][0]
+    assert temp_db.geo_changes_since(changes[-1][0]) == []
+
+
+def test_geo_change_log_is_trimmed(temp_db):
+    temp_db.conn.execute(f"DROP TRIGGER {temp_db.GEO_CHANGES_TABLE_NAME}_trim")
+    temp_db.conn.execute(
+        f"""
+        CREATE TRIGGER {temp_db.GEO_CHANGES_TABLE_NAME}_trim AFTER INSERT ON {temp_db.GEO_CHANGES_TABLE_NAME}
+        BEGIN DELETE FROM {temp_db.GEO_CHANGES_TABLE_NAME} WHERE seq <= NEW.seq - 2; END
+        """
+    )
+    temp_db.insert_many([WellRecord(API=f"30-015-0000{i}", Latitude=32.0 + i, Longitude=-104.0) for i in range(5)])
+
+    assert len(temp_db.geo_changes_since(3)) == 2
+    # Readers behind the oldest kept change must start over
+    assert temp_db.geo_changes_since(0) is None
+
+
+def search_rows():
+    operators = ["Devon", "EOG", "Mewbourne"]
+    return [
+        WellRecord(
+            API=f"30-015-{i:05d}",
+            Operator=operators[i % 3],
+            Status="Active" if i % 2 else "Plugged",
+            Well_Type="Oil" if i % 5 else "Gas",
+            Work_Type="New",
+            Spud_Date=f"{2000 + i % 25}-{i % 12 + 1:02d}-15",
+            TVD=float(1000 + 50 * i),
+            Latitude=32.0 + i / 1000,
+            Longitude=-104.0,
+        )
+        for i in range(300)
+    ]
+
+
+@pytest.fixture
+def search_db(temp_db):
+    temp_db.insert_many(search_rows())
+    temp_db.conn.execute(f"ANALYZE {temp_db.TABLE_NAME}")
+    return temp_db
+
+
+def test_search_wells_filters_and_pages(search_db):
+    kwargs = dict(filters={"Operator": "EOG", "Status": "Active"}, spud_date=("2020-01-01", None), tvd=(None, 14000))
+    expected = [
+        f"30-015-{i:05d}" for i in range(300)
+        if i % 3 == 1 and i % 2 and 2000 + i % 25 >= 2020 and 1000 + 50 * i <= 14000
+    ]
+
+    apis, after = [], ""
+    while True:
+        page = search_db.search_wells(["API"], after=after, limit=2, **kwargs)
+        apis += [row[0] for row in page]
+        if len(page) < 2:
+            break
+        after = page[-1][0]
+
+    assert apis == expected
+
+    in_box = search_db.search_wells(["API"], bbox=(32.0, -104.1, 32.0105, -103.9), limit=100)
+    assert [row[0] for row in in_box] == [f"30-015-{i:05d}" for i in range(11)]
+
+    with pytest.raises(ValueError):
+        search_db.search_wells(filters={"CRS": "NAD83"})
+
+
+# Filter -> (search_wells arguments, index that can answer it)
+FILTERS = {
+    "Operator": (dict(filters={"Operator": "EOG"}), "idx_api_well_data_operator"),
+    "Status": (dict(filters={"Status": "Active"}), "idx_api_well_data_status"),
+    "Well_Type": (dict(filters={"Well_Type": "Gas"}), "idx_api_well_data_well_type"),
+    "Work_Type": (dict(filters={"Work_Type": "New"}), "idx_api_well_data_work_type"),
+    "spud_date": (dict(spud_date=("2020-01-01", "2021-12-31")), "idx_api_well_data_spud_date"),
+    "tvd": (dict(tvd=(5000, 6000)), "idx_api_well_data_tvd"),
+    "bbox": (dict(bbox=(32.0, -104.1, 32.05, -103.9)), "api_well_rtree"),
+}
+
+
+def _combine(names):
+    kwargs = {"filters": {}}
+    for name in names:
+        for key, value in FILTERS[name][0].items():
+            if key == "filters":
+                kwargs["filters"].update(value)
+            else:
+                kwargs[key] = value
+    return kwargs
+
+
+@pytest.mark.parametrize("size", range(len(FILTERS) + 1))
+def test_every_search_filter_combination_is_index_backed(search_db, size):
+    import itertools
+
+    for names in itertools.combinations(FILTERS, size):
+        sql, params = search_db._search_query(**_combine(names))
+        plan = [row[3] for row in search_db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+        # Never a full scan of the table, and every filtered query narrows
+        # through one of its filters' indexes (or the R*Tree)
+        assert not any(step.startswith(f"SCAN {search_db.TABLE_NAME}") for step in plan), (names, plan)
+        if names:
+            assert any(FILTERS[name][1] in step for name in names for step in plan), (names, plan)
+        else:
+            assert plan == [f"SEARCH {search_db.TABLE_NAME} USING INDEX sqlite_autoindex_{search_db.TABLE_NAME}_1 (API>?)"]
+
+
+def test_statistics_are_refreshed_once_the_table_fills():
+
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    # Created, and analyzed, while empty
+    db = WellDatabase(db_path)
+    db.insert_many(search_rows())
+    db.conn.close()
+
+    db = WellDatabase(db_path)
+    sql, params = db._search_query(**_combine(["Operator", "Work_Type"]))
+    plan = [row[3] for row in db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    assert any("idx_api_well_data_operator" in step for step in plan), plan
+    db.conn.close()
+    os.unlink(db_path)
+
+
+def test_text_search_is_ranked_prefix_aware_and_tracks_writes(temp_db):
+    temp_db.insert_many([
+        WellRecord(API="30-015-00001", Operator="[7377] EOG RESOURCES INC", Surface_Location="C-12-24S-28E"),
+        WellRecord(API="30-015-00002", Operator="[6137] DEVON ENERGY PRODUCTION COMPANY, LP", Surface_Location="D-7-24S-28E"),
+        WellRecord(API="30-015-00003", Operator="[6137] DEVON ENERGY PRODUCTION COMPANY, LP", Mineral_Owner="Federal"),
+    ])
+
+    assert [row[0] for row in temp_db.search_text("EOG res")] == ["30-015-00001"]
+    assert {row[0] for row in temp_db.search_text("devon")} == {"30-015-00002", "30-015-00003"}
+    assert [row[0] for row in temp_db.search_text("12-24s")] == ["30-015-00001"]
+    # Every word has to match, in any of the indexed columns
+    assert [row[0] for row in temp_db.search_text("devon fed")] == ["30-015-00003"]
+
+    temp_db.insert(WellRecord(API="30-015-00001", Operator="[14744] MEWBOURNE OIL CO"))
+    assert temp_db.search_text("eog") == []
+    assert [row[0] for row in temp_db.search_text("mewb")] == ["30-015-00001"]
+
+    temp_db.conn.execute("DELETE FROM api_well_data WHERE API = '30-015-00001'")
+    assert temp_db.search_text("mewb") == []
+
+
+def test_text_search_ranks_every_match(temp_db):
+    # Thousands of weak owner-only matches come before the operator match in rowid order
+    temp_db.insert_many([WellRecord(API=f"30-015-{i:05d}", Mineral_Owner="Devon Trust") for i in range(2100)])
+    temp_db.insert(WellRecord(API="30-025-00001", Operator="[6137] DEVON ENERGY PRODUCTION COMPANY, LP"))
+
+    results = temp_db.search_text("devon", limit=5)
+
+    assert results[0][0] == "30-025-00001"
+    assert len(results) == 5
+
+
+def test_text_query_quotes_words():
+    assert WellDatabase.text_query('EOG "res" OR x') == '"eog"* AND "res"* AND "or"* AND "x"'
+    with pytest.raises(ValueError):
+        WellDatabase.text_query(" -- ")
@@ -0,0 +1,40 @@
+from benchmarks.bench_extraction import extract_fields_bs4
+from benchmarks.pages import render_well_page
+from well_scraper.extraction import extract_fields
+from well_scraper.constants import WellFields
+
+
+FIELD_IDS = {"Operator": "op", "Status": "status", "TVD": "tvd"}
+
+
+def test_matches_bs4_on_synthetic_page():
+    html = render_well_page()
+    assert extract_fields(html) == extract_fields_bs4(html)
+
+
+def test_returns_every_field():
+    result = extract_fields(render_well_page())
+    assert set(result) == set(WellFields.FIELD_IDS)
+    assert result["Coordinates"] == "32.637764,-103.8775024 NAD83"
+    assert result["DF_Elevation"] is None
+
+
+def test_drops_nested_tags_and_strips_text():
+    html = '<span id="op"> Devon <b>ignored</b> Energy <br> </span><span id="status">&amp;Active</span>'
+    assert extract_fields(html, FIELD_IDS) == extract_fields_bs4(html, FIELD_IDS)
+    assert extract_fields(html, FIELD_IDS) == {"Operator": "DevonEnergy", "Status": "&Active", "TVD": None}
+
+
+def test_first_span_with_id_wins():
+    html = '<span id="op">First</span><span id="op">Second</span>'
+    assert extract_fields(html, FIELD_IDS)["Operator"] == "First"
+
+
+def test_unclosed_nested_tag_inside_span():
+    html = '<span id="op">Kept<i>dropped</span><span id="status">Active</span>'
+    assert extract_fields(html, FIELD_IDS) == extract_fields_bs4(html, FIELD_IDS)
+
+
+def test_ignores_non_span_elements_with_matching_id():
+    html = '<div id="op">Not a span</div>'
+    assert extract_fields(html, FIELD_IDS)["Operator"] is None
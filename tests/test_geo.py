@@ -0,0 +1,37 @@
+import math
+import numpy as np
+import pytest
+from well_scraper.geo import EARTH_RADIUS_M, bbox_around, haversine_m
+
+
+def test_haversine_known_distances():
+    # Carlsbad to Hobbs is roughly 106 km
+    distances = haversine_m(32.4207, -104.2288, [32.4207, 32.7026, None], [-104.2288, -103.1360, None])
+
+    assert distances[0] == 0
+    assert distances[1] == pytest.approx(106_000, rel=0.02)
+    assert math.isnan(distances[2])
+
+
+def test_haversine_one_degree_of_latitude():
+    assert haversine_m(32.0, -104.0, [33.0], [-104.0])[0] == pytest.approx(EARTH_RADIUS_M * math.pi / 180)
+
+
+def test_bbox_around_contains_the_circle():
+    lat, lon, radius = 32.5, -104.0, 5000
+    min_lat, min_lon, max_lat, max_lon = bbox_around(lat, lon, radius)
+
+    # Points on the circle all fall inside the box
+    bearings = np.radians(np.arange(0, 360, 1.0))
+    angle = radius / EARTH_RADIUS_M
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lats = np.arcsin(math.sin(lat1) * math.cos(angle) + math.cos(lat1) * math.sin(angle) * np.cos(bearings))
+    lons = lon1 + np.arctan2(
+        np.sin(bearings) * math.sin(angle) * math.cos(lat1), math.cos(angle) - math.sin(lat1) * np.sin(lats)
+    )
+    assert np.all((np.degrees(lats) >= min_lat - 1e-9) & (np.degrees(lats) <= max_lat + 1e-9))
+    assert np.all((np.degrees(lons) >= min_lon - 1e-9) & (np.degrees(lons) <= max_lon + 1e-9))
+
+
+def test_bbox_around_spans_all_longitudes_for_huge_radius():
+    assert bbox_around(32.5, -104.0, 15_000_000) == (-90.0, -180.0, 90.0, 180.0)
@@ -0,0 +1,131 @@
+import os
+from unittest.mock import patch, MagicMock
+import pytest
+
+from well_scraper.html_cache import HtmlCache
+from well_scraper.well_scraper import WellScraper
+from well_scraper.constants import WellFields
+from well_scraper.rate_limiter import RateGovernor
+
+
+PAGE = f'<span id="{WellFields.FIELD_IDS["Operator"]}">Cached Operator</span>'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HtmlCache(str(tmp_path), codec="gzip")
+    yield cache
+    cache.close()
+
+
+def test_put_and_get_round_trip(cache):
+    cache.put("api-1", PAGE, etag='"abc"', last_modified="Wed, 01 Jan 2026 00:00:00 GMT")
+
+    page = cache.get("api-1")
+    assert page.html == PAGE
+    assert page.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert cache.get("missing") is None
+
+
+def test_identical_pages_share_one_blob(cache):
+    cache.put("api-1", PAGE)
+    cache.put("api-2", PAGE)
+
+    stats = cache.stats()
+    assert stats["pages"] == 2
+    assert cache.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0] == 1
+
+
+def test_replacing_page_removes_orphaned_blob(cache):
+    cache.put("api-1", PAGE)
+    cache.put("api-1", PAGE + "<p>changed</p>")
+
+    assert cache.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0] == 1
+    blob_files = [name for _, _, files in os.walk(cache.blob_dir) for name in files]
+    assert len(blob_files) == 1
+
+
+def test_evicts_least_recently_used(cache):
+    cache.put("api-1", PAGE)
+    cache.max_bytes = cache.total_bytes + 5
+    cache.put("api-2", PAGE + "x")
+
+    assert cache.get("api-1") is None
+    assert cache.get("api-2").html == PAGE + "x"
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_hits_do_not_write_but_still_order_eviction(cache):
+    cache.put("api-1", PAGE)
+    cache.put("api-2", PAGE + "x")
+    changes = cache.conn.total_changes
+
+    assert cache.get("api-1").html == PAGE
+    assert cache.conn.total_changes == changes
+
+    # The hit on api-1 is written before eviction picks a victim, so api-2 goes
+    cache.max_bytes = cache.total_bytes + 5
+    cache.put("api-3", PAGE + "y")
+    assert cache.get("api-2") is None
+    assert cache.get("api-1").html == PAGE
+
+
+def test_lookup_respects_max_age(cache):
+    cache.put("api-1", PAGE)
+
+    cache.max_age = 3600
+    page, fresh = cache.lookup("api-1")
+    assert fresh and page.html == PAGE
+
+    cache.max_age = None
+    page, fresh = cache.lookup("api-1")
+    assert not fresh and page.html == PAGE
+    assert cache.stats()["hits"] == 1
+
+
+def make_scraper(cache):
+    governor = RateGovernor(initial_rate=1000, max_rate=1000, burst=1000, cooldown=0)
+    return WellScraper(max_retries=1, backoff_factor=0, governor=governor, cache=cache)
+
+
+@patch("well_scraper.well_scraper.requests.Session.get")
+def test_scraper_serves_fresh_pages_from_cache(mock_get, cache):
+    cache.max_age = 3600
+    cache.put("30-015-25325", PAGE)
+
+    data = make_scraper(cache).scrape_api("30-015-25325")
+
+    assert data["Operator"] == "Cached Operator"
+    mock_get.assert_not_called()
+
+
+@patch("well_scraper.well_scraper.requests.Session.get")
+def test_scraper_revalidates_stale_pages(mock_get, cache):
+    cache.put("30-015-25325", PAGE, etag='"v1"')
+
+    mock_response = MagicMock()
+    mock_response.status_code = 304
+    mock_response.text = ""
+    mock_get.return_value = mock_response
+
+    data = make_scraper(cache).scrape_api("30-015-25325")
+
+    assert data["Operator"] == "Cached Operator"
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert cache.stats()["revalidated"] == 1
+
+
+@patch("well_scraper.well_scraper.requests.Session.get")
+def test_scraper_stores_fetched_pages(mock_get, cache):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.text = PAGE
+    mock_response.headers = {"ETag": '"v2"'}
+    mock_get.return_value = mock_response
+
+    make_scraper(cache).scrape_api("30-015-25325")
+
+    assert cache.get("30-015-25325").etag == '"v2"'
@@ -0,0 +1,66 @@
+import urllib.request
+import pytest
+from well_scraper import metrics
+from well_scraper.metrics import Counter, Gauge, Histogram, Registry
+
+
+def test_registry_renders_prometheus_text():
+    registry = Registry()
+    counter = Counter("jobs_total", "Jobs.", ["result"], registry=registry)
+    gauge = Gauge("queue_depth", "Depth.", ["queue"], registry=registry)
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1), registry=registry)
+
+    counter.inc(result="ok")
+    counter.inc(2, result="ok")
+    gauge.set_function(lambda: 7, queue="writer")
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value)
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{result="ok"} 3' in text
+    assert 'queue_depth{queue="writer"} 7' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_count 3" in text
+    assert "latency_seconds_sum 5.55" in text
+
+
+def test_labels_are_validated_and_escaped():
+    registry = Registry()
+    counter = Counter("errors_total", "Errors.", ["reason"], registry=registry)
+
+    with pytest.raises(ValueError):
+        counter.inc(cause="x")
+    with pytest.raises(ValueError):
+        Counter("errors_total", "Duplicate.", registry=registry)
+
+    counter.inc(reason='say "hi"\n')
+    assert 'errors_total{reason="say \\"hi\\"\\n"} 1' in registry.render()
+
+
+def test_histogram_time_context_manager():
+    registry = Registry()
+    histogram = Histogram("block_seconds", "Block.", ["stage"], registry=registry)
+
+    with histogram.time(stage="parse"):
+        pass
+
+    assert histogram.count(stage="parse") == 1
+
+
+def test_start_http_server_serves_registry():
+    registry = Registry()
+    Counter("served_total", "Served.", registry=registry).inc()
+
+    server = metrics.start_http_server(0, host="127.0.0.1", registry=registry)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "served_total 1" in body
@@ -0,0 +1,117 @@
+import asyncio
+from well_scraper.rate_limiter import RateGovernor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reserve_paces_requests_at_rate():
+    clock = FakeClock()
+    governor = RateGovernor(initial_rate=2.0, burst=1, clock=clock)
+
+    assert governor.reserve() == 0.0
+    assert governor.reserve() == 0.5
+    assert governor.reserve() == 1.0
+
+    clock.now = 5.0
+    assert governor.reserve() == 0.0
+
+
+def test_success_raises_rate_up_to_max():
+    governor = RateGovernor(initial_rate=1.0, max_rate=2.0, increase_step=0.5, clock=FakeClock())
+
+    governor.on_success()
+    assert governor.rate == 1.5
+
+    for _ in range(10):
+        governor.on_success()
+    assert governor.rate == 2.0
+    assert governor.stats()["peak_rate"] == 2.0
+
+
+def test_rate_limit_halves_rate_once_per_cooldown():
+    clock = FakeClock()
+    governor = RateGovernor(initial_rate=8.0, cooldown=1.0, clock=clock)
+
+    governor.on_rate_limited()
+    governor.on_rate_limited()
+    assert governor.rate == 4.0
+
+    clock.now = 2.0
+    governor.on_rate_limited()
+    assert governor.rate == 2.0
+
+    stats = governor.stats()
+    assert stats["rate_limit_hits"] == 3
+    assert stats["last_limited_rate"] == 4.0
+
+
+def test_rate_limit_pauses_callers_for_cooldown():
+    clock = FakeClock()
+    governor = RateGovernor(initial_rate=4.0, burst=1, cooldown=1.0, clock=clock)
+
+    governor.on_rate_limited()
+    # Rate is now 2 req/s and the bucket owes one second of tokens
+    assert governor.reserve() == 1.5
+
+
+def test_acquire_sleeps_for_reserved_wait():
+    sleeps = []
+    governor = RateGovernor(initial_rate=1.0, burst=1, clock=FakeClock(), sleep=sleeps.append)
+
+    governor.acquire()
+    governor.acquire()
+    assert sleeps == [1.0]
+
+
+def test_shared_governor_is_singleton():
+    assert RateGovernor.shared() is RateGovernor.shared()
+
+
+
+def test_async_waiters_do_not_book_ahead():
+    clock = FakeClock()
+    governor = RateGovernor(initial_rate=1.0, burst=1, clock=clock)
+    governor.try_acquire()
+    waits = []
+
+    async def sleep(seconds):
+        waits.append(seconds)
+        await asyncio.Event().wait()
+
+    async def run():
+        tasks = [asyncio.create_task(governor.acquire_async(sleep)) for _ in range(1000)]
+        await asyncio.sleep(0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(run())
+
+    # Everyone waits for the next slot only, so a new rate applies on wake-up
+    assert len(waits) == 1000
+    assert max(waits) == 1.0
+
+
+def test_rate_limit_slows_requests_already_waiting():
+    clock = FakeClock()
+    governor = RateGovernor(initial_rate=10.0, burst=1, cooldown=1.0, clock=clock)
+    governor.try_acquire()
+    waits = []
+
+    async def sleep(seconds):
+        if not waits:
+            # The page arrives while this request is already waiting
+            governor.on_rate_limited()
+        waits.append(seconds)
+        clock.now += seconds
+
+    asyncio.run(governor.acquire_async(sleep))
+
+    assert waits[0] == 0.1
+    assert clock.now >= governor.cooldown
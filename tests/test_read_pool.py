@@ -0,0 +1,84 @@
+import asyncio
+import sqlite3
+import pytest
+from fastapi.testclient import TestClient
+
+import api_main
+from well_scraper.database import WellDatabase
+from well_scraper.models import WellRecord
+from well_scraper.read_pool import ReadConnectionPool, PoolTimeout
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "wells.db")
+    db = WellDatabase(path)
+    db.insert(WellRecord(API="30-015-25325", Operator="Pooled Operator"))
+    db.close()
+    return path
+
+
+def test_pool_connections_are_read_only(db_path):
+    pool = ReadConnectionPool(db_path, size=1)
+
+    with pool.connection() as db:
+        assert db.conn.execute("SELECT Operator FROM api_well_data").fetchone() == ("Pooled Operator",)
+        with pytest.raises(sqlite3.OperationalError):
+            db.conn.execute("DELETE FROM api_well_data")
+
+    pool.close()
+
+
+def test_pool_reuses_connections_and_times_out(db_path):
+    pool = ReadConnectionPool(db_path, size=1, timeout=0.01)
+
+    db = pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    pool.release(db)
+
+    assert pool.acquire() is db
+    pool.release(db)
+    pool.close()
+
+
+def test_pool_sees_new_writes(db_path):
+    pool = ReadConnectionPool(db_path, size=1)
+
+    writer = WellDatabase(db_path)
+    writer.insert(WellRecord(API="30-015-25327"))
+    writer.close()
+
+    with pool.connection() as db:
+        assert db.conn.execute("SELECT COUNT(*) FROM api_well_data").fetchone()[0] == 2
+    pool.close()
+
+
+def test_api_lifespan_serves_from_pool(db_path, monkeypatch):
+    monkeypatch.setattr(api_main, "DB_PATH", db_path)
+    monkeypatch.setattr(api_main, "DB_POOL_SIZE", 2)
+
+    with TestClient(api_main.app) as client:
+        response = client.get("/well/30-015-25325")
+        assert response.status_code == 200
+        assert response.json()["Operator"] == "Pooled Operator"
+        assert api_main.app.state.db_pool._pool.qsize() == 2
+
+
+def test_async_acquire_waits_on_event_loop(db_path):
+    pool = ReadConnectionPool(db_path, size=1, timeout=0.05)
+
+    async def scenario():
+        db = await pool.acquire_async()
+        with pytest.raises(PoolTimeout):
+            await pool.acquire_async()
+
+        # A waiter is served as soon as the connection comes back
+        waiter = asyncio.create_task(pool.acquire_async())
+        await asyncio.sleep(0)
+        pool.release_async(db)
+        assert await waiter is db
+        pool.release_async(db)
+
+    asyncio.run(scenario())
+    pool.close()
@@ -0,0 +1,128 @@
+import contextlib
+import threading
+import pytest
+from well_scraper import tiles
+from well_scraper.database import WellDatabase
+from well_scraper.models import WellRecord
+
+
+def test_tile_math_round_trips():
+    lat, lon = 32.4207, -104.2288
+    xs, ys = tiles.tile_xy([lat], [lon], 12)
+    min_lat, min_lon, max_lat, max_lon = tiles.tile_bounds(12, int(xs[0]), int(ys[0]))
+
+    assert min_lat <= lat < max_lat
+    assert min_lon <= lon < max_lon
+    assert tiles.tile_bounds(0, 0, 0)[1:3] == (-180.0, pytest.approx(tiles.MAX_LATITUDE))
+    assert tiles.quadkey(3, 3, 5) == "213"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = WellDatabase(str(tmp_path / "wells.db"))
+    db.insert_many([
+        WellRecord(API="30-015-00001", Status="Active", Well_Type="Oil", Latitude=32.40, Longitude=-104.20),
+        WellRecord(API="30-015-00002", Status="Plugged", Well_Type="Oil", Latitude=32.41, Longitude=-104.21),
+        WellRecord(API="30-045-00001", Status="Active", Latitude=36.70, Longitude=-108.20),
+    ])
+    yield db
+    db.close()
+
+
+def lend(db):
+    """Connection factory for TileCache that always lends ``db``."""
+    return lambda: contextlib.nullcontext(db)
+
+
+def test_low_zoom_merges_children_exactly(db):
+    cache = tiles.TileCache()
+    world = cache.clusters(lend(db), 0, 0, 0)
+
+    assert world["count"] == 3
+    # At zoom 3 cells the two Eddy wells and the San Juan well share one cell
+    assert len(world["clusters"]) == 1
+    cluster = world["clusters"][0]
+    assert cluster["status"] == {"Active": 2, "Plugged": 1}
+    assert cluster["well_type"] == {"Oil": 2, "Unknown": 1}
+    assert cluster["lat"] == pytest.approx((32.40 + 32.41 + 36.70) / 3)
+
+    # Zoomed in far enough, the two fields are separate clusters
+    xs, ys = tiles.tile_xy([32.4], [-104.2], 7)
+    tile = cache.clusters(lend(db), 7, int(xs[0]), int(ys[0]))
+    assert tile["count"] == 2
+
+
+def test_writes_evict_only_the_tiles_they_touch(db):
+    cache = tiles.TileCache()
+    cache.clusters(lend(db), 0, 0, 0)
+    (x, y) = (int(v[0]) for v in tiles.tile_xy([36.7], [-108.2], 10))
+    san_juan = (10, x, y)
+    assert san_juan in cache.tiles
+
+    db.insert(WellRecord(API="30-015-00003", Status="New", Latitude=32.42, Longitude=-104.22))
+    world = cache.clusters(lend(db), 0, 0, 0)
+
+    assert world["count"] == 4
+    assert world["clusters"][0]["status"]["New"] == 1
+    # The San Juan tile was reused rather than rebuilt
+    assert san_juan in cache.tiles
+
+
+def test_concurrent_cold_requests_build_once_without_holding_connections(db):
+    cache = tiles.TileCache()
+    lock = threading.Lock()
+    borrowed = [0]
+
+    @contextlib.contextmanager
+    def connection():
+        with lock:
+            borrowed[0] += 1
+        try:
+            yield db
+        finally:
+            with lock:
+                borrowed[0] -= 1
+
+    builds = []
+    build = cache._build
+    held_while_waiting = []
+
+    def slow_build(connection, z, x, y):
+        builds.append((z, x, y))
+        if z == 0:
+            # Every other request is now queued behind this build
+            threading.Event().wait(0.2)
+            held_while_waiting.append(borrowed[0])
+        return build(connection, z, x, y)
+
+    cache._build = slow_build
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.clusters(connection, 0, 0, 0))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8 and all(result == results[0] for result in results)
+    assert len(builds) == len(set(builds))
+    assert held_while_waiting == [0]
+
+
+def test_build_overlapping_a_write_is_not_cached(db):
+    cache = tiles.TileCache()
+    build = cache._build
+
+    def build_then_write(connection, z, x, y):
+        cells = build(connection, z, x, y)
+        if z == 0:
+            # A write lands and another request syncs before this build finishes
+            db.insert(WellRecord(API="30-015-00003", Latitude=32.42, Longitude=-104.22))
+            cache._sync(connection)
+        return cells
+
+    cache._build = build_then_write
+    assert cache.clusters(lend(db), 0, 0, 0)["count"] == 3
+    assert (0, 0, 0) not in cache.tiles
+
+    cache._build = build
+    assert cache.clusters(lend(db), 0, 0, 0)["count"] == 4
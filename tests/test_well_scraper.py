@@ -1,7 +1,15 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
 import requests
+from well_scraper import metrics
 from well_scraper.well_scraper import WellScraper
 from well_scraper.constants import WellFields
+from well_scraper.rate_limiter import RateGovernor
+
+
+def fast_governor():
+    return RateGovernor(initial_rate=1000, max_rate=1000, burst=1000, cooldown=0)
 
 
 def test_parse_lat_lon_crs_valid():
@@ -19,9 +27,9 @@ def test_parse_lat_lon_crs_invalid():
     assert crs is None
 
 
-@patch("well_scraper.well_scraper.requests.get")
+@patch("well_scraper.well_scraper.requests.Session.get")
 def test_scrape_api_success(mock_get):
-    scraper = WellScraper(max_retries=1, backoff_factor=0)
+    scraper = WellScraper(max_retries=1, backoff_factor=0, governor=fast_governor())
 
     coord_id = WellFields.FIELD_IDS["Coordinates"]
 
@@ -39,9 +47,9 @@ def test_scrape_api_success(mock_get):
 
     mock_get.return_value = mock_response
 
-    data = scraper.scrape_api("test_api")
+    data = scraper.scrape_api("30-015-25325")
 
-    assert data["API"] == "test_api"
+    assert data["API"] == "30-015-25325"
     assert data["Latitude"] == 35.123
     assert data["Longitude"] == -106.456
     assert data["CRS"] == "NAD83"
@@ -49,10 +57,66 @@ def test_scrape_api_success(mock_get):
     assert data["Status"] == "Active"
 
 
-@patch("well_scraper.well_scraper.requests.get")
+@patch("well_scraper.well_scraper.requests.Session.get")
 def test_scrape_api_failure(mock_get):
-    scraper = WellScraper(max_retries=1, backoff_factor=0)
+    scraper = WellScraper(max_retries=1, backoff_factor=0, governor=fast_governor())
     mock_get.side_effect = requests.RequestException("Network error")
 
-    data = scraper.scrape_api("test_api")
+    data = scraper.scrape_api("30-015-25325")
     assert data is None
+
+
+@patch("well_scraper.well_scraper.requests.Session.get")
+def test_scrape_api_gives_up_when_rate_limited(mock_get):
+    scraper = WellScraper(max_retries=2, backoff_factor=0, governor=fast_governor())
+
+    mock_response = MagicMock()
+    mock_response.text = WellScraper.RATE_LIMIT_TEXT
+    mock_get.return_value = mock_response
+
+    hits = metrics.RATE_LIMIT_HITS.value()
+    retries = metrics.RETRIES.value(reason="rate_limited")
+    gave_up = metrics.FETCHES.value(result="rate_limited")
+
+    assert scraper.scrape_api("30-015-25325") is None
+    assert mock_get.call_count == 2
+    assert metrics.RATE_LIMIT_HITS.value() - hits == 2
+    # Only the first attempt was followed by another one
+    assert metrics.RETRIES.value(reason="rate_limited") - retries == 1
+    assert metrics.FETCHES.value(result="rate_limited") - gave_up == 1
+
+
+def test_session_pool_reuses_connections():
+    page = f'<span id="{WellFields.FIELD_IDS["Operator"]}">Pooled Operator</span>'.encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    scraper = WellScraper(max_retries=1, backoff_factor=0, pool_size=1, governor=fast_governor())
+    scraper.BASE_URL = f"http://127.0.0.1:{server.server_port}/?api={{}}"
+    try:
+        for api in ("30-015-25325", "30-015-25327", "30-015-25330"):
+            assert scraper.scrape_api(api)["Operator"] == "Pooled Operator"
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+    stats = scraper.connection_stats()
+    assert stats["connections_opened"] == 1
+    assert stats["requests_sent"] == 3
+    assert stats["reused_requests"] == 2
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import threading
+import pytest
+
+from well_scraper.database import WellDatabase
+from well_scraper.models import WellRecord
+from well_scraper.writer import BatchWriter
+
+
+@pytest.fixture
+def temp_db():
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    db = WellDatabase(db_path)
+    yield db
+    db.conn.close()
+    os.unlink(db_path)
+
+
+def count_rows(db):
+    return db.conn.execute("SELECT COUNT(*) FROM api_well_data").fetchone()[0]
+
+
+def test_database_uses_wal(temp_db):
+    assert temp_db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_insert_many(temp_db):
+    temp_db.insert_many([WellRecord(API=f"api-{i}") for i in range(10)])
+    assert count_rows(temp_db) == 10
+
+
+def test_writer_batches_by_size(temp_db):
+    batches = []
+    writer = BatchWriter(temp_db, batch_size=4, flush_interval=60, on_written=batches.append)
+
+    with writer:
+        for i in range(10):
+            writer.put(WellRecord(API=f"api-{i}"))
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert count_rows(temp_db) == 10
+    assert writer.records_written == 10
+
+
+def test_writer_flushes_after_interval(temp_db):
+    written = threading.Event()
+    writer = BatchWriter(temp_db, batch_size=1000, flush_interval=0.05, on_written=lambda batch: written.set())
+
+    with writer:
+        writer.put(WellRecord(API="api-1"))
+        assert written.wait(timeout=5)
+        assert writer.batches_written == 1
+
+
+def test_writer_reports_failed_batches(temp_db):
+    failures = []
+    writer = BatchWriter(temp_db, on_error=lambda batch, e: failures.append((len(batch), e)))
+    temp_db.conn.close()
+
+    with writer:
+        writer.put(WellRecord(API="api-1"))
+
+    assert len(failures) == 1
+    assert failures[0][0] == 1
@@ -0,0 +1,42 @@
+# ============================
+# well_scraper/api_numbers.py
+# ============================
+import re
+
+# New Mexico's state code; every well the OCD site knows starts with it
+STATE_CODE = "30"
+
+_SEPARATORS = re.compile(r"[\s\-.]")
+# ASCII only: str.isdigit() also accepts superscripts and fullwidth digits
+_DIGITS = re.compile(r"[0-9]+")
+
+
+class InvalidApiNumber(ValueError):
+    """Raised for strings that are not a New Mexico API well number."""
+
+
+def normalize_api(raw) -> str:
+    """
+    Return the canonical ``SS-CCC-WWWWW`` form of an API well number.
+
+    Accepts the dashed form (30-015-25325), bare 10 digits (3001525325) and
+    the 12/14-digit forms that append a sidetrack and event code
+    (30-015-25325-00-00). Sidetrack and event codes identify the same well,
+    so they are dropped.
+
+    Raises:
+        InvalidApiNumber: If ``raw`` is not a 10, 12 or 14 digit NM API number.
+    """
+    digits = _SEPARATORS.sub("", str(raw))
+    if not _DIGITS.fullmatch(digits) or len(digits) not in (10, 12, 14):
+        raise InvalidApiNumber(f"Not an API number: {raw!r}")
+    if not digits.startswith(STATE_CODE):
+        raise InvalidApiNumber(f"Not a New Mexico API number (state code {digits[:2]}): {raw!r}")
+    return f"{digits[:2]}-{digits[2:5]}-{digits[5:10]}"
+
+
+def api_key(api: str) -> int:
+    """
+    Compact integer key for a canonical API number, for large de-duplication sets.
+    """
+    return int(api.replace("-", ""))
@@ -1,105 +1,557 @@
 # ======================
 # well_scraper/app.py
 # ======================
+import asyncio
+import concurrent.futures
+import contextlib
 import csv
+import gzip
+import io
 import logging
-import concurrent.futures
+import os
+import queue
+import sys
 import threading
 import time
+from datetime import datetime, timedelta, timezone
+from . import metrics
+from .converters import convert_fields
+from .api_numbers import InvalidApiNumber, api_key, normalize_api
+from .constants import ScrapeOutcome
 from .well_scraper import WellScraper
+from .async_scraper import AsyncWellScraper, AdaptiveConcurrencyLimiter
+from .rate_limiter import RateGovernor
 from .database import WellDatabase
+from .writer import BatchWriter
+from .html_cache import HtmlCache
 from .models import WellRecord
 
 
+def _timed_parse(api, html):
+    """
+    Parse a page in a pool process and report how long it took; metrics
+    recorded inside the child process would be lost.
+    """
+    start = time.perf_counter()
+    data = WellScraper.parse_page(api, html)
+    return data, time.perf_counter() - start
+
+
 class ScraperApp:
-    def __init__(self, csv_path, db_path, multithread=False, threads=5):
+    # full: scrape everything; incremental: skip APIs fetched within the TTL;
+    # retry_failed: only APIs whose last attempt failed; resume: continue the
+    # last unfinished job for the same input file
+    RUN_MODES = ("full", "incremental", "retry_failed", "resume")
+    # Input path that means "read the CSV from standard input"
+    STDIN_PATH = "-"
+
+    def __init__(self, csv_path, db_path, multithread=False, threads=5,
+                 use_async=False, max_concurrency=1000, initial_rate=1.0, max_rate=20.0,
+                 batch_size=500, flush_interval=1.0, mode="full", ttl=7 * 24 * 3600,
+                 cache_dir=None, cache_max_age=None, cache_max_bytes=1024 ** 3, parse_workers=0,
+                 progress_interval=0, metrics_port=None):
         """
         Initialize the ScraperApp with paths and options.
 
         Args:
-            csv_path (str): Path to the CSV file containing API numbers.
+            csv_path (str): Path to the CSV file containing API numbers (optionally gzipped), or "-" for stdin.
             db_path (str): Path to the SQLite database file.
             multithread (bool): Whether to use multithreading for scraping.
             threads (int): Number of threads to use if multithreaded.
+            use_async (bool): Whether to scrape from a single asyncio event loop.
+            max_concurrency (int): Upper bound on in-flight requests in async mode.
+            initial_rate (float): Starting request rate (requests/second) for the governor.
+            max_rate (float): Ceiling the governor may raise the request rate to.
+            batch_size (int): Maximum records the writer commits per transaction.
+            flush_interval (float): Maximum seconds a scraped record waits before being written.
+            mode (str): One of RUN_MODES.
+            ttl (float): Seconds a successful or not-found result stays fresh in incremental mode.
+            cache_dir (str): Directory for the raw HTML cache, None to disable caching.
+            cache_max_age (float): Seconds a cached page is reused without revalidation.
+            cache_max_bytes (int): Compressed size budget of the HTML cache.
+            parse_workers (int): Processes that parse fetched pages, 0 to parse in the fetching thread.
+            progress_interval (float): Seconds between progress/ETA log lines, 0 to disable.
+            metrics_port (int): Serve Prometheus metrics on this port during the run, None to disable.
         """
+        if mode not in self.RUN_MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.RUN_MODES)}")
+
         self.csv_path = csv_path
-        self.scraper = WellScraper()
+        # Every request from every worker is paced by this one governor
+        self.governor = RateGovernor(initial_rate=initial_rate, max_rate=max_rate)
+        self.cache = HtmlCache(cache_dir, max_bytes=cache_max_bytes, max_age=cache_max_age) if cache_dir else None
+        # One pooled keep-alive connection per worker thread
+        self.scraper = WellScraper(pool_size=threads if multithread else 1, governor=self.governor, cache=self.cache)
         self.db = WellDatabase(db_path)
+        # Scraper workers only enqueue; this thread owns all database writes
+        self.writer = BatchWriter(
+            self.db,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            on_written=self._on_written,
+            on_error=self._on_write_error,
+        )
         self.multithread = multithread
         self.threads = threads
+        self.use_async = use_async
+        self.max_concurrency = max_concurrency
+        self.mode = mode
+        self.ttl = ttl
+        self.parse_workers = parse_workers
+        self.parse_pool = None
+        self.parse_slots = None
+        self.parse_pending = 0
+        self.progress_interval = progress_interval
+        self.metrics_port = metrics_port
+        self._input_raw = None
+        self._input_size = None
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
         self.inserted = 0
         self.errors = 0
         self.skipped = 0
+        self.not_found = 0
+        self.already_done = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.queued = 0
         self.lock = threading.Lock()
 
     def _process_api(self, api):
         """
-        Process a single API: scrape data and insert into database.
+        Process a single API: scrape data and queue it for the database writer.
+        With a parse pool, only fetch here and hand the page to the pool.
+        """
+        try:
+            if self.parse_pool is None:
+                data = self.scraper.scrape_api(api)
+                self._enqueue(api, data)
+                return
+
+            html = self.scraper.fetch_page(api)
+            if html is None:
+                self._enqueue(api, None)
+                return
+            self._submit_parse(api, html)
+
+        except Exception as e:
+            self._record_error(api, e)
+            self.logger.exception(f"Unhandled error processing {api}: {e}")
+
+    @contextlib.contextmanager
+    def _parse_stage(self):
+        """
+        Run the parse stage in its own process pool for the duration of a run.
+
+        Leaving the context waits for every submitted page, so all results
+        reach the writer before it is closed.
+        """
+        if not self.parse_workers:
+            yield
+            return
+
+        self.parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.parse_workers)
+        # Bounds pages held in memory while waiting for a parser
+        self.parse_slots = threading.BoundedSemaphore(self.parse_workers * 4)
+        try:
+            yield
+        finally:
+            self.parse_pool.shutdown(wait=True)
+            self.parse_pool = None
+            self.logger.info(f"Parse pool of {self.parse_workers} processes shut down")
+
+    def _submit_parse(self, api, html):
+        """
+        Queue a fetched page for the parse pool, blocking while it is saturated.
         """
+        self.parse_slots.acquire()
         try:
-            data = self.scraper.scrape_api(api)
+            future = self.parse_pool.submit(_timed_parse, api, html)
+        except Exception:
+            self.parse_slots.release()
+            raise
+        with self.lock:
+            self.parse_pending += 1
+        future.add_done_callback(lambda f: self._on_parsed(api, f))
+
+    def _on_parsed(self, api, future):
+        """
+        Parse pool callback: pass the parsed page on to the writer.
+        """
+        self.parse_slots.release()
+        with self.lock:
+            self.parse_pending -= 1
+        try:
+            data, elapsed = future.result()
+            metrics.PARSE_SECONDS.observe(elapsed)
+        except Exception as e:
+            self._record_error(api, e)
+            self.logger.exception(f"Failed to parse page for {api}: {e}")
+            return
+        self._enqueue(api, data)
+
+    def _record_error(self, api, error):
+        """
+        Count a failed API and remember the failure for retry_failed runs.
+        """
+        with self.lock:
+            self.errors += 1
+        metrics.APIS.inc(outcome="error")
+        self.writer.put_outcome(api, ScrapeOutcome.ERROR, str(error))
 
+    @staticmethod
+    def _is_missing_well(data):
+        """
+        A page for an unknown API parses to nothing but the API itself.
+        """
+        return all(value is None for key, value in data.items() if key != "API")
+
+    def _enqueue(self, api, data):
+        """
+        Convert scraped data for a single API and hand it to the writer.
+        """
+        try:
             if not data:
-                with self.lock:
-                    self.errors += 1
+                self._record_error(api, "No data scraped")
                 self.logger.warning(f"No data scraped for {api}")
                 return
 
-            # Convert scraped dict -> WellRecord dataclass
-            record = WellRecord(**data)
+            if self._is_missing_well(data):
+                # Cache the negative result so incremental runs skip it too
+                with self.lock:
+                    self.not_found += 1
+                metrics.APIS.inc(outcome="not_found")
+                self.writer.put_outcome(api, ScrapeOutcome.NOT_FOUND)
+                self.logger.warning(f"No well found for {api}")
+                return
 
-            self.db.insert(record)
+            # Numbers and dates arrive as page text; store them typed so
+            # range filters and sorts run in SQLite
+            data, unparsed = convert_fields(data)
+            for field, value in unparsed.items():
+                metrics.UNPARSED_VALUES.inc(field=field)
+                self.logger.warning(f"Could not parse {field} {value!r} for {api}, storing NULL")
 
-            with self.lock:
-                self.inserted += 1
+            # Convert scraped dict -> WellRecord dataclass
+            record = WellRecord(**data)
 
-            self.logger.info(f"Inserted {api}")
+            self.writer.put(record)
 
         except TypeError as e:
             # Usually indicates mismatch between scraped keys and WellRecord fields
-            with self.lock:
-                self.errors += 1
+            self._record_error(api, e)
             self.logger.exception(f"Data schema error for API {api} (likely mismatched fields): {e}")
 
         except Exception as e:
-            with self.lock:
-                self.errors += 1
+            self._record_error(api, e)
             self.logger.exception(f"Unhandled error processing {api}: {e}")
 
-    def run(self):
+    def _plan_run(self):
         """
-        Run the scraping process: read APIs from CSV, process them,
-        and print summary.
+        Work out which job this run belongs to and which APIs still need fetching.
+
+        Resuming replays the interrupted job's own plan, from its mode and
+        start time, minus every API it already settled.
+
+        Returns:
+            tuple: (job_id, should_scrape) where should_scrape(api) -> bool
+        """
+        mode = self.mode
+        if mode == "resume":
+            job = self.db.latest_unfinished_job(self.csv_path)
+            if job:
+                planned = self._work_set(job["mode"], job["started_at"])
+                # Everything the interrupted job already settled is the checkpoint
+                done = self.db.fresh_apis(job["started_at"])
+                self.logger.info(
+                    f"Resuming {job['mode']} job {job['job_id']} from {job['started_at']}: {len(done)} APIs already done"
+                )
+                return job["job_id"], lambda api: api not in done and planned(api)
+            self.logger.warning(f"No unfinished job for {self.csv_path}, starting a full run")
+            mode = "full"
+
+        should_scrape = self._work_set(mode, self.db.utc_now())
+        return self.db.start_job(self.csv_path, mode), should_scrape
+
+    def _work_set(self, mode, started_at):
         """
-        apis = []
+        Return should_scrape(api) for a job of ``mode`` started at ``started_at``.
 
-        with open(self.csv_path, newline="", encoding="utf-8-sig") as f:
+        Args:
+            mode (str): One of RUN_MODES except "resume".
+            started_at (str): ISO-8601 start time of the job; incremental jobs
+                skip APIs fetched within ``ttl`` before it.
+        """
+        if mode == "incremental":
+            since = (datetime.fromisoformat(started_at) - timedelta(seconds=self.ttl)).isoformat(timespec="seconds")
+            done = self.db.fresh_apis(since)
+            self.logger.info(f"Incremental run: {len(done)} APIs fetched since {since} will be skipped")
+            return lambda api: api not in done
+
+        if mode == "retry_failed":
+            # Retries the job settled are no longer failures, the rest still are
+            failed = self.db.failed_apis()
+            self.logger.info(f"Retrying {len(failed)} previously failed APIs")
+            return lambda api: api in failed
+
+        return lambda api: True
+
+    @contextlib.contextmanager
+    def _open_input(self):
+        """
+        Open the input CSV as text: stdin for "-", transparently gunzipping
+        files that start with the gzip magic number.
+        """
+        if self.csv_path == self.STDIN_PATH:
+            f = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", newline="")
+            try:
+                yield f
+            finally:
+                f.detach()  # leave sys.stdin open
+            return
+
+        with open(self.csv_path, "rb") as raw:
+            # The raw file position against its size drives the progress ETA
+            self._input_raw, self._input_size = raw, os.fstat(raw.fileno()).st_size
+            binary = gzip.GzipFile(fileobj=raw) if raw.peek(2)[:2] == b"\x1f\x8b" else raw
+            try:
+                with io.TextIOWrapper(binary, encoding="utf-8-sig", newline="") as f:
+                    yield f
+            finally:
+                self._input_raw = None
+
+    def _iter_apis(self, should_scrape):
+        """
+        Lazily yield the canonical APIs to scrape from the input CSV,
+        counting skipped, invalid and duplicate rows as it goes.
+        """
+        seen = set()
+        with self._open_input() as f:
             reader = csv.DictReader(f)
             for row_num, row in enumerate(reader, start=2):
-                api = row.get("api") or row.get("API")
-                if api and api.strip():
-                    apis.append(api.strip())
-                else:
+                raw = row.get("api") or row.get("API")
+                if not raw or not raw.strip():
                     self.skipped += 1
+                    metrics.APIS.inc(outcome="skipped")
                     self.logger.warning(f"Skipping row {row_num}: missing API")
+                    continue
 
-        total_apis = len(apis) + self.skipped
+                try:
+                    api = normalize_api(raw)
+                except InvalidApiNumber as e:
+                    self.invalid += 1
+                    metrics.APIS.inc(outcome="invalid")
+                    self.logger.warning(f"Skipping row {row_num}: {e}")
+                    continue
 
-        if self.multithread:
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.threads
-            ) as executor:
-                for api in apis:
-                    executor.submit(self._process_api, api)
-        else:
-            for api in apis:
+                # Integer keys keep the seen-set small on multi-million row inputs
+                key = api_key(api)
+                if key in seen:
+                    self.duplicates += 1
+                    metrics.APIS.inc(outcome="duplicate")
+                    continue
+                seen.add(key)
+
+                if should_scrape(api):
+                    self.queued += 1
+                    yield api
+                else:
+                    self.already_done += 1
+                    metrics.APIS.inc(outcome="already_done")
+
+    def _run_threads(self, apis):
+        """
+        Feed APIs to a fixed set of worker threads through a bounded queue.
+
+        The reader blocks while the queue is full, so memory stays constant
+        however long the input is.
+        """
+        work = queue.Queue(maxsize=self.threads * 2)
+        metrics.QUEUE_DEPTH.set_function(work.qsize, queue="work")
+
+        def worker():
+            while True:
+                api = work.get()
+                if api is None:
+                    return
                 self._process_api(api)
-                time.sleep(1) # This is about as fast as I can go without hammering the server
+
+        workers = [threading.Thread(target=worker, name=f"Scraper-{i}", daemon=True) for i in range(self.threads)]
+        for thread in workers:
+            thread.start()
+        try:
+            for api in apis:
+                work.put(api)
+        finally:
+            for _ in workers:
+                work.put(None)
+            for thread in workers:
+                thread.join()
+            metrics.QUEUE_DEPTH.set_function(None, queue="work")
+
+    def _input_fraction(self):
+        """
+        Fraction of the input file read so far, or None when it cannot be known (stdin).
+        """
+        raw = self._input_raw
+        if raw is None or not self._input_size:
+            return None
+        try:
+            return min(raw.tell() / self._input_size, 1.0)
+        except (OSError, ValueError):
+            return None
+
+    def _report_progress(self, stop, started):
+        """
+        Log a progress line with throughput and an ETA every progress_interval seconds.
+        """
+        while not stop.wait(self.progress_interval):
+            elapsed = time.monotonic() - started
+            with self.lock:
+                done = self.inserted + self.not_found + self.errors
+            line = f"Progress: {done} APIs done ({done / elapsed:.1f}/s)"
+
+            fraction = self._input_fraction()
+            if fraction:
+                eta = elapsed * (1 - fraction) / fraction
+                line += f", {fraction:.1%} of input read, ETA {timedelta(seconds=round(eta))}"
+            line += f", writer queue {self.writer.queue.qsize()}, parse pending {self.parse_pending}"
+            self.logger.info(line)
+
+    def run(self):
+        """
+        Run the scraping process: stream APIs from the CSV, process them,
+        and print summary.
+        """
+        job_id, should_scrape = self._plan_run()
+        apis = self._iter_apis(should_scrape)
+
+        metrics.QUEUE_DEPTH.set_function(self.writer.queue.qsize, queue="writer")
+        metrics.QUEUE_DEPTH.set_function(lambda: self.parse_pending, queue="parse")
+        metrics_server = metrics.start_http_server(self.metrics_port) if self.metrics_port else None
+        stop_progress = threading.Event()
+        if self.progress_interval:
+            threading.Thread(
+                target=self._report_progress, args=(stop_progress, time.monotonic()), name="Progress", daemon=True
+            ).start()
+
+        try:
+            # Closing the writer flushes whatever is still queued; the parse
+            # stage is drained first so its results make it in
+            with self.writer, self._parse_stage():
+                if self.use_async:
+                    asyncio.run(self._run_async(apis))
+                elif self.multithread:
+                    self._run_threads(apis)
+                else:
+                    for api in apis:
+                        self._process_api(api)
+        finally:
+            stop_progress.set()
+            metrics.QUEUE_DEPTH.set_function(None, queue="writer")
+            metrics.QUEUE_DEPTH.set_function(None, queue="parse")
+            if metrics_server is not None:
+                metrics_server.shutdown()
+                metrics_server.server_close()
+
+        self.db.finish_job(job_id)
+        total_apis = self.queued + self.skipped + self.already_done + self.invalid + self.duplicates
+
+        if not self.use_async:
+            stats = self.scraper.connection_stats()
+            self.logger.info(
+                f"HTTP connections opened: {stats['connections_opened']}, "
+                f"requests sent: {stats['requests_sent']}, "
+                f"reused: {stats['reused_requests']}"
+            )
+        self.scraper.close()
 
         print(f"Total APIs in CSV: {total_apis}")
         print(f"Skipped (missing API): {self.skipped}")
+        print(f"Skipped (invalid API): {self.invalid}")
+        print(f"Duplicates collapsed (fetches saved): {self.duplicates}")
+        print(f"Skipped (already scraped): {self.already_done}")
         print(f"Successfully inserted: {self.inserted}")
+        print(f"Not found: {self.not_found}")
         print(f"Errors/Issues: {self.errors}")
+
+        if self.cache is not None:
+            cache_stats = self.cache.stats()
+            print(
+                f"HTML cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated (304), "
+                f"{cache_stats['pages']} pages / {cache_stats['bytes'] / 1024 ** 2:.1f} MB"
+            )
+            self.cache.close()
+
+        rate_stats = self.governor.stats()
+        print(
+            f"Request rate: {rate_stats['rate']:.2f} req/s "
+            f"(peak {rate_stats['peak_rate']:.2f}, rate limit hits: {rate_stats['rate_limit_hits']})"
+        )
+
+    def _on_written(self, records):
+        """
+        Writer callback: count records once they are committed.
+        """
+        with self.lock:
+            self.inserted += len(records)
+        metrics.APIS.inc(len(records), outcome="inserted")
+
+        for record in records:
+            self.logger.info(f"Inserted {record.API}")
+
+    def _on_write_error(self, records, error):
+        """
+        Writer callback: count every record in a failed batch as an error.
+        """
+        with self.lock:
+            self.errors += len(records)
+        metrics.APIS.inc(len(records), outcome="error")
+
+    async def _process_api_async(self, scraper, api):
+        """
+        Async counterpart of _process_api.
+        """
+        try:
+            if self.parse_pool is None:
+                data = await scraper.scrape_api(api)
+            else:
+                html = await scraper.fetch_page(api)
+                data = None
+                if html is not None:
+                    # Live tasks are already capped, so no parse slot is needed
+                    data, elapsed = await asyncio.wrap_future(self.parse_pool.submit(_timed_parse, api, html))
+                    metrics.PARSE_SECONDS.observe(elapsed)
+            self._enqueue(api, data)
+
+        except Exception as e:
+            self._record_error(api, e)
+            self.logger.exception(f"Unhandled error processing {api}: {e}")
+
+    async def _run_async(self, apis):
+        """
+        Scrape all APIs from one event loop, letting the adaptive limiter
+        decide how many requests are in flight at once.
+        """
+        limiter = AdaptiveConcurrencyLimiter(max_limit=self.max_concurrency)
+        pending = set()
+
+        async with AsyncWellScraper(
+            max_retries=self.scraper.max_retries,
+            backoff_factor=self.scraper.backoff_factor,
+            limiter=limiter,
+            governor=self.governor,
+            cache=self.cache,
+        ) as scraper:
+            for api in apis:
+                # Tasks sleeping in backoff do not hold a limiter slot, so cap
+                # the number of live tasks separately
+                if len(pending) >= self.max_concurrency:
+                    _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.add(asyncio.create_task(self._process_api_async(scraper, api)))
+
+            if pending:
+                await asyncio.wait(pending)
+
+        self.logger.info(f"Async run finished with concurrency limit {limiter.limit:.0f}")
@@ -0,0 +1,263 @@
+# ===============================
+# well_scraper/async_scraper.py
+# ===============================
+import asyncio
+import functools
+import logging
+import time
+import httpx
+from . import metrics
+from .api_numbers import normalize_api
+from .well_scraper import WellScraper
+from .rate_limiter import RateGovernor
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on the number of in-flight requests.
+
+    The limit grows by one for every clean response that comes back within
+    ``latency_tolerance`` times the best latency seen so far, shrinks gently
+    when latency climbs past that, and is halved on every rate limit page.
+    """
+
+    def __init__(self, initial_limit=10, min_limit=1, max_limit=1000,
+                 latency_tolerance=2.0, backoff_ratio=0.9, rate_limit_ratio=0.5):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit (int): Starting number of concurrent requests.
+            min_limit (int): Lower bound for the limit.
+            max_limit (int): Upper bound for the limit.
+            latency_tolerance (float): Multiple of the baseline latency above which the limit shrinks.
+            backoff_ratio (float): Multiplier applied when latency is above tolerance.
+            rate_limit_ratio (float): Multiplier applied when a rate limit page is seen.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.rate_limit_ratio = rate_limit_ratio
+
+        self.limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self.in_flight = 0
+        self.baseline_latency = None
+        self._condition = None
+
+    def _get_condition(self):
+        # Created lazily so the limiter binds to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """
+        Wait until a request slot is available and take it.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, latency=None, rate_limited=False):
+        """
+        Return a request slot and adjust the limit from the observed outcome.
+
+        Args:
+            latency (float): Seconds the request took, or None if it failed.
+            rate_limited (bool): Whether the response was a rate limit page.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+
+            if rate_limited:
+                self.limit = max(self.min_limit, self.limit * self.rate_limit_ratio)
+            elif latency is not None:
+                if self.baseline_latency is None or latency < self.baseline_latency:
+                    self.baseline_latency = latency
+
+                if latency <= self.baseline_latency * self.latency_tolerance:
+                    self.limit = min(self.max_limit, self.limit + 1)
+                else:
+                    self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+
+            condition.notify_all()
+
+
+class AsyncWellScraper:
+    """
+    Event loop based counterpart of WellScraper.
+
+    Shares the page parsing, rate limit detection and RateGovernor of
+    WellScraper but issues requests through a single httpx.AsyncClient, with
+    the number of in-flight requests governed by an AdaptiveConcurrencyLimiter.
+    """
+
+    BASE_URL = WellScraper.BASE_URL
+    RATE_LIMIT_TEXT = WellScraper.RATE_LIMIT_TEXT
+
+    def __init__(self, max_retries=5, backoff_factor=1, limiter=None, client=None, timeout=30,
+                 governor=None, cache=None):
+        """
+        Initialize the AsyncWellScraper.
+
+        Args:
+            max_retries (int): Maximum number of retries for failed requests.
+            backoff_factor (int): Base factor for exponential backoff on HTTP errors.
+            limiter (AdaptiveConcurrencyLimiter): Concurrency limiter, one is created if omitted.
+            client (httpx.AsyncClient): Optional client to use instead of creating one.
+            timeout (int): Request timeout in seconds.
+            governor (RateGovernor): Request pacer, defaults to the process-wide one.
+            cache (HtmlCache): Optional raw page cache used for repeat and conditional requests.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.limiter = limiter or AdaptiveConcurrencyLimiter()
+        self.governor = governor or RateGovernor.shared()
+        self.cache = cache
+        self.timeout = timeout
+        self.client = client
+        self._owns_client = client is None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def __aenter__(self):
+        if self.client is None:
+            limits = httpx.Limits(
+                max_connections=self.limiter.max_limit,
+                max_keepalive_connections=self.limiter.max_limit,
+            )
+            self.client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the underlying HTTP client if this scraper created it.
+        """
+        if self.client is not None and self._owns_client:
+            await self.client.aclose()
+            self.client = None
+
+    async def _fetch(self, url, headers=None):
+        """
+        Fetch a URL while holding a limiter slot, once the governor allows it.
+
+        Returns:
+            tuple: (response, rate_limited)
+        """
+        await self.limiter.acquire()
+        # Only a completed response feeds latency back into the limit; errors
+        # and cancellation just give the slot back
+        latency, rate_limited = None, False
+        try:
+            # The token is taken last, right before sending, so requests queued
+            # for a slot never spend tokens and leave in a burst. Waiting is
+            # unbooked, so a rate limit page slows requests already waiting.
+            await self.governor.acquire_async()
+            start = time.monotonic()
+            resp = await self.client.get(url, headers=headers)
+            elapsed = time.monotonic() - start
+            rate_limited = self.RATE_LIMIT_TEXT in resp.text
+            latency = elapsed
+        finally:
+            await self.limiter.release(latency, rate_limited)
+
+        metrics.FETCH_SECONDS.observe(latency, client="async")
+
+        if rate_limited:
+            self.governor.on_rate_limited()
+            metrics.RATE_LIMIT_HITS.inc()
+        elif resp.is_success or resp.status_code == 304:
+            self.governor.on_success()
+        return resp, rate_limited
+
+    @staticmethod
+    async def _in_thread(function, *args, **kwargs):
+        # Cache calls do SQLite queries, compression and file I/O; run them in
+        # the default executor so other fetches keep going meanwhile
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(function, *args, **kwargs))
+
+    async def scrape_api(self, api_number):
+        """
+        Scrape well data for a given API number.
+
+        Raises:
+            InvalidApiNumber: If api_number cannot be normalized.
+        """
+        api_number = normalize_api(api_number)
+        html = await self.fetch_page(api_number)
+        if html is None:
+            return None
+
+        with metrics.PARSE_SECONDS.time():
+            return WellScraper.parse_page(api_number, html)
+
+    async def fetch_page(self, api_number):
+        """
+        Fetch the raw WellDetails HTML for an API number, or None on failure.
+        Uses the cache the same way as WellScraper.fetch_page.
+        """
+        url = self.BASE_URL.format(api_number)
+
+        cached = None
+        if self.cache is not None:
+            cached, fresh = await self._in_thread(self.cache.lookup, api_number)
+            if fresh:
+                metrics.FETCHES.inc(result="cache_hit")
+                return cached.html
+
+        headers = cached.conditional_headers() if cached else None
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                resp, rate_limited = await self._fetch(url, headers)
+
+                if rate_limited:
+                    if attempt < self.max_retries:
+                        metrics.RETRIES.inc(reason="rate_limited")
+                    self.logger.warning(f"Rate limit page detected for {api_number}, retry {attempt}/{self.max_retries}")
+                    continue
+
+                if resp.status_code == 304 and cached:
+                    await self._in_thread(self.cache.touch, api_number)
+                    metrics.FETCHES.inc(result="not_modified")
+                    return cached.html
+
+                resp.raise_for_status()
+
+                if attempt > 1:
+                    self.logger.info(f"Retry succeeded for {api_number} on attempt {attempt}")
+
+                break
+
+            except httpx.HTTPError as e:
+                if attempt >= self.max_retries:
+                    metrics.FETCHES.inc(result="failed")
+                    self.logger.error(f"Failed {api_number} after {attempt} attempts: {e}")
+                    return None
+
+                metrics.RETRIES.inc(reason="http_error")
+                wait = self.backoff_factor * (2 ** (attempt - 1))
+                self.logger.warning(f"HTTP error for {api_number} (attempt {attempt}), sleeping {wait}s: {e}")
+                await asyncio.sleep(wait)
+        else:
+            metrics.FETCHES.inc(result="rate_limited")
+            self.logger.error(f"Giving up on {api_number}: still rate limited after {self.max_retries} attempts")
+            return None
+
+        metrics.FETCHES.inc(result="ok")
+        if self.cache is not None:
+            await self._in_thread(
+                self.cache.put,
+                api_number,
+                resp.text,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+
+        return resp.text
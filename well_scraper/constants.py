@@ -28,4 +28,16 @@ class WellFields:
 
         # Location / Coordinates
         "Coordinates": "ctl00_ctl00__main_main_ucGeneralWellInformation_Location_lblCoordinates",
-    }
\ No newline at end of file
+    }
+
+
+class ScrapeOutcome:
+    """
+    Outcome values recorded per API in the scrape metadata table.
+    """
+    OK = "ok"
+    NOT_FOUND = "not_found"
+    ERROR = "error"
+
+    # Outcomes that are worth caching; errors are always retried
+    FINAL = (OK, NOT_FOUND)
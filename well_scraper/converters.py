@@ -0,0 +1,94 @@
+# ===========================
+# well_scraper/converters.py
+# ===========================
+import re
+from datetime import date, datetime
+
+# Scraped fields stored as REAL and as ISO-8601 (YYYY-MM-DD) TEXT
+NUMERIC_FIELDS = ("GL_Elevation", "KB_Elevation", "DF_Elevation", "TVD")
+DATE_FIELDS = ("Spud_Date", "Last_Inspection")
+
+# "3412", "3,412", "-12.5", "3412 ft", "3,412 ft.", "10450'", "10450 feet"
+_NUMBER = re.compile(r"([-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|[-+]?\.\d+)\s*(?:ft\.?|feet|')?", re.IGNORECASE)
+
+# Formats seen on the site, with an optional time part that is dropped
+_DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%m-%d-%Y")
+# Earlier years are typos or two-digit years ("07/26/85")
+MIN_YEAR = 1800
+_TIME_SUFFIX = re.compile(r"[ T]\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AP]M)?$", re.IGNORECASE)
+
+
+def _blank(text) -> bool:
+    return text is None or (isinstance(text, str) and not text.strip())
+
+
+def parse_number(text) -> float:
+    """
+    Parse a scraped number such as "3,412" or "10450 ft" into a float.
+
+    Returns:
+        float: The value, or None for blank text.
+
+    Raises:
+        ValueError: If ``text`` is not blank and not a number.
+    """
+    if _blank(text):
+        return None
+    if isinstance(text, (int, float)):
+        return float(text)
+    match = _NUMBER.fullmatch(text.strip())
+    if match is None:
+        raise ValueError(f"Not a number: {text!r}")
+    return float(match.group(1).replace(",", ""))
+
+
+def parse_date(text) -> str:
+    """
+    Parse a scraped date such as "07/26/1985" into ISO-8601 "1985-07-26".
+
+    Returns:
+        str: The date as YYYY-MM-DD, or None for blank text.
+
+    Raises:
+        ValueError: If ``text`` is not blank and not a date.
+    """
+    if _blank(text):
+        return None
+    if isinstance(text, (date, datetime)):
+        return text.strftime("%Y-%m-%d")
+    value = _TIME_SUFFIX.sub("", text.strip())
+    for fmt in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if parsed.year >= MIN_YEAR:
+            return parsed.strftime("%Y-%m-%d")
+    raise ValueError(f"Not a date: {text!r}")
+
+
+def convert_fields(data: dict):
+    """
+    Convert the numeric and date fields of a scraped well to their stored types.
+
+    Values that cannot be converted become None, so a column never mixes
+    numbers with text, and are returned so the caller can report them.
+
+    Args:
+        data (dict): Field -> value as scraped; other fields pass through.
+
+    Returns:
+        tuple: (converted dict, {field: raw text} of the values that did not parse)
+    """
+    converted = dict(data)
+    unparsed = {}
+    for fields, parse in ((NUMERIC_FIELDS, parse_number), (DATE_FIELDS, parse_date)):
+        for field in fields:
+            if field not in data:
+                continue
+            try:
+                converted[field] = parse(data[field])
+            except ValueError:
+                converted[field] = None
+                unparsed[field] = data[field]
+    return converted, unparsed
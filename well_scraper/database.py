@@ -1,11 +1,15 @@
 # ==========================
 # well_scraper/database.py
 # ==========================
+import re
 import sqlite3
-import csv
-import json
 import logging
+from pathlib import Path
 from dataclasses import asdict
+from datetime import datetime, timezone
+from . import exporters
+from .converters import DATE_FIELDS, NUMERIC_FIELDS, convert_fields
+from .constants import ScrapeOutcome
 from .models import WellRecord
 from typing import Optional
 
@@ -16,6 +20,17 @@ class WellDatabase:
     """
 
     TABLE_NAME = "api_well_data"
+    SPATIAL_INDEX_TABLE_NAME = "api_well_rtree"
+    METADATA_TABLE_NAME = "scrape_metadata"
+    JOBS_TABLE_NAME = "scrape_jobs"
+    VERSION_TABLE_NAME = "api_well_version"
+    GEO_CHANGES_TABLE_NAME = "api_well_geo_changes"
+    TEXT_INDEX_TABLE_NAME = "api_well_fts"
+    UNPARSED_TABLE_NAME = "api_well_unparsed"
+    # Rows kept in the geo change log; readers further behind start over
+    GEO_CHANGE_LOG_SIZE = 100000
+    # PRAGMA user_version once numbers and dates are stored typed
+    TYPED_VALUES_VERSION = 1
 
     # Single source of truth for DB column order
     COLUMNS = [
@@ -42,13 +57,67 @@ class WellDatabase:
         "CRS",
     ]
 
-    def __init__(self, db_path: str):
+    # Columns search_wells() filters on by equality, each with an index that
+    # also orders by API so a filtered page needs no sort
+    SEARCH_COLUMNS = ["Operator", "Status", "Well_Type", "Work_Type"]
+    # Free-text columns indexed for search_text(), with their bm25 weights
+    TEXT_COLUMNS = {"Operator": 4.0, "Surface_Location": 2.0, "Mineral_Owner": 1.0, "Surface_Owner": 1.0}
+
+    # Connection tuning: WAL lets readers run alongside the writer, NORMAL
+    # sync is crash-safe under WAL and only fsyncs at checkpoints
+    PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,  # 64 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        # Fire delete triggers for rows removed by REPLACE conflicts as well
+        "recursive_triggers": "ON",
+    }
+
+    # Read-only connections never write, so they skip schema setup and map
+    # the database file into memory instead
+    READ_ONLY_PRAGMAS = {
+        "query_only": "ON",
+        "mmap_size": 256 * 1024 ** 2,
+        "cache_size": -16000,  # 16 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }
+
+    def __init__(self, db_path: str, read_only: bool = False):
         """
         Initialize the WellDatabase with a SQLite database path.
+
+        Args:
+            db_path (str): Path to the SQLite database file.
+            read_only (bool): Open with mode=ro and query_only, without creating tables.
         """
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.read_only = read_only
+        if read_only:
+            uri = f"{Path(db_path).absolute().as_uri()}?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._version_cache = None
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._create_table()
+        self._configure_connection()
+        if not read_only:
+            self._create_table()
+
+    def _configure_connection(self):
+        """
+        Apply PRAGMAS (or READ_ONLY_PRAGMAS) to the connection.
+        """
+        pragmas = self.READ_ONLY_PRAGMAS if self.read_only else self.PRAGMAS
+        for name, value in pragmas.items():
+            self.conn.execute(f"PRAGMA {name} = {value}")
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self.conn.close()
 
     def _create_table(self):
         """
@@ -81,65 +150,749 @@ class WellDatabase:
             )
             """
         )
+        self._create_spatial_index()
+        self._create_version_table()
+        self._create_geo_change_log()
+        self._migrate_typed_values()
+        self._create_search_indexes()
+        self._create_text_index()
+
+        # Per-API fetch bookkeeping for incremental and resumable runs
+        self.conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.METADATA_TABLE_NAME} (
+                API TEXT PRIMARY KEY,
+                last_fetched TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT
+            )
+            """
+        )
+        self.conn.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{self.METADATA_TABLE_NAME}_outcome
+            ON {self.METADATA_TABLE_NAME} (outcome, last_fetched)
+            """
+        )
+        self.conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.JOBS_TABLE_NAME} (
+                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                input_path TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                finished_at TEXT
+            )
+            """
+        )
         self.conn.commit()
         self.logger.info("Database table 'api_well_data' ensured.")
 
-    def insert(self, record: WellRecord):
+    def _migrate_typed_values(self, batch_size=10000):
         """
-        Insert or replace a WellRecord into the database safely.
+        Convert numbers and dates stored as page text by older versions, once
+        per database (tracked in PRAGMA user_version).
+
+        Values that do not parse are set to NULL and their original text is
+        kept in api_well_unparsed.
+
+        Args:
+            batch_size (int): Rows updated per executemany call.
+
+        Returns:
+            dict: Field -> number of values that could not be parsed.
         """
-        record_dict = asdict(record)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] >= self.TYPED_VALUES_VERSION:
+            return {}
 
-        # Align data strictly to DB columns
-        values = [record_dict.get(col) for col in self.COLUMNS]
-        placeholders = ",".join("?" for _ in self.COLUMNS)
+        table = self.TABLE_NAME
+        fields = [*NUMERIC_FIELDS, *DATE_FIELDS]
+        # Only rows with a text number or a date that is not already ISO need work
+        iso = "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+        stale = [f"typeof({field}) = 'text'" for field in NUMERIC_FIELDS]
+        stale += [f"{field} NOT GLOB {iso}" for field in DATE_FIELDS]
+        select = (
+            f"SELECT rowid, {', '.join(fields)} FROM {table} "
+            f"WHERE rowid > ? AND ({' OR '.join(stale)}) ORDER BY rowid LIMIT ?"
+        )
+        update = f"UPDATE {table} SET {', '.join(f'{field} = ?' for field in fields)} WHERE rowid = ?"
+        counts = {}
+        migrated = 0
+        with self.conn:
+            self.conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.UNPARSED_TABLE_NAME} (
+                    API TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    value TEXT,
+                    PRIMARY KEY (API, field)
+                )
+                """
+            )
+            # The old expression index over MM/DD/YYYY text; recreated on Spud_Date
+            self.conn.execute(f"DROP INDEX IF EXISTS idx_{table}_spud_date")
+
+            last = 0
+            while True:
+                rows = self.conn.execute(select, (last, batch_size)).fetchall()
+                if not rows:
+                    break
+                last = rows[-1][0]
+                updates, unparsed = [], []
+                for rowid, *values in rows:
+                    converted, failed = convert_fields(dict(zip(fields, values)))
+                    updates.append([converted[field] for field in fields] + [rowid])
+                    unparsed += [(rowid, field, str(value)) for field, value in failed.items()]
+                    for field in failed:
+                        counts[field] = counts.get(field, 0) + 1
+                self.conn.executemany(update, updates)
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.UNPARSED_TABLE_NAME} (API, field, value) "
+                    f"SELECT API, ?, ? FROM {table} WHERE rowid = ?",
+                    [(field, value, rowid) for rowid, field, value in unparsed],
+                )
+                migrated += len(rows)
+
+            self.conn.execute(f"PRAGMA user_version = {self.TYPED_VALUES_VERSION}")
+
+        if migrated:
+            self.logger.info(f"Converted numbers and dates in {migrated} rows of {table}")
+        for field, count in counts.items():
+            self.logger.warning(f"{count} {field} values could not be parsed, see {self.UNPARSED_TABLE_NAME}")
+        return counts
+
+    def unparsed_values(self) -> list:
+        """
+        Return (API, field, original text) for every value the typed-values
+        migration could not parse.
+        """
+        if not self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.UNPARSED_TABLE_NAME,)
+        ).fetchone():
+            return []
+        return self.conn.execute(f"SELECT API, field, value FROM {self.UNPARSED_TABLE_NAME} ORDER BY API, field").fetchall()
+
+    def _create_search_indexes(self):
+        """
+        Create the secondary indexes behind search_wells(). Databases created
+        before they existed get them the first time they are opened for writing.
+        """
+        table = self.TABLE_NAME
+        indexes = {f"idx_{table}_{column.lower()}": f"{column}, API" for column in self.SEARCH_COLUMNS}
+        indexes[f"idx_{table}_spud_date"] = "Spud_Date"
+        indexes[f"idx_{table}_tvd"] = "TVD"
+
+        existing = {row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        missing = [name for name in indexes if name not in existing]
+        for name in missing:
+            self.logger.info(f"Creating index {name}")
+            self.conn.execute(f"CREATE INDEX {name} ON {table} ({indexes[name]})")
+        if missing or self._statistics_stale():
+            # Statistics let the planner pick the most selective index, e.g.
+            # Operator over Work_Type, when several filters are combined
+            self.conn.execute(f"ANALYZE {table}")
+
+    def _statistics_stale(self, growth=2):
+        """
+        Whether api_well_data has grown past ``growth`` times the row count
+        its last ANALYZE recorded, or has rows and was never analyzed (a
+        database analyzed while empty records nothing).
+        """
+        table = self.TABLE_NAME
+        # max(rowid) estimates the row count without scanning the table
+        rows = self.conn.execute(f"SELECT max(rowid) FROM {table}").fetchone()[0] or 0
+        if not rows:
+            return False
+        analyzed = 0
+        if self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone():
+            # The first number of each stat is the row count of the index
+            analyzed = self.conn.execute(
+                "SELECT max(CAST(stat AS INTEGER)) FROM sqlite_stat1 WHERE tbl = ?", (table,)
+            ).fetchone()[0] or 0
+        return rows > growth * analyzed
+
+    def _create_text_index(self):
+        """
+        Create the FTS5 index over TEXT_COLUMNS and the triggers that keep it
+        in sync with api_well_data, rebuilding it on first creation.
+
+        It is an external-content table: it stores only the index and reads
+        the text back from api_well_data by rowid.
+        """
+        table = self.TABLE_NAME
+        fts = self.TEXT_INDEX_TABLE_NAME
+        columns = ", ".join(self.TEXT_COLUMNS)
+        old = ", ".join(f"OLD.{column}" for column in self.TEXT_COLUMNS)
+        new = ", ".join(f"NEW.{column}" for column in self.TEXT_COLUMNS)
+        changed = " OR ".join(f"OLD.{column} IS NOT NEW.{column}" for column in self.TEXT_COLUMNS)
+
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        ).fetchone()
+
+        # Prefix indexes make "dev*" style queries a range lookup
+        self.conn.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {columns}, content='{table}', content_rowid='rowid', prefix='2 3 4'
+            )
+            """
+        )
+        self.conn.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO {fts} (rowid, {columns}) VALUES (NEW.rowid, {new});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {columns} ON {table}
+            WHEN {changed}
+            BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', OLD.rowid, {old});
+                INSERT INTO {fts} (rowid, {columns}) VALUES (NEW.rowid, {new});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table}
+            BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', OLD.rowid, {old});
+            END;
+            """
+        )
+
+        if not exists:
+            # Column weights for the rank column that search_text() orders by
+            weights = ", ".join(str(weight) for weight in self.TEXT_COLUMNS.values())
+            self.conn.execute(f"INSERT INTO {fts} ({fts}, rank) VALUES ('rank', 'bm25({weights})')")
+            self.logger.info(f"Building full-text index {fts}")
+            self.conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+    def _create_spatial_index(self):
+        """
+        Create the R*Tree over well locations and the triggers that keep it
+        in sync with api_well_data, backfilling it on first creation.
+
+        Each well is a degenerate box keyed by its api_well_data rowid.
+        """
+        table = self.TABLE_NAME
+        rtree = self.SPATIAL_INDEX_TABLE_NAME
+
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (rtree,)
+        ).fetchone()
+
+        self.conn.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+        )
+        self.conn.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {rtree}_insert AFTER INSERT ON {table}
+            WHEN NEW.Latitude IS NOT NULL AND NEW.Longitude IS NOT NULL
+            BEGIN
+                INSERT OR REPLACE INTO {rtree} VALUES (NEW.rowid, NEW.Latitude, NEW.Latitude, NEW.Longitude, NEW.Longitude);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {rtree}_update AFTER UPDATE OF Latitude, Longitude ON {table}
+            WHEN OLD.Latitude IS NOT NEW.Latitude OR OLD.Longitude IS NOT NEW.Longitude
+            BEGIN
+                DELETE FROM {rtree} WHERE id = OLD.rowid;
+                INSERT INTO {rtree}
+                SELECT NEW.rowid, NEW.Latitude, NEW.Latitude, NEW.Longitude, NEW.Longitude
+                WHERE NEW.Latitude IS NOT NULL AND NEW.Longitude IS NOT NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {rtree}_delete AFTER DELETE ON {table}
+            BEGIN
+                DELETE FROM {rtree} WHERE id = OLD.rowid;
+            END;
+            """
+        )
+
+        if not exists:
+            self.conn.execute(
+                f"""
+                INSERT INTO {rtree}
+                SELECT rowid, Latitude, Latitude, Longitude, Longitude FROM {table}
+                WHERE Latitude IS NOT NULL AND Longitude IS NOT NULL
+                """
+            )
+            self.logger.info(f"Spatial index '{rtree}' created and backfilled.")
+
+    def _create_version_table(self):
+        """
+        Create the single-row content version that triggers bump on every
+        change to api_well_data. HTTP validators (ETag/Last-Modified) are
+        derived from it.
+        """
+        table = self.TABLE_NAME
+        version = self.VERSION_TABLE_NAME
+        bump = f"""
+                UPDATE {version}
+                SET version = version + 1, updated_at = strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')
+                WHERE id = 1;
+        """
+
+        self.conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {version} (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            f"INSERT OR IGNORE INTO {version} (id, version, updated_at) VALUES (1, 0, ?)", (self.utc_now(),)
+        )
+        self.conn.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {version}_insert AFTER INSERT ON {table}
+            BEGIN {bump} END;
+
+            CREATE TRIGGER IF NOT EXISTS {version}_update AFTER UPDATE ON {table}
+            BEGIN {bump} END;
+
+            CREATE TRIGGER IF NOT EXISTS {version}_delete AFTER DELETE ON {table}
+            BEGIN {bump} END;
+            """
+        )
+
+    def _create_geo_change_log(self):
+        """
+        Create the log of positions where map-visible well data changed.
+
+        Triggers append the old and new location of every inserted, moved,
+        re-classified (Status, Well_Type) or deleted well, and trim the log to
+        GEO_CHANGE_LOG_SIZE rows. Tile caches read it to invalidate only the
+        tiles those positions fall in.
+        """
+        table = self.TABLE_NAME
+        changes = self.GEO_CHANGES_TABLE_NAME
+
+        def log(row):
+            return f"""
+                INSERT INTO {changes} (lat, lon)
+                SELECT {row}.Latitude, {row}.Longitude
+                WHERE {row}.Latitude IS NOT NULL AND {row}.Longitude IS NOT NULL;
+            """
+
+        self.conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {changes} (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                lat REAL NOT NULL,
+                lon REAL NOT NULL
+            )
+            """
+        )
+        self.conn.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {changes}_insert AFTER INSERT ON {table}
+            BEGIN {log("NEW")} END;
+
+            CREATE TRIGGER IF NOT EXISTS {changes}_update
+            AFTER UPDATE OF Latitude, Longitude, Status, Well_Type ON {table}
+            WHEN OLD.Latitude IS NOT NEW.Latitude OR OLD.Longitude IS NOT NEW.Longitude
+                OR OLD.Status IS NOT NEW.Status OR OLD.Well_Type IS NOT NEW.Well_Type
+            BEGIN {log("OLD")} {log("NEW")} END;
+
+            CREATE TRIGGER IF NOT EXISTS {changes}_delete AFTER DELETE ON {table}
+            BEGIN {log("OLD")} END;
 
-        sql = f"""
-            INSERT OR REPLACE INTO {self.TABLE_NAME}
+            CREATE TRIGGER IF NOT EXISTS {changes}_trim AFTER INSERT ON {changes}
+            BEGIN
+                DELETE FROM {changes} WHERE seq <= NEW.seq - {self.GEO_CHANGE_LOG_SIZE};
+            END;
+            """
+        )
+
+    def geo_change_seq(self) -> int:
+        """
+        Return the sequence number of the latest geo change, 0 if there is none.
+        """
+        row = self.conn.execute(f"SELECT MAX(seq) FROM {self.GEO_CHANGES_TABLE_NAME}").fetchone()
+        return row[0] or 0
+
+    def geo_changes_since(self, seq: int) -> Optional[list]:
+        """
+        Return the (seq, lat, lon) changes logged after ``seq``, oldest first.
+
+        Returns:
+            list: The changes, or None if the log was trimmed past ``seq`` and
+            the caller has to assume everything changed.
+        """
+        table = self.GEO_CHANGES_TABLE_NAME
+        rows = self.conn.execute(f"SELECT seq, lat, lon FROM {table} WHERE seq > ? ORDER BY seq", (seq,)).fetchall()
+        if rows and rows[0][0] > seq + 1:
+            return None
+        return rows
+
+    def content_version(self):
+        """
+        Return (version, updated_at) of the well data.
+
+        The row is only re-read when PRAGMA data_version or this connection's
+        own change count says the database changed since the last call, so
+        repeated calls cost one pragma.
+        """
+        key = (self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes)
+        if self._version_cache is None or self._version_cache[0] != key:
+            row = self.conn.execute(
+                f"SELECT version, updated_at FROM {self.VERSION_TABLE_NAME} WHERE id = 1"
+            ).fetchone()
+            self._version_cache = (key, row)
+        return self._version_cache[1]
+
+    @staticmethod
+    def utc_now():
+        """
+        Current UTC time as an ISO-8601 string, the format used for all metadata timestamps.
+        """
+        return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    def _insert_sql(self):
+        # Upsert rather than REPLACE so an existing well keeps its rowid and
+        # the spatial index only changes when the location does
+        placeholders = ",".join("?" for _ in self.COLUMNS)
+        updates = ",".join(f"{col} = excluded.{col}" for col in self.COLUMNS if col != "API")
+        return f"""
+            INSERT INTO {self.TABLE_NAME}
             ({",".join(self.COLUMNS)})
             VALUES ({placeholders})
+            ON CONFLICT(API) DO UPDATE SET {updates}
         """
 
-        self.conn.execute(sql, values)
+    def _record_values(self, record: WellRecord):
+        record_dict = asdict(record)
+
+        # Align data strictly to DB columns
+        return [record_dict.get(col) for col in self.COLUMNS]
+
+    def insert(self, record: WellRecord):
+        """
+        Insert or replace a WellRecord into the database safely.
+        """
+        self.conn.execute(self._insert_sql(), self._record_values(record))
         self.conn.commit()
 
         self.logger.debug(f"Inserted/Updated record for API {record.API}")
 
-    def export_data(self, output_path, format="csv"):
+    def insert_many(self, records, outcomes=()):
         """
-        Export all well data to CSV or JSON format.
+        Insert or replace many WellRecords in a single transaction.
+
+        Args:
+            records (list): WellRecords to write.
+            outcomes (list): Optional (API, outcome, fetched_at, error) tuples
+                recorded in scrape_metadata within the same transaction.
         """
-        cursor = self.conn.cursor()
-        cursor.execute(f"SELECT * FROM {self.TABLE_NAME}")
-        rows = cursor.fetchall()
+        rows = [self._record_values(record) for record in records]
 
-        if format.lower() == "csv":
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(self.COLUMNS)
-                writer.writerows(rows)
-            self.logger.info(f"Exported {len(rows)} rows to CSV: {output_path}")
-
-        elif format.lower() == "json":
-            self.conn.row_factory = sqlite3.Row
-            cursor = self.conn.cursor()
-            cursor.execute(f"SELECT * FROM {self.TABLE_NAME}")
-            rows = cursor.fetchall()
-            data = [dict(row) for row in rows]
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-
-            self.logger.info(f"Exported {len(data)} rows to JSON: {output_path}")
+        with self.conn:
+            self.conn.executemany(self._insert_sql(), rows)
+            if outcomes:
+                self.conn.executemany(self._outcome_sql(), outcomes)
+
+        self.logger.debug(f"Inserted/Updated {len(rows)} records, {len(outcomes)} outcomes")
+
+    def _outcome_sql(self):
+        return f"""
+            INSERT INTO {self.METADATA_TABLE_NAME} (API, outcome, last_fetched, last_error, attempts)
+            VALUES (?, ?, ?, ?, 1)
+            ON CONFLICT(API) DO UPDATE SET
+                outcome = excluded.outcome,
+                last_fetched = excluded.last_fetched,
+                last_error = excluded.last_error,
+                attempts = attempts + 1
+        """
+
+    def record_outcomes(self, outcomes):
+        """
+        Record scrape outcomes as (API, outcome, fetched_at, error) tuples.
+        """
+        with self.conn:
+            self.conn.executemany(self._outcome_sql(), outcomes)
+
+    def get_scrape_metadata(self, api: str) -> Optional[dict]:
+        """
+        Return the scrape metadata row for an API, or None if it was never fetched.
+        """
+        cursor = self.conn.execute(
+            f"SELECT API, last_fetched, outcome, attempts, last_error FROM {self.METADATA_TABLE_NAME} WHERE API = ?",
+            (api,),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return dict(zip([d[0] for d in cursor.description], row))
 
+    def fresh_apis(self, since: str) -> set:
+        """
+        APIs with a final outcome (found or confirmed missing) fetched at or after ``since``.
+        """
+        placeholders = ",".join("?" for _ in ScrapeOutcome.FINAL)
+        cursor = self.conn.execute(
+            f"""
+            SELECT API FROM {self.METADATA_TABLE_NAME}
+            WHERE outcome IN ({placeholders}) AND last_fetched >= ?
+            """,
+            (*ScrapeOutcome.FINAL, since),
+        )
+        return {row[0] for row in cursor}
+
+    def failed_apis(self) -> set:
+        """
+        APIs whose most recent scrape attempt failed.
+        """
+        cursor = self.conn.execute(
+            f"SELECT API FROM {self.METADATA_TABLE_NAME} WHERE outcome = ?",
+            (ScrapeOutcome.ERROR,),
+        )
+        return {row[0] for row in cursor}
+
+    def start_job(self, input_path: str, mode: str) -> int:
+        """
+        Record the start of a scrape job and return its ID.
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                f"INSERT INTO {self.JOBS_TABLE_NAME} (input_path, mode, started_at) VALUES (?, ?, ?)",
+                (input_path, mode, self.utc_now()),
+            )
+        return cursor.lastrowid
+
+    def finish_job(self, job_id: int):
+        """
+        Mark a scrape job as finished.
+        """
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE {self.JOBS_TABLE_NAME} SET finished_at = ? WHERE job_id = ?",
+                (self.utc_now(), job_id),
+            )
+
+    def latest_unfinished_job(self, input_path: str) -> Optional[dict]:
+        """
+        Return the most recent unfinished job for ``input_path``, or None.
+        """
+        cursor = self.conn.execute(
+            f"""
+            SELECT job_id, input_path, mode, started_at FROM {self.JOBS_TABLE_NAME}
+            WHERE input_path = ? AND finished_at IS NULL
+            ORDER BY job_id DESC LIMIT 1
+            """,
+            (input_path,),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return dict(zip([d[0] for d in cursor.description], row))
+
+    def column_types(self, columns=None) -> dict:
+        """
+        Return column name -> declared SQLite type for api_well_data, in ``columns`` order.
+        """
+        declared = {row[1]: row[2] for row in self.conn.execute(f"PRAGMA table_info({self.TABLE_NAME})")}
+        return {column: declared[column] for column in columns or self.COLUMNS}
+
+    def select_wells(self, columns=None, filters=None, bbox=None) -> sqlite3.Cursor:
+        """
+        Execute a query over api_well_data and return the cursor, unfetched.
+
+        Args:
+            columns (list): Columns to select, defaults to COLUMNS.
+            filters (dict): Column -> value that rows must equal.
+            bbox (tuple): (min_lat, min_lon, max_lat, max_lon), answered from the R*Tree.
+        """
+        columns = list(columns or self.COLUMNS)
+        filters = filters or {}
+        unknown = [column for column in [*columns, *filters] if column not in self.COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        sql = f"SELECT {', '.join(f'w.{column}' for column in columns)} FROM {self.TABLE_NAME} w"
+        where, params = [], []
+        if bbox is not None:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            sql += f" JOIN {self.SPATIAL_INDEX_TABLE_NAME} r ON r.id = w.rowid"
+            where.append("r.max_lat >= ? AND r.min_lat <= ? AND r.max_lon >= ? AND r.min_lon <= ?")
+            params += [min_lat, max_lat, min_lon, max_lon]
+        for column, value in filters.items():
+            where.append(f"w.{column} = ?")
+            params.append(value)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        return self.conn.execute(sql, params)
+
+    def _search_query(self, columns=None, filters=None, spud_date=(None, None), tvd=(None, None), bbox=None, after="", limit=100):
+        columns = list(columns or self.COLUMNS)
+        filters = filters or {}
+        unknown = [column for column in columns if column not in self.COLUMNS]
+        unknown += [column for column in filters if column not in self.SEARCH_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        where, params = ["API > ?"], [after]
+        for column, value in filters.items():
+            where.append(f"{column} = ?")
+            params.append(value)
+        for expression, (low, high) in (("Spud_Date", spud_date), ("TVD", tvd)):
+            if low is not None:
+                where.append(f"{expression} >= ?")
+                params.append(low)
+            if high is not None:
+                where.append(f"{expression} <= ?")
+                params.append(high)
+        if bbox is not None:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            where.append(
+                f"rowid IN (SELECT id FROM {self.SPATIAL_INDEX_TABLE_NAME} "
+                "WHERE max_lat >= ? AND min_lat <= ? AND max_lon >= ? AND min_lon <= ?)"
+            )
+            params += [min_lat, max_lat, min_lon, max_lon]
+
+        sql = (
+            f"SELECT {', '.join(columns)} FROM {self.TABLE_NAME} "
+            f"WHERE {' AND '.join(where)} ORDER BY API LIMIT ?"
+        )
+        return sql, params + [limit]
+
+    def search_wells(self, columns=None, filters=None, spud_date=(None, None), tvd=(None, None), bbox=None, after="", limit=100) -> list:
+        """
+        Return one page of wells matching every given filter, ordered by API.
+
+        Pages are keyset-paginated: pass the last API of a page as ``after``
+        to get the next one. Every filter is answered from an index.
+
+        Args:
+            columns (list): Columns to return, defaults to COLUMNS.
+            filters (dict): SEARCH_COLUMNS column -> value that rows must equal.
+            spud_date (tuple): Inclusive (from, to) ISO dates, either may be None.
+            tvd (tuple): Inclusive (min, max) true vertical depth, either may be None.
+            bbox (tuple): (min_lat, min_lon, max_lat, max_lon), answered from the R*Tree.
+            after (str): Only return APIs greater than this one.
+            limit (int): Page size.
+        """
+        sql, params = self._search_query(columns, filters, spud_date, tvd, bbox, after, limit)
+        return self.conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def text_query(text: str) -> str:
+        """
+        Turn what a user typed into an FTS5 query where every word must match
+        as a prefix: 'EOG res' -> '"eog"* AND "res"*'. Single characters
+        match whole words only, since a one-letter prefix matches nearly
+        everything: 'C-12' -> '"c" AND "12"*'.
+
+        Raises:
+            ValueError: If ``text`` has no letters or digits.
+        """
+        # Split the way FTS5's unicode61 tokenizer does, so "24S-28E" finds
+        # locations indexed as the tokens 24s and 28e
+        words = re.findall(r"[^\W_]+", text.lower())
+        if not words:
+            raise ValueError("Search text must contain letters or digits")
+        return " AND ".join(f'"{word}"*' if len(word) > 1 else f'"{word}"' for word in words)
+
+    def search_text(self, text: str, columns=None, limit=20) -> list:
+        """
+        Full-text search over TEXT_COLUMNS, best matches first.
+
+        Every match is scored, so the best wells come first however common
+        the words are; FTS5 keeps only the top ``limit`` while it scores.
+        A word matching most of the table (say "federal" statewide) costs
+        about a second per million wells.
+
+        Args:
+            text (str): Words to find; each matches as a word prefix, in any indexed column.
+            columns (list): Columns to return, defaults to API and TEXT_COLUMNS.
+            limit (int): Most results to return.
+
+        Returns:
+            list: Rows of ``columns`` followed by the bm25 relevance score (higher is better).
+        """
+        columns = list(columns or ["API", *self.TEXT_COLUMNS])
+        unknown = [column for column in columns if column not in self.COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        fts = self.TEXT_INDEX_TABLE_NAME
+        query = self.text_query(text)
+        return self.conn.execute(
+            f"""
+            SELECT {', '.join(f'w.{column}' for column in columns)}, -f.rank
+            FROM (
+                SELECT rowid, rank FROM {fts}
+                WHERE {fts} MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            ) f
+            JOIN {self.TABLE_NAME} w ON w.rowid = f.rowid
+            ORDER BY f.rank
+            """,
+            (query, limit),
+        ).fetchall()
+
+    def export_data(self, output_path, format="csv", batch_size=10000):
+        """
+        Export all well data, streaming rows in batches of ``batch_size``.
+
+        Args:
+            output_path (str): File to write.
+            format (str): One of exporters.EXPORT_FORMATS; parquet and arrow need pyarrow.
+            batch_size (int): Rows fetched from SQLite per batch.
+        """
+        format = format.lower()
+        if format not in exporters.EXPORT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(exporters.EXPORT_FORMATS)}")
+
+        if format in exporters.COLUMNAR_FORMATS:
+            # Fail before touching the output file if pyarrow is missing
+            schema = exporters.arrow_schema(self.column_types())
+
+        counter = {"rows": 0}
+        batches = exporters.counted(exporters.iter_batches(self.select_wells(), batch_size), counter)
+
+        if format in exporters.TEXT_FORMATS:
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                for chunk in exporters.TEXT_CHUNKS[format](self.COLUMNS, batches):
+                    f.write(chunk)
         else:
-            raise ValueError("format must be 'csv' or 'json'")
+            exporters.write_columnar(output_path, format, schema, batches)
+
+        self.logger.info(f"Exported {counter['rows']} rows to {format.upper()}: {output_path}")
+
+    def get_many(self, apis, chunk_size=500) -> dict:
+        """
+        Look up many wells with chunked ``WHERE API IN (...)`` queries.
+
+        Args:
+            apis (iterable): API numbers; duplicates are looked up once.
+            chunk_size (int): API numbers per query, kept well under SQLite's variable limit.
+
+        Returns:
+            dict: API -> WellRecord for every API that exists.
+        """
+        unique = list(dict.fromkeys(apis))
+        found = {}
+        for start in range(0, len(unique), chunk_size):
+            chunk = unique[start:start + chunk_size]
+            cursor = self.conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM {self.TABLE_NAME} "
+                f"WHERE API IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for row in cursor:
+                found[row[0]] = WellRecord(*row)
+        return found
 
     def get_by_api(self, api: str) -> Optional[WellRecord]:
         """
         Retrieve a single well record by API number.
         """
-        self.conn.row_factory = sqlite3.Row
         cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         cursor.execute(
             "SELECT * FROM api_well_data WHERE API = ?",
@@ -0,0 +1,193 @@
+# ==========================
+# well_scraper/exporters.py
+# ==========================
+import csv
+import io
+import json
+import zlib
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # optional dependency, only needed for parquet/arrow
+    pyarrow = None
+
+
+TEXT_FORMATS = ("csv", "json", "ndjson")
+COLUMNAR_FORMATS = ("parquet", "arrow")
+EXPORT_FORMATS = TEXT_FORMATS + COLUMNAR_FORMATS
+
+
+def iter_batches(cursor, batch_size=10000):
+    """
+    Yield lists of rows from an executed cursor, ``batch_size`` at a time.
+    """
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def csv_chunks(columns, batches):
+    """
+    Yield CSV text: a header line, then one chunk per batch of rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def ndjson_chunks(columns, batches):
+    """
+    Yield newline-delimited JSON, one object per row.
+    """
+    for rows in batches:
+        yield "".join(json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+
+
+def json_chunks(columns, batches):
+    """
+    Yield a JSON array of objects, one object per line.
+    """
+    yield "["
+    separator = "\n"
+    for rows in batches:
+        parts = []
+        for row in rows:
+            parts.append(separator + json.dumps(dict(zip(columns, row))))
+            separator = ",\n"
+        yield "".join(parts)
+    yield "\n]\n"
+
+
+TEXT_CHUNKS = {"csv": csv_chunks, "json": json_chunks, "ndjson": ndjson_chunks}
+
+
+def _require_pyarrow(format):
+    if pyarrow is None:
+        raise ImportError(f"{format} export requires the 'pyarrow' package")
+
+
+def arrow_schema(column_types):
+    """
+    Build an Arrow schema from SQLite declared column types.
+
+    Args:
+        column_types (dict): Column name -> declared type, in output order.
+    """
+    _require_pyarrow("columnar")
+    arrow_types = {"REAL": pyarrow.float64(), "INTEGER": pyarrow.int64()}
+    return pyarrow.schema(
+        [(name, arrow_types.get(decl.upper(), pyarrow.string())) for name, decl in column_types.items()]
+    )
+
+
+def record_batches(schema, batches):
+    """
+    Convert row batches into Arrow RecordBatches with the given schema.
+    """
+    for rows in batches:
+        columns = list(zip(*rows))
+        yield pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(values, type=field.type) for values, field in zip(columns, schema)],
+            schema=schema,
+        )
+
+
+def _columnar_writer(sink, format, schema):
+    _require_pyarrow(format)
+    if format == "parquet":
+        return pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+    if format == "arrow":
+        return pyarrow.ipc.new_file(sink, schema)
+    raise ValueError(f"format must be one of {', '.join(COLUMNAR_FORMATS)}")
+
+
+def write_columnar(sink, format, schema, batches):
+    """
+    Write row batches to ``sink`` as Parquet or an Arrow IPC file.
+
+    Args:
+        sink: Output path or writable binary file.
+        format (str): "parquet" or "arrow".
+        schema (pyarrow.Schema): Schema from arrow_schema().
+        batches (iterable): Lists of rows in schema column order.
+    """
+    with _columnar_writer(sink, format, schema) as writer:
+        for batch in record_batches(schema, batches):
+            writer.write_batch(batch)
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file that hands out what was written since the last drain().
+
+    tell() reports the total written so far, which is what the Parquet and
+    Arrow writers use for the offsets stored in the footer.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def columnar_chunks(format, schema, batches):
+    """
+    Yield a Parquet or Arrow IPC file as bytes, one chunk per batch of rows.
+    """
+    sink = _ChunkSink()
+    with _columnar_writer(sink, format, schema) as writer:
+        for batch in record_batches(schema, batches):
+            writer.write_batch(batch)
+            yield sink.drain()
+    # Closing the writer appends the footer
+    yield sink.drain()
+
+
+def gzip_chunks(chunks):
+    """
+    Gzip a stream of str or bytes chunks on the fly.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def counted(batches, counter):
+    """
+    Pass batches through while adding their row count to ``counter["rows"]``.
+    """
+    for rows in batches:
+        counter["rows"] += len(rows)
+        yield rows
@@ -0,0 +1,118 @@
+# ===========================
+# well_scraper/extraction.py
+# ===========================
+from html.parser import HTMLParser
+from .constants import WellFields
+
+
+class _AllFieldsFound(Exception):
+    """Raised internally to stop parsing once every target span is seen."""
+
+
+class FieldExtractor(HTMLParser):
+    """
+    Single-pass event parser that pulls the text of target spans by ID.
+
+    Mirrors the old BeautifulSoup approach of finding each span, dropping its
+    nested tags and taking ``get_text(strip=True)``: only text that sits
+    directly inside the span is kept, each piece stripped and joined without
+    a separator. The first span with a given ID wins, and parsing stops as
+    soon as every ID has been collected.
+    """
+
+    # Elements that never get an end tag and so never nest
+    VOID_ELEMENTS = frozenset({
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    })
+
+    def __init__(self, field_ids):
+        """
+        Initialize the FieldExtractor.
+
+        Args:
+            field_ids (dict): Mapping of field name -> span ID.
+        """
+        super().__init__(convert_charrefs=True)
+        self._fields_by_id = {span_id: field for field, span_id in field_ids.items() if span_id}
+        self._remaining = set(self._fields_by_id)
+        self._texts = {}
+
+        # State for the span currently being captured
+        self._current = None
+        self._parts = None
+        self._stack = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._current is not None:
+            if tag not in self.VOID_ELEMENTS:
+                self._stack.append(tag)
+            return
+
+        if tag != "span":
+            return
+
+        for name, value in attrs:
+            if name == "id":
+                if value in self._remaining:
+                    self._current = value
+                    self._parts = []
+                    self._stack = []
+                return
+
+    def handle_endtag(self, tag):
+        if self._current is None:
+            return
+
+        if tag in self._stack:
+            # Unwind to the matching tag, implicitly closing anything left open
+            while self._stack.pop() != tag:
+                pass
+        elif tag == "span":
+            self._finish()
+
+    def handle_data(self, data):
+        if self._current is not None and not self._stack:
+            text = data.strip()
+            if text:
+                self._parts.append(text)
+
+    def _finish(self):
+        self._texts[self._fields_by_id[self._current]] = "".join(self._parts) or None
+        self._remaining.discard(self._current)
+        self._current = None
+
+        if not self._remaining:
+            raise _AllFieldsFound()
+
+    def extract(self, html):
+        """
+        Parse an HTML document and return field name -> text.
+
+        Fields whose span is missing or empty map to None.
+        """
+        try:
+            self.feed(html)
+            self.close()
+        except _AllFieldsFound:
+            pass
+
+        # A span left open at end of document still counts, like html.parser would
+        if self._current is not None:
+            self._texts[self._fields_by_id[self._current]] = "".join(self._parts) or None
+
+        return {field: self._texts.get(field) for field in self._fields_by_id.values()}
+
+
+def extract_fields(html, field_ids=None):
+    """
+    Extract the text of every span in ``field_ids`` from ``html`` in one pass.
+
+    Args:
+        html (str): Page HTML.
+        field_ids (dict): Mapping of field name -> span ID, defaults to WellFields.FIELD_IDS.
+
+    Returns:
+        dict: Field name -> stripped text or None.
+    """
+    return FieldExtractor(field_ids or WellFields.FIELD_IDS).extract(html)
@@ -0,0 +1,52 @@
+# ====================
+# well_scraper/geo.py
+# ====================
+import math
+import numpy as np
+
+# Mean Earth radius, the usual choice for haversine distances
+EARTH_RADIUS_M = 6371008.8
+
+
+def haversine_m(lat, lon, lats, lons):
+    """
+    Great-circle distance in meters from one point to many.
+
+    Args:
+        lat (float): Latitude of the origin in degrees.
+        lon (float): Longitude of the origin in degrees.
+        lats (array-like): Latitudes of the other points.
+        lons (array-like): Longitudes of the other points.
+
+    Returns:
+        numpy.ndarray: Distances, NaN where a coordinate is missing.
+    """
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2 = np.radians(np.asarray(lats, dtype=float))
+    lon2 = np.radians(np.asarray(lons, dtype=float))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def bbox_around(lat, lon, radius_m):
+    """
+    Smallest lat/lon box containing every point within ``radius_m`` of (lat, lon).
+
+    Near the poles, or for radii wide enough, the box spans all longitudes.
+    Boxes are not split at the antimeridian, which New Mexico never reaches.
+
+    Returns:
+        tuple: (min_lat, min_lon, max_lat, max_lon) in degrees.
+    """
+    angle = radius_m / EARTH_RADIUS_M
+    min_lat = lat - math.degrees(angle)
+    max_lat = lat + math.degrees(angle)
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+
+    # Widest longitude of a spherical cap, which is more than radius / cos(lat)
+    ratio = math.sin(angle) / math.cos(math.radians(lat))
+    if angle >= math.pi / 2 or ratio >= 1:
+        return min_lat, -180.0, max_lat, 180.0
+    delta_lon = math.degrees(math.asin(ratio))
+    return min_lat, lon - delta_lon, max_lat, lon + delta_lon
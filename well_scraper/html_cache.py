@@ -0,0 +1,321 @@
+# ===========================
+# well_scraper/html_cache.py
+# ===========================
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, gzip is used instead
+    zstandard = None
+
+
+@dataclass
+class CachedPage:
+    api: str
+    html: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def age(self) -> float:
+        """
+        Seconds since the page was last fetched or revalidated.
+        """
+        return time.time() - self.fetched_at
+
+    def conditional_headers(self) -> dict:
+        """
+        Request headers that let the server answer 304 if the page is unchanged.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HtmlCache:
+    """
+    Content-addressed, compressed on-disk cache of WellDetails pages.
+
+    Page bodies are stored once per SHA-256 digest under ``blobs/`` (zstd
+    when the zstandard package is installed, gzip otherwise); a small SQLite
+    index maps each API number to its digest, fetch time and HTTP validators.
+    When the compressed size exceeds ``max_bytes`` the least recently used
+    pages are evicted.
+
+    Hits only record their access time in memory; the times are written to
+    the index in one statement on the next put(), eviction or close(), so a
+    lookup never costs a write.
+    """
+
+    INDEX_NAME = "index.db"
+
+    def __init__(self, directory, max_bytes=1024 ** 3, max_age=None, codec=None):
+        """
+        Initialize the HtmlCache.
+
+        Args:
+            directory (str): Cache directory, created if missing.
+            max_bytes (int): Compressed size budget before eviction kicks in.
+            max_age (float): Seconds a page is served without revalidation, None to always revalidate.
+            codec (str): "zstd" or "gzip"; defaults to zstd when available.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.codec = codec or ("zstd" if zstandard else "gzip")
+        if self.codec == "zstd" and zstandard is None:
+            raise ImportError("zstd codec requires the 'zstandard' package")
+
+        self.blob_dir = os.path.join(directory, "blobs")
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(directory, self.INDEX_NAME), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        # The index is a cache: losing the last commits in a crash only loses pages
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                api TEXT PRIMARY KEY,
+                digest TEXT NOT NULL REFERENCES blobs (digest),
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages (last_access)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_digest ON pages (digest)")
+        self.conn.commit()
+
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        # API -> last access time not yet written to the index
+        self._accessed = {}
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _blob_path(self, digest, codec):
+        extension = "zst" if codec == "zstd" else "gz"
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.html.{extension}")
+
+    @staticmethod
+    def _compress(data, codec):
+        if codec == "zstd":
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    @staticmethod
+    def _decompress(data, codec):
+        if codec == "zstd":
+            if zstandard is None:
+                raise ImportError("Cached page is zstd compressed; install the 'zstandard' package")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def get(self, api) -> Optional[CachedPage]:
+        """
+        Return the cached page for an API, or None if it is not cached.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                """
+                SELECT p.digest, b.codec, p.fetched_at, p.etag, p.last_modified
+                FROM pages p JOIN blobs b ON b.digest = p.digest
+                WHERE p.api = ?
+                """,
+                (api,),
+            ).fetchone()
+            if not row:
+                self.misses += 1
+                return None
+            self._accessed[api] = time.time()
+
+        digest, codec, fetched_at, etag, last_modified = row
+        try:
+            with open(self._blob_path(digest, codec), "rb") as f:
+                html = self._decompress(f.read(), codec).decode("utf-8")
+        except FileNotFoundError:
+            self.logger.warning(f"Cache blob {digest} for {api} is missing, dropping entry")
+            self.discard(api)
+            with self.lock:
+                self.misses += 1
+            return None
+
+        return CachedPage(api, html, fetched_at, etag, last_modified)
+
+    def lookup(self, api):
+        """
+        Look up an API for a scraper.
+
+        Returns:
+            tuple: (page, fresh) where page is the CachedPage or None and fresh
+            says whether it is young enough (max_age) to use without asking the
+            server. Fresh lookups count as hits.
+        """
+        page = self.get(api)
+        fresh = page is not None and self.max_age is not None and page.age() <= self.max_age
+        if fresh:
+            with self.lock:
+                self.hits += 1
+        return page, fresh
+
+    def put(self, api, html, etag=None, last_modified=None):
+        """
+        Store a freshly fetched page.
+        """
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+
+        with self.lock:
+            known = self.conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+
+        # Compress outside the lock; identical pages race harmlessly to the same file
+        compressed = None
+        if not known:
+            path = self._blob_path(digest, self.codec)
+            compressed = self._compress(data, self.codec)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+
+        with self.lock:
+            previous = self.conn.execute("SELECT digest FROM pages WHERE api = ?", (api,)).fetchone()
+            self._accessed.pop(api, None)
+            with self.conn:
+                self._flush_accessed()
+                if compressed is not None:
+                    cursor = self.conn.execute(
+                        "INSERT OR IGNORE INTO blobs (digest, codec, size) VALUES (?, ?, ?)",
+                        (digest, self.codec, len(compressed)),
+                    )
+                    self.total_bytes += len(compressed) * cursor.rowcount
+                self.conn.execute(
+                    """
+                    INSERT OR REPLACE INTO pages (api, digest, fetched_at, last_access, etag, last_modified)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (api, digest, now, now, etag, last_modified),
+                )
+            if previous and previous[0] != digest:
+                self._release_blobs([previous[0]])
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def touch(self, api):
+        """
+        Mark a cached page as revalidated (the server answered 304).
+        """
+        now = time.time()
+        with self.lock, self.conn:
+            self._accessed.pop(api, None)
+            self.conn.execute("UPDATE pages SET fetched_at = ?, last_access = ? WHERE api = ?", (now, now, api))
+            self.revalidated += 1
+
+    def discard(self, api):
+        """
+        Remove an API from the cache.
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT digest FROM pages WHERE api = ?", (api,)).fetchone()
+            self._accessed.pop(api, None)
+            if not row:
+                return
+            with self.conn:
+                self.conn.execute("DELETE FROM pages WHERE api = ?", (api,))
+            self._release_blobs([row[0]])
+
+    def _flush_accessed(self):
+        # Write access times recorded by get() since the last flush; caller holds the lock
+        if self._accessed:
+            self.conn.executemany(
+                "UPDATE pages SET last_access = ? WHERE api = ?",
+                [(accessed, api) for api, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _release_blobs(self, digests):
+        # Delete blobs that are no longer referenced by any page
+        for digest in set(digests):
+            if self.conn.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                continue
+            row = self.conn.execute("SELECT codec, size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if not row:
+                continue
+            codec, size = row
+            with self.conn:
+                self.conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            self.total_bytes -= size
+            try:
+                os.remove(self._blob_path(digest, codec))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        # Drop least recently used pages until under budget
+        with self.conn:
+            self._flush_accessed()
+        evicted = 0
+        while self.total_bytes > self.max_bytes:
+            rows = self.conn.execute("SELECT api, digest FROM pages ORDER BY last_access LIMIT 100").fetchall()
+            if not rows:
+                break
+            for api, digest in rows:
+                with self.conn:
+                    self.conn.execute("DELETE FROM pages WHERE api = ?", (api,))
+                self._release_blobs([digest])
+                evicted += 1
+                if self.total_bytes <= self.max_bytes:
+                    break
+        self.logger.debug(f"Evicted {evicted} pages, cache now {self.total_bytes} bytes")
+
+    def stats(self) -> dict:
+        """
+        Return cache counters as a dict.
+        """
+        with self.lock:
+            pages = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            return {
+                "pages": pages,
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+            }
+
+    def close(self):
+        """
+        Close the cache index, saving access times first.
+        """
+        with self.lock:
+            with self.conn:
+                self._flush_accessed()
+            self.conn.close()
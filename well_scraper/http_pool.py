@@ -0,0 +1,128 @@
+# ==========================
+# well_scraper/http_pool.py
+# ==========================
+import threading
+import weakref
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionStats:
+    """
+    Thread-safe counters for TCP/TLS connections and the requests sent over them.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests_sent = 0
+        self._connections = weakref.WeakSet()
+
+    def on_connect(self, conn):
+        with self.lock:
+            self.connections_opened += 1
+            self._connections.add(conn)
+
+    def on_request(self, conn):
+        with self.lock:
+            self.requests_sent += 1
+            conn.requests_sent += 1
+
+    def snapshot(self):
+        """
+        Return the current counters as a dict.
+
+        ``reused_requests`` is the number of requests that did not need a new
+        handshake; ``per_connection`` lists how many times each live pooled
+        connection has been reused.
+        """
+        with self.lock:
+            per_connection = [max(conn.requests_sent - 1, 0) for conn in self._connections]
+            return {
+                "connections_opened": self.connections_opened,
+                "requests_sent": self.requests_sent,
+                "reused_requests": max(self.requests_sent - self.connections_opened, 0),
+                "per_connection": sorted(per_connection, reverse=True),
+            }
+
+
+class _CountingConnectionMixin:
+    stats = None
+
+    def connect(self):
+        super().connect()
+        self.requests_sent = 0
+        self.stats.on_connect(self)
+
+    def request(self, *args, **kwargs):
+        # Connections are opened lazily, so the first request may connect
+        if getattr(self, "requests_sent", None) is None:
+            self.requests_sent = 0
+        super().request(*args, **kwargs)
+        self.stats.on_request(self)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled connections report to a ConnectionStats instance.
+    """
+
+    def __init__(self, stats, pool_size=10, **kwargs):
+        self.stats = stats
+        # One connection class per adapter so counters are not shared globally
+        http_conn = type("CountingHTTPConnection", (_CountingConnectionMixin, HTTPConnection), {"stats": stats})
+        https_conn = type("CountingHTTPSConnection", (_CountingConnectionMixin, HTTPSConnection), {"stats": stats})
+        self._pool_classes = {
+            "http": type("CountingHTTPConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": http_conn}),
+            "https": type("CountingHTTPSConnectionPool", (HTTPSConnectionPool,), {"ConnectionCls": https_conn}),
+        }
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+
+class SessionPool:
+    """
+    Hands out one requests.Session per thread, all sharing a single
+    keep-alive connection pool of ``pool_size`` connections per host.
+    """
+
+    HEADERS = {
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    def __init__(self, pool_size=10):
+        """
+        Initialize the SessionPool.
+
+        Args:
+            pool_size (int): Maximum number of pooled connections per host.
+        """
+        self.pool_size = pool_size
+        self.stats = ConnectionStats()
+        self.adapter = KeepAliveAdapter(self.stats, pool_size=pool_size)
+        self._local = threading.local()
+
+    def get_session(self):
+        """
+        Return the calling thread's Session, creating it on first use.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.HEADERS)
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            self._local.session = session
+        return session
+
+    def close(self):
+        """
+        Close every pooled connection.
+        """
+        self.adapter.close()
@@ -0,0 +1,273 @@
+# ========================
+# well_scraper/metrics.py
+# ========================
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class _Metric:
+    TYPE = None
+
+    def __init__(self, name, help, labelnames=(), registry=None):
+        """
+        Initialize the metric and register it.
+
+        Args:
+            name (str): Prometheus metric name.
+            help (str): One-line description.
+            labelnames (tuple): Label names every observation must supply.
+            registry (Registry): Registry to add to, defaults to REGISTRY.
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self._values = {}
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self):
+        raise NotImplementedError
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+        for suffix, labels, value in self._samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count; by convention the name ends in _total."""
+
+    TYPE = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self.lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self.lock:
+            items = sorted(self._values.items())
+        return [("", list(zip(self.labelnames, key)), value) for key, value in items]
+
+
+class Gauge(_Metric):
+    """
+    Value that goes up and down. set_function() makes it read a callable at
+    scrape time, which suits queue depths.
+    """
+
+    TYPE = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._functions = {}
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self._values[key] = value
+
+    def set_function(self, function, **labels):
+        """
+        Read ``function()`` whenever the gauge is rendered; None removes it.
+        """
+        key = self._key(labels)
+        with self.lock:
+            if function is None:
+                self._functions.pop(key, None)
+            else:
+                self._functions[key] = function
+
+    def value(self, **labels):
+        key = self._key(labels)
+        with self.lock:
+            function = self._functions.get(key)
+            if function is None:
+                return self._values.get(key, 0)
+        return function()
+
+    def _samples(self):
+        with self.lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, function in functions.items():
+            values[key] = function()
+        return [("", list(zip(self.labelnames, key)), value) for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram of observed values, e.g. latencies in seconds."""
+
+    TYPE = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        super().__init__(name, help, labelnames, registry)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Context manager that observes the elapsed time of its block.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels):
+        with self.lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def _samples(self):
+        with self.lock:
+            items = sorted((key, ([*state[0]], state[1], state[2])) for key, state in self._values.items())
+        samples = []
+        for key, (counts, total, count) in items:
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                samples.append(("_bucket", labels + [("le", _format_value(bound))], cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, count))
+        return samples
+
+
+class Registry:
+    """
+    Collection of metrics rendered together in the Prometheus text format.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._metrics = {}
+
+    def register(self, metric):
+        with self.lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """
+        Return every metric in the Prometheus text exposition format.
+        """
+        with self.lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def start_http_server(port, host="0.0.0.0", registry=None):
+    """
+    Serve ``registry`` (default REGISTRY) at http://host:port/metrics from a daemon thread.
+
+    Returns:
+        ThreadingHTTPServer: Call shutdown() and server_close() to stop it.
+    """
+    registry = registry if registry is not None else REGISTRY
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", Registry.CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True).start()
+    return server
+
+# Scraper pipeline, one stage at a time
+FETCH_SECONDS = Histogram(
+    "well_scraper_fetch_seconds", "Latency of WellDetails HTTP requests, per attempt.", ["client"]
+)
+FETCHES = Counter(
+    "well_scraper_fetches_total",
+    "Pages fetched, by how the fetch ended (ok, not_modified, cache_hit, failed, rate_limited).",
+    ["result"],
+)
+RETRIES = Counter(
+    "well_scraper_retries_total", "Fetch attempts followed by another attempt, by reason (rate_limited, http_error).", ["reason"]
+)
+RATE_LIMIT_HITS = Counter("well_scraper_rate_limit_hits_total", "Responses that were the site's rate limit page.")
+PARSE_SECONDS = Histogram(
+    "well_scraper_parse_seconds",
+    "Time spent parsing one WellDetails page.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+UNPARSED_VALUES = Counter(
+    "well_scraper_unparsed_values_total", "Scraped numeric or date values that could not be converted, by field.", ["field"]
+)
+DB_WRITE_SECONDS = Histogram("well_scraper_db_write_seconds", "Duration of one batched database transaction.")
+DB_ROWS_WRITTEN = Counter("well_scraper_db_rows_written_total", "Well records committed to the database.")
+APIS = Counter(
+    "well_scraper_apis_total",
+    "Input APIs by outcome (inserted, not_found, error, skipped, invalid, duplicate, already_done).",
+    ["outcome"],
+)
+QUEUE_DEPTH = Gauge("well_scraper_queue_depth", "Items waiting in a pipeline queue (work, parse, writer).", ["queue"])
+
+# HTTP API
+HTTP_REQUEST_SECONDS = Histogram(
+    "well_api_request_seconds", "Latency of API requests by route, method and status.", ["route", "method", "status"]
+)
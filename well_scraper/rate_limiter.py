@@ -0,0 +1,184 @@
+# =============================
+# well_scraper/rate_limiter.py
+# =============================
+import asyncio
+import logging
+import threading
+import time
+
+
+class RateGovernor:
+    """
+    Process-wide token bucket that paces every request to the OCD site.
+
+    The refill rate is tuned AIMD-style: each clean page nudges the rate up
+    by roughly ``increase_step`` requests/second per second of traffic, and a
+    rate limit page multiplies it by ``decrease_ratio`` and pauses all callers
+    for ``cooldown`` seconds. At most one decrease happens per cooldown window,
+    so a burst of rate limit pages from requests that were already in flight
+    only counts once.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, initial_rate=1.0, min_rate=0.1, max_rate=20.0, burst=1,
+                 increase_step=0.5, decrease_ratio=0.5, cooldown=1.0,
+                 clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the RateGovernor.
+
+        Args:
+            initial_rate (float): Starting rate in requests per second.
+            min_rate (float): Lower bound for the rate.
+            max_rate (float): Upper bound for the rate.
+            burst (int): Bucket capacity, i.e. requests allowed back to back.
+            increase_step (float): Additive increase in requests/second per second.
+            decrease_ratio (float): Multiplier applied on a rate limit page.
+            cooldown (float): Seconds every caller waits after a rate limit page.
+            clock (callable): Monotonic clock, replaceable for testing.
+            sleep (callable): Sleep function, replaceable for testing.
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_ratio = decrease_ratio
+        self.cooldown = cooldown
+        self.clock = clock
+        self.sleep = sleep
+
+        self._rate = max(min_rate, min(initial_rate, max_rate))
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._last_decrease = None
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.rate_limit_hits = 0
+        self.peak_rate = self._rate
+        self.last_limited_rate = None
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def shared(cls):
+        """
+        Return the process-wide governor, creating it on first use.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @property
+    def rate(self):
+        """
+        Current request rate in requests per second.
+        """
+        return self._rate
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self):
+        """
+        Reserve one request slot.
+
+        Returns:
+            float: Seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self._tokens -= 1
+            self.requests += 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self):
+        """
+        Block until the caller may send a request.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self.sleep(wait)
+
+    def try_acquire(self):
+        """
+        Take a request slot if one is free now, without booking ahead.
+
+        Returns:
+            float: 0.0 if the caller may send, otherwise seconds until the
+                next slot at the current rate; the caller must try again.
+        """
+        with self._lock:
+            self._refill(self.clock())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.requests += 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    async def acquire_async(self, sleep=asyncio.sleep):
+        """
+        Wait without blocking the event loop until the caller may send a request.
+
+        Unlike reserve(), nothing is booked while waiting: the wait is
+        recomputed against the current bucket after every sleep, so a rate
+        change or a rate limit pause applies to requests already waiting.
+
+        Args:
+            sleep (callable): Coroutine function used to wait, replaceable for testing.
+        """
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            await sleep(wait)
+
+    def on_success(self):
+        """
+        Record a clean page and raise the rate additively.
+        """
+        with self._lock:
+            self._refill(self.clock())
+            self._rate = min(self.max_rate, self._rate + self.increase_step / self._rate)
+            self.peak_rate = max(self.peak_rate, self._rate)
+
+    def on_rate_limited(self):
+        """
+        Record a rate limit page, cut the rate and pause all callers.
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.rate_limit_hits += 1
+
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+
+            self._last_decrease = now
+            self.last_limited_rate = self._rate
+            self._rate = max(self.min_rate, self._rate * self.decrease_ratio)
+            # Push the bucket into debt so nobody sends for the cooldown period
+            self._tokens = min(self._tokens, 0.0) - self._rate * self.cooldown
+
+            self.logger.warning(
+                f"Rate limit hit at {self.last_limited_rate:.2f} req/s, backing off to {self._rate:.2f} req/s"
+            )
+
+    def stats(self):
+        """
+        Return the governor's counters as a dict.
+        """
+        with self._lock:
+            return {
+                "rate": self._rate,
+                "peak_rate": self.peak_rate,
+                "last_limited_rate": self.last_limited_rate,
+                "requests": self.requests,
+                "rate_limit_hits": self.rate_limit_hits,
+            }
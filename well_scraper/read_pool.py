@@ -0,0 +1,104 @@
+# ==========================
+# well_scraper/read_pool.py
+# ==========================
+import asyncio
+import logging
+import queue
+from contextlib import contextmanager
+from .database import WellDatabase
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes free in time."""
+
+
+class ReadConnectionPool:
+    """
+    Fixed-size pool of read-only WellDatabase connections.
+
+    Connections are opened once up front and handed out LIFO, so a lightly
+    loaded server keeps reusing the same warm connection and page cache.
+
+    Async callers should use acquire_async()/release_async(): they wait for
+    a free connection on the event loop instead of parking a worker thread,
+    which would otherwise starve the threadpool that sync endpoints run on.
+    """
+
+    def __init__(self, db_path, size=8, timeout=5.0):
+        """
+        Initialize the ReadConnectionPool.
+
+        Args:
+            db_path (str): Path to the SQLite database file.
+            size (int): Number of connections to open.
+            timeout (float): Seconds acquire() waits for a free connection.
+        """
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=size)
+        self._semaphore = None
+        for _ in range(size):
+            self._pool.put(WellDatabase(db_path, read_only=True))
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.info(f"Opened {size} read-only connections to {db_path}")
+
+    def acquire(self) -> WellDatabase:
+        """
+        Take a connection from the pool, waiting up to ``timeout`` seconds.
+        """
+        try:
+            return self._pool.get(timeout=self.timeout)
+        except queue.Empty:
+            raise PoolTimeout(f"No database connection available after {self.timeout}s")
+
+    def release(self, db: WellDatabase):
+        """
+        Return a connection to the pool.
+        """
+        # Never hand the next request a connection stuck in a transaction
+        if db.conn.in_transaction:
+            db.conn.rollback()
+        self._pool.put(db)
+
+    async def acquire_async(self) -> WellDatabase:
+        """
+        Take a connection from the pool without blocking the event loop.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeout(f"No database connection available after {self.timeout}s")
+        return self._pool.get_nowait()
+
+    def release_async(self, db: WellDatabase):
+        """
+        Return a connection taken with acquire_async().
+        """
+        self.release(db)
+        self._semaphore.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager that acquires and releases a connection.
+        """
+        db = self.acquire()
+        try:
+            yield db
+        finally:
+            self.release(db)
+
+    def close(self):
+        """
+        Close every idle connection in the pool.
+        """
+        while True:
+            try:
+                db = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            db.close()
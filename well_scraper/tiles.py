@@ -0,0 +1,253 @@
+# ======================
+# well_scraper/tiles.py
+# ======================
+import math
+import threading
+from collections import OrderedDict
+import numpy as np
+
+# Tiles up to this zoom hold clusters; higher zooms list individual wells
+CLUSTER_MAX_ZOOM = 12
+# Clustered tiles at or above this zoom are aggregated straight from the
+# database. Lower zooms are merged from their four children, so a write
+# only costs re-reading one small tile plus a merge per zoom level above it.
+BASE_ZOOM = 10
+# A clustered tile is split into 2**CELL_BITS x 2**CELL_BITS cells, which
+# are the tiles CELL_BITS zoom levels further in
+CELL_BITS = 3
+MAX_ZOOM = 22
+# Web Mercator stops here
+MAX_LATITUDE = 85.0511287798
+# More changes than this since the last request clear the whole cache
+MAX_TARGETED_EVICTIONS = 10000
+
+
+def tile_bounds(z: int, x: int, y: int):
+    """
+    Return the (min_lat, min_lon, max_lat, max_lon) of a Web Mercator (slippy map) tile.
+    """
+    n = 2 ** z
+
+    def lat(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return lat(y + 1), x / n * 360 - 180, lat(y), (x + 1) / n * 360 - 180
+
+
+def tile_xy(lats, lons, z: int):
+    """
+    Return the x and y tile indexes at zoom ``z`` containing each position.
+
+    Args:
+        lats (array-like): Latitudes in degrees.
+        lons (array-like): Longitudes in degrees.
+        z (int): Zoom level.
+
+    Returns:
+        tuple: Two numpy int arrays (xs, ys).
+    """
+    n = 2 ** z
+    lats = np.radians(np.clip(np.asarray(lats, dtype=float), -MAX_LATITUDE, MAX_LATITUDE))
+    lons = np.asarray(lons, dtype=float)
+    xs = np.floor((lons + 180) / 360 * n)
+    ys = np.floor((1 - np.arcsinh(np.tan(lats)) / math.pi) / 2 * n)
+    return np.clip(xs, 0, n - 1).astype(np.int64), np.clip(ys, 0, n - 1).astype(np.int64)
+
+
+def quadkey(z: int, x: int, y: int) -> str:
+    """
+    Bing-style quadkey of a tile; a tile's key is a prefix of its children's.
+    """
+    digits = []
+    for i in range(z, 0, -1):
+        mask = 1 << (i - 1)
+        digits.append(str((1 if x & mask else 0) + (2 if y & mask else 0)))
+    return "".join(digits)
+
+
+def _label(value):
+    return value if value else "Unknown"
+
+
+def _new_cell():
+    # count, sum of latitudes, sum of longitudes, Status counts, Well_Type counts
+    return [0, 0.0, 0.0, {}, {}]
+
+
+def _add_counts(target, counts):
+    for key, count in counts.items():
+        target[key] = target.get(key, 0) + count
+
+
+class TileCache:
+    """
+    Clustered tiles for one API process, computed on demand and kept until
+    wells inside them change.
+
+    Each tile is stored as its cells: (cell x, cell y) at zoom z + CELL_BITS
+    -> count, position sums and Status/Well_Type counts. Before answering,
+    the cache reads the database's geo change log and evicts, for every
+    changed position, the one tile per zoom level that contains it.
+
+    The lock only guards the cache's own state. Tiles are built outside it,
+    one build per tile at a time (other requests for the tile wait for it),
+    and database connections are borrowed only around each read, so a slow
+    cold tile never holds a connection while it waits. A build that overlaps
+    an eviction is returned but not stored, so a tile is never kept from
+    data older than the changes already applied.
+    """
+
+    def __init__(self, max_tiles=10000):
+        """
+        Initialize the TileCache.
+
+        Args:
+            max_tiles (int): Tiles kept before the least recently used are dropped.
+        """
+        self.max_tiles = max_tiles
+        self.lock = threading.Lock()
+        self.tiles = OrderedDict()
+        self.version = None
+        self.seq = None
+        # Bumped on every eviction; builds that started earlier are not stored
+        self.epoch = 0
+        self._building = {}
+
+    def clusters(self, connection, z: int, x: int, y: int) -> dict:
+        """
+        Return the clustered tile (z, x, y) as a JSON-ready dict.
+
+        Args:
+            connection (callable): Returns a context manager lending a
+                WellDatabase, e.g. ReadConnectionPool.connection.
+            z (int): Zoom level, at most CLUSTER_MAX_ZOOM.
+            x (int): Tile column.
+            y (int): Tile row.
+        """
+        self._sync(connection)
+        cells = self._cells(connection, z, x, y)
+
+        zoom = z + CELL_BITS
+        clusters = [
+            {
+                "quadkey": quadkey(zoom, cx, cy),
+                "count": count,
+                "lat": round(sum_lat / count, 6),
+                "lon": round(sum_lon / count, 6),
+                "status": statuses,
+                "well_type": well_types,
+            }
+            for (cx, cy), (count, sum_lat, sum_lon, statuses, well_types) in cells.items()
+        ]
+        clusters.sort(key=lambda cluster: cluster["quadkey"])
+        return {"z": z, "x": x, "y": y, "count": sum(c["count"] for c in clusters), "clusters": clusters}
+
+    def _sync(self, connection):
+        with connection() as db:
+            version = db.content_version()[0]
+        while True:
+            with self.lock:
+                if version == self.version:
+                    return
+                seq = self.seq
+
+            changes = None
+            with connection() as db:
+                if seq is not None:
+                    changes = db.geo_changes_since(seq)
+                if changes is None or len(changes) > MAX_TARGETED_EVICTIONS:
+                    changes, latest = None, db.geo_change_seq()
+                else:
+                    latest = changes[-1][0] if changes else seq
+
+            with self.lock:
+                if self.seq != seq:
+                    # Another request synced meanwhile, start over from its position
+                    continue
+                if changes is None:
+                    # Nothing cached yet, or too far behind to evict tile by tile
+                    self.tiles.clear()
+                    self.epoch += 1
+                elif changes:
+                    _, lats, lons = zip(*changes)
+                    for z in range(CLUSTER_MAX_ZOOM + 1):
+                        xs, ys = tile_xy(lats, lons, z)
+                        for key in set(zip([z] * len(xs), xs.tolist(), ys.tolist())):
+                            self.tiles.pop(key, None)
+                    self.epoch += 1
+                self.seq = latest
+                self.version = version
+                return
+
+    def _cells(self, connection, z, x, y):
+        key = (z, x, y)
+        while True:
+            with self.lock:
+                cells = self.tiles.get(key)
+                if cells is not None:
+                    self.tiles.move_to_end(key)
+                    return cells
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = threading.Event()
+                    epoch = self.epoch
+                    break
+            # Someone else is building it; take their result, or build it if they failed
+            building.wait()
+
+        try:
+            cells = self._build(connection, z, x, y)
+            with self.lock:
+                if self.epoch == epoch:
+                    self.tiles[key] = cells
+                    while len(self.tiles) > self.max_tiles:
+                        self.tiles.popitem(last=False)
+        finally:
+            with self.lock:
+                del self._building[key]
+            building.set()
+        return cells
+
+    def _build(self, connection, z, x, y):
+        if z >= BASE_ZOOM:
+            return self._aggregate(connection, z, x, y)
+
+        with connection() as db:
+            empty = db.select_wells(["API"], bbox=tile_bounds(z, x, y)).fetchone() is None
+        cells = {}
+        if empty:
+            return cells
+        for child_x in (2 * x, 2 * x + 1):
+            for child_y in (2 * y, 2 * y + 1):
+                for (cx, cy), child in self._cells(connection, z + 1, child_x, child_y).items():
+                    cell = cells.setdefault((cx >> 1, cy >> 1), _new_cell())
+                    cell[0] += child[0]
+                    cell[1] += child[1]
+                    cell[2] += child[2]
+                    _add_counts(cell[3], child[3])
+                    _add_counts(cell[4], child[4])
+        return cells
+
+    def _aggregate(self, connection, z, x, y):
+        with connection() as db:
+            rows = db.select_wells(["Latitude", "Longitude", "Status", "Well_Type"], bbox=tile_bounds(z, x, y)).fetchall()
+        cells = {}
+        if not rows:
+            return cells
+
+        lats, lons, statuses, well_types = zip(*rows)
+        xs, ys = tile_xy(lats, lons, z + CELL_BITS)
+        for lat, lon, status, well_type, cx, cy in zip(lats, lons, statuses, well_types, xs.tolist(), ys.tolist()):
+            # The R*Tree box is inclusive, so skip wells on the edge that belong to a neighbour
+            if cx >> CELL_BITS != x or cy >> CELL_BITS != y:
+                continue
+            cell = cells.get((cx, cy))
+            if cell is None:
+                cell = cells[(cx, cy)] = _new_cell()
+            cell[0] += 1
+            cell[1] += lat
+            cell[2] += lon
+            status, well_type = _label(status), _label(well_type)
+            cell[3][status] = cell[3].get(status, 0) + 1
+            cell[4][well_type] = cell[4].get(well_type, 0) + 1
+        return cells
@@ -4,8 +4,12 @@
 import time
 import logging
 import requests
-from bs4 import BeautifulSoup
+from . import metrics
+from .api_numbers import normalize_api
 from .constants import WellFields
+from .extraction import extract_fields
+from .http_pool import SessionPool
+from .rate_limiter import RateGovernor
 
 
 class WellScraper:
@@ -15,33 +19,35 @@ class WellScraper:
 
     RATE_LIMIT_TEXT = "Site Busy - Rate Limit Reached"
 
-    def __init__(self, max_retries=5, backoff_factor=1):
+    def __init__(self, max_retries=5, backoff_factor=1, pool_size=10, governor=None, cache=None):
         """
         Initialize the WellScraper with retry settings.
 
         Args:
             max_retries (int): Maximum number of retries for failed requests.
-            backoff_factor (int): Base factor for exponential backoff.
+            backoff_factor (int): Base factor for exponential backoff on HTTP errors.
+            pool_size (int): Number of keep-alive connections shared by worker threads.
+            governor (RateGovernor): Request pacer, defaults to the process-wide one.
+            cache (HtmlCache): Optional raw page cache used for repeat and conditional requests.
         """
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.governor = governor or RateGovernor.shared()
+        self.cache = cache
+        self.sessions = SessionPool(pool_size=pool_size)
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def _get_field_text(self, soup, span_id):
+    def connection_stats(self):
         """
-        Extract text from a span element by ID, removing nested tags.
+        Return connection reuse counters for the scraper's session pool.
         """
-        if not span_id:
-            return None
-
-        span = soup.find("span", id=span_id)
-        if not span:
-            return None
+        return self.sessions.stats.snapshot()
 
-        for tag in span.find_all():
-            tag.extract()
-
-        return span.get_text(strip=True) or None
+    def close(self):
+        """
+        Close all pooled HTTP connections.
+        """
+        self.sessions.close()
 
     @staticmethod
     def parse_lat_lon_crs(text):
@@ -60,20 +66,61 @@ class WellScraper:
     def scrape_api(self, api_number):
         """
         Scrape well data for a given API number.
+
+        Raises:
+            InvalidApiNumber: If api_number cannot be normalized.
+        """
+        api_number = normalize_api(api_number)
+        html = self.fetch_page(api_number)
+        if html is None:
+            return None
+
+        with metrics.PARSE_SECONDS.time():
+            return self.parse_page(api_number, html)
+
+    def fetch_page(self, api_number):
+        """
+        Fetch the raw WellDetails HTML for an API number, or None on failure.
+
+        With a cache, pages younger than the cache's max age are served
+        without a request, and older ones are revalidated with
+        If-None-Match / If-Modified-Since so an unchanged page costs a 304.
         """
         url = self.BASE_URL.format(api_number)
+        session = self.sessions.get_session()
+
+        cached = None
+        if self.cache is not None:
+            cached, fresh = self.cache.lookup(api_number)
+            if fresh:
+                metrics.FETCHES.inc(result="cache_hit")
+                return cached.html
+
+        headers = cached.conditional_headers() if cached else None
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                resp = requests.get(url, timeout=30)
+                self.governor.acquire()
+                with metrics.FETCH_SECONDS.time(client="sync"):
+                    resp = session.get(url, headers=headers, timeout=30)
 
                 if self.RATE_LIMIT_TEXT in resp.text:
-                    wait = self.backoff_factor * (2 ** (attempt - 1))
-                    self.logger.warning(f"Rate limit page detected for {api_number}, retry {attempt}/{self.max_retries}, sleeping {wait}s")
-                    time.sleep(wait)
+                    # The governor slows every worker down, no per-thread sleep needed
+                    self.governor.on_rate_limited()
+                    metrics.RATE_LIMIT_HITS.inc()
+                    if attempt < self.max_retries:
+                        metrics.RETRIES.inc(reason="rate_limited")
+                    self.logger.warning(f"Rate limit page detected for {api_number}, retry {attempt}/{self.max_retries}")
                     continue
 
+                if resp.status_code == 304 and cached:
+                    self.governor.on_success()
+                    self.cache.touch(api_number)
+                    metrics.FETCHES.inc(result="not_modified")
+                    return cached.html
+
                 resp.raise_for_status()
+                self.governor.on_success()
 
                 if attempt > 1:
                     self.logger.info(f"Retry succeeded for {api_number} on attempt {attempt}")
@@ -82,29 +129,53 @@ class WellScraper:
 
             except requests.RequestException as e:
                 if attempt >= self.max_retries:
+                    metrics.FETCHES.inc(result="failed")
                     self.logger.error(f"Failed {api_number} after {attempt} attempts: {e}")
                     return None
 
+                metrics.RETRIES.inc(reason="http_error")
                 wait = self.backoff_factor * (2 ** (attempt - 1))
                 self.logger.warning(f"HTTP error for {api_number} (attempt {attempt}), sleeping {wait}s: {e}")
                 time.sleep(wait)
+        else:
+            metrics.FETCHES.inc(result="rate_limited")
+            self.logger.error(f"Giving up on {api_number}: still rate limited after {self.max_retries} attempts")
+            return None
+
+        metrics.FETCHES.inc(result="ok")
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        if self.cache is not None:
+            self.cache.put(
+                api_number,
+                resp.text,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+
+        return resp.text
+
+    @staticmethod
+    def parse_page(api_number, html):
+        """
+        Parse a WellDetails page into a dict of well fields.
+
+        Static and free of scraper state so it can run in a process pool.
+        """
+        # One pass over the document collects every span in FIELD_IDS
+        fields = extract_fields(html, WellFields.FIELD_IDS)
         data = {"API": api_number}
 
         # Parse coordinates ONCE
-        coord_span_id = WellFields.FIELD_IDS.get("Coordinates")
-        coord_text = self._get_field_text(soup, coord_span_id)
-        lat, lon, crs = self.parse_lat_lon_crs(coord_text)
+        lat, lon, crs = WellScraper.parse_lat_lon_crs(fields.get("Coordinates"))
 
         data["Latitude"] = lat
         data["Longitude"] = lon
         data["CRS"] = crs
 
-        for field, span_id in WellFields.FIELD_IDS.items():
+        for field in WellFields.FIELD_IDS:
             if field in {"API", "Coordinates"}:
                 continue
 
-            data[field] = self._get_field_text(soup, span_id)
+            data[field] = fields[field]
 
         return data
\ No newline at end of file
@@ -0,0 +1,139 @@
+# =======================
+# well_scraper/writer.py
+# =======================
+import logging
+import queue
+import threading
+import time
+from . import metrics
+from .constants import ScrapeOutcome
+from .database import WellDatabase
+
+
+class BatchWriter:
+    """
+    Single writer thread that drains a queue of WellRecords and scrape
+    outcomes into a WellDatabase.
+
+    Records are written with WellDatabase.insert_many in transactions of at
+    most ``batch_size`` items, or whatever has arrived within ``flush_interval``
+    seconds of the first pending item, whichever comes first. Every record
+    also marks its API as successfully fetched in the same transaction.
+    Scraper workers only ever call put() and put_outcome(), so the database
+    connection is used by exactly one thread.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db, batch_size=500, flush_interval=1.0, max_queue=10000,
+                 on_written=None, on_error=None):
+        """
+        Initialize the BatchWriter.
+
+        Args:
+            db (WellDatabase): Database to write to.
+            batch_size (int): Maximum records per transaction.
+            flush_interval (float): Maximum seconds a record waits before being written.
+            max_queue (int): Queue capacity; put() blocks when full.
+            on_written (callable): Called with the list of records after each commit.
+            on_error (callable): Called with (records, exception) when a batch fails.
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_written = on_written
+        self.on_error = on_error
+
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.thread = None
+        self.batches_written = 0
+        self.records_written = 0
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """
+        Start the writer thread.
+        """
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="BatchWriter", daemon=True)
+            self.thread.start()
+
+    def put(self, record, fetched_at=None):
+        """
+        Queue a record for writing, blocking while the queue is full.
+        """
+        fetched_at = fetched_at or WellDatabase.utc_now()
+        self.queue.put((record, (record.API, ScrapeOutcome.OK, fetched_at, None)))
+
+    def put_outcome(self, api, outcome, error=None, fetched_at=None):
+        """
+        Queue a scrape outcome that has no record, e.g. a missing well or a failure.
+        """
+        fetched_at = fetched_at or WellDatabase.utc_now()
+        self.queue.put((None, (api, outcome, fetched_at, error)))
+
+    def close(self):
+        """
+        Flush everything still queued and stop the writer thread.
+        """
+        if self.thread is None:
+            return
+        self.queue.put(self._STOP)
+        self.thread.join()
+        self.thread = None
+        self.logger.info(f"Writer stopped after {self.records_written} records in {self.batches_written} batches")
+
+    def _run(self):
+        batch = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                self._flush(batch)
+                return
+
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+                deadline = None
+
+    def _flush(self, batch):
+        if not batch:
+            return
+
+        records = [record for record, _ in batch if record is not None]
+        outcomes = [outcome for _, outcome in batch]
+
+        try:
+            with metrics.DB_WRITE_SECONDS.time():
+                self.db.insert_many(records, outcomes)
+        except Exception as e:
+            self.logger.exception(f"Failed to write batch of {len(batch)} items: {e}")
+            if self.on_error:
+                self.on_error(records, e)
+            return
+
+        self.batches_written += 1
+        self.records_written += len(records)
+        metrics.DB_ROWS_WRITTEN.inc(len(records))
+        if self.on_written:
+            self.on_written(records)